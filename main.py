@@ -34,6 +34,7 @@ if SRC_DIR not in sys.path:
 
 import time
 import threading
+from concurrent.futures import CancelledError, Future
 import tkinter as tk
 from dotenv import load_dotenv
 load_dotenv()
@@ -41,16 +42,23 @@ load_dotenv()
 # --- Local imports ---
 from src.intent_router import IntentRouter
 from src.wake.pvporcupine import WakeWordListener
-from src.stt.leopard_recognizer import LeopardRecognizer
+from src.stt.pool import leopard_pool
+from src.stt.model_manager import model_manager
+from src.audio.capture import AudioCaptureService
+from src.audio import earcon
 
 from src.settings import load_settings
 from src.nlp_entities import extract_app_name
-from src.tts.tts_local import speak_now, stop_all_tts
+from src.tts.tts_local import speak_now
+from src.tts.worker import tts_worker, PRIORITY_ALERT, PRIORITY_ANSWER, PRIORITY_SUMMARY
 from src.ai.planner import plan, synthesize_answer
 
 # --- Voice authentication (SVM-based) ---
 from src.voice_auth.recorder import record_seconds
 from src.voice_auth.svm_auth import verify_svm
+from src.voice_auth.model_cache import speaker_models
+from src.voice_auth.passive import PassiveVerifier
+from src.voice_auth.enrollment import SpeakerAdapter
 from src.voice_auth.enroll_ui import run_enrollment
 
 GLOBAL_TOOL_MAP = {}
@@ -75,6 +83,15 @@ def main():
     settings = load_settings()
     assistant_name = "AURIS"
 
+    # Start loading the STT model now so it is resident by the first wake word;
+    # voice_session waits on it if not. voice_session always transcribes with
+    # the Leopard pool, so that is what gets preloaded whatever STT_ENGINE says.
+    def _log_stt_load(fut):
+        if fut.exception() is None:
+            log_event("stt_trial", "stt_model_load", model_manager.load_ms, "ms")
+
+    model_manager.start("leopard").add_done_callback(_log_stt_load)
+
     # --- Speaker verification model ---
     VOICE_MODEL_PATH = os.getenv("VOICE_MODEL_PATH", "voice_auth_svm.joblib").strip()
     AUTH_DEVICE_INDEX = int(os.getenv("AUTH_DEVICE_INDEX", "0"))
@@ -102,6 +119,13 @@ def main():
         )
         print("[Setup] Enrollment finished, model saved.")
         time.sleep(1.0)
+
+    # Load the speaker model now (cached; reloaded only if the file changes)
+    def _preload_speaker_model():
+        if speaker_models.preload(VOICE_MODEL_PATH) is not None:
+            log_event("auth_trial", "speaker_model_load", speaker_models.load_ms, "ms")
+
+    threading.Thread(target=_preload_speaker_model, daemon=True, name="auth-preload").start()
         
     # 2. Ollama Graphical Setup
     if not os.getenv("OLLAMA_MODEL"):
@@ -123,6 +147,8 @@ def main():
     typing_busy_evt = threading.Event() # Logic lock for typed commands
     active_rec = {"obj": None}
     wake_holder = {"obj": None}
+    wake_time = {"t": None}  # wall-clock time of the last wake word (wake-to-ready latency)
+    wake_audio = {"pcm": None}  # wake rolling buffer; seeds the STT noise profile
 
     # Voice authentication gate — text commands only allowed after voice auth is granted
     voice_auth_granted = threading.Event()
@@ -150,6 +176,10 @@ def main():
             pass
 
     def resume_mic():
+        # While the assistant is talking the mic stays paused (it would hear
+        # itself); _speech_end() resumes it once the utterance is over.
+        if tts_worker.speaking:
+            return
         try:
             r = active_rec.get("obj")
             if r:
@@ -162,23 +192,49 @@ def main():
         except Exception:
             pass
 
-    def say(text: str):
+    # Speech goes through the single TTS thread (src/tts/worker.py); the mic
+    # is paused and the UI shows "speaking" only while text is actually spoken.
+    def _speech_start():
+        pause_mic()
+        ui.set_speaking(True)
+
+    def _speech_end():
+        ui.set_speaking(False)
+        resume_mic()
+        if tts_worker.phrases is not None:
+            log_event("tts_trial", "phrase_cache_hit_rate", tts_worker.phrases.hit_rate * 100, "percent")
+
+    def _wait_speech_idle():
+        """Wait until nothing is spoken or queued (or the session is stopped)."""
+        while not tts_worker.wait_idle(0.1):
+            if force_stop_evt.is_set() or shutdown_evt.is_set():
+                return
+
+    def _wait_speech(fut):
+        try:
+            fut.result()
+        except CancelledError:
+            pass  # dropped by cancel_all() / superseded
+        except Exception as e:
+            print("[TTS] speak failed:", e)
+
+    def say(text: str, priority=PRIORITY_ANSWER, key=None, wait=True):
+        """
+        Speak `text`. wait=False returns at once (status lines, announcements
+        made before an action) with the completion future; `key` coalesces
+        queued lines of the same kind.
+        """
         if shutdown_evt.is_set():
-            return
+            return None
         text = (text or "").strip()
         if not text:
-            return
+            return None
 
-        pause_mic()
         ui.append(text, is_torque=True)
-        ui.set_speaking(True)
-        try:
-            speak_now(text)
-        except Exception as e:
-            print("[TTS] speak_now failed:", e)
-        finally:
-            ui.set_speaking(False)
-            resume_mic()
+        fut = tts_worker.say(text, priority=priority, key=key, on_start=_speech_start, on_end=_speech_end)
+        if wait:
+            _wait_speech(fut)
+        return fut
 
     # Tools that return long lists — show in UI but only SPEAK a short summary
     DISPLAY_ONLY_TOOLS = {
@@ -205,7 +261,6 @@ def main():
         spoken    = (spoken or "").strip()
         if not full_text:
             return
-        pause_mic()
 
         # Post each line as its own bubble with a tiny stagger so they appear in order
         lines = [ln for ln in full_text.split("\n") if ln.strip()]
@@ -214,21 +269,15 @@ def main():
             root.after(delay_ms, lambda l=line: ui.append(l.strip(), is_torque=True))
 
         # Speak only the short summary (after all bubbles scheduled)
-        ui.set_speaking(True)
-        try:
-            if spoken:
-                speak_now(spoken)
-        except Exception as e:
-            print("[TTS] speak_now failed:", e)
-        finally:
-            ui.set_speaking(False)
-            resume_mic()
+        if spoken:
+            _wait_speech(tts_worker.say(spoken, priority=PRIORITY_SUMMARY,
+                                        on_start=_speech_start, on_end=_speech_end))
 
     # central sleep helper (used for both typed and spoken stop-words)
     def enter_sleep():
         try:
-             # Stop TTS for silence
-            stop_all_tts()
+             # Stop TTS for silence (queued speech too)
+            tts_worker.cancel_all()
         except: pass
 
         try:
@@ -250,9 +299,9 @@ def main():
         except Exception:
             pass
 
-        # restart wake listener so wake word can wake assistant
+        # resume wake listener so wake word can wake assistant
         try:
-            start_wake_listener()
+            resume_wake_listener()
         except Exception:
             pass
 
@@ -288,7 +337,7 @@ def main():
                 
                 # Intent-based explicit web search (bypasses planner)
                 if label == "web_search":
-                    say("Let me look that up online...")
+                    say("Let me look that up online...", key="status", wait=False)
                     query = t.replace("search for","").replace("web search","").replace("google","").replace("look up","").replace("find online","").strip()
                     
                     if len(conversation_history) > 0:
@@ -362,7 +411,7 @@ def main():
                         if tool in ["open_app", "close_app"]:
                             app = args.get("name") or extract_app_name(t)
                             if app:
-                                say(f"Opening {app}." if tool == "open_app" else f"Closing {app}.")
+                                say(f"Opening {app}." if tool == "open_app" else f"Closing {app}.", wait=False)
                                 fn(app)
                                 return
                                 
@@ -371,7 +420,7 @@ def main():
                             match = re.search(r"connect.*?(\d+)", t)
                             if match:
                                 idx=int(match.group(1))
-                                say(f"Connecting to device {idx}.")
+                                say(f"Connecting to device {idx}.", wait=False)
                                 say(str(fn(idx)))
                             else:
                                 if tool == "connect_bluetooth":
@@ -399,7 +448,7 @@ def main():
                         if tool in FILE_TEXT_TOOLS:
                             # For long operations, announce upfront
                             if tool in ("organize_folder", "find_duplicates"):
-                                say("Sure, working on it…")
+                                say("Sure, working on it…", key="status", wait=False)
                             reply = fn(t)
                             if reply:
                                 if tool in DISPLAY_ONLY_TOOLS:
@@ -414,7 +463,7 @@ def main():
 
                         # --- HYBRID WEB SEARCH ---
                         if tool == "web_search" or tool == "weather":
-                            say("Let me check that for you...")
+                            say("Let me check that for you...", key="status", wait=False)
                             raw_results = fn(param)
                             final_answer = synthesize_answer(t, raw_results)
                             say(final_answer)
@@ -435,7 +484,7 @@ def main():
                 # Planner failed or returned None. If it looks like a question, try direct web search.
                 if looks_like_qa:
                     print("[Handler] Planner failed but it's a question. Forcing web search fallback.")
-                    say("Let me look that up online...")
+                    say("Let me look that up online...", key="status", wait=False)
                     raw_results = search_web(t)
                     final_answer = synthesize_answer(t, raw_results, fast_mode=True)
                     say(final_answer)
@@ -446,7 +495,7 @@ def main():
 
         except Exception as e:
             print("[Handler] ERROR:", e)
-            say("Something went wrong handling that request.")
+            say("Something went wrong handling that request.", priority=PRIORITY_ALERT)
     def handle_text(text: str):
         # Gate: only allow text commands after voice authentication is granted
         if not voice_auth_granted.is_set():
@@ -481,7 +530,7 @@ def main():
             pass
 
         try:
-            stop_all_tts()
+            tts_worker.cancel_all()
         except Exception:
             pass
 
@@ -496,14 +545,38 @@ def main():
     root.after(100, lambda: root.attributes('-topmost', False))
     ui.set_status("Ready — listening for wake word: 'torque' (Leopard STT)")
     ui.set_listening(True)
+    # Blocking: the wake listener starts below and must not hear "torque" here.
     say("Ready and listening for torque. Using Leopard offline STT.")
 
+    # Fixed replies are rendered once (cached under TTS_PHRASE_CACHE_DIR) and
+    # then played as PCM; rendering waits behind anything being said.
+    tts_worker.warm_phrases([
+        "Access granted.", "Access denied.",
+        "Let me look that up online...", "Let me check that for you...", "Sure, working on it…",
+        "Something went wrong handling that request.", "I'm not sure about that.", "I see. (Offline mode)",
+        "Say a number after 'connect'.", "Which network number to connect to?", "Done.",
+        *(t for t in DISPLAY_ONLY_TOOLS.values() if t),
+    ])
+
     # Wake word listener config
     access_key   = os.getenv("PORCUPINE_ACCESS_KEY", "").strip()
     keyword_path = os.getenv("PORCUPINE_KEYWORD_PATH", "").strip()
     device_index_env = os.getenv("PORCUPINE_DEVICE_INDEX", "").strip()
     device_index = int(device_index_env) if device_index_env.isdigit() else None
 
+    # One capture thread owns the mic; wake, auth, STT and the level meter read
+    # from its ring buffer with their own cursors (AUDIO_SHARED_CAPTURE=0 restores
+    # per-component streams).
+    capture = None
+    if os.getenv("AUDIO_SHARED_CAPTURE", "1").strip() != "0":
+        try:
+            capture = AudioCaptureService(sample_rate=16000, device=device_index)
+            capture.start()
+            capture.start_level_meter(ui.update_mic_level)
+        except Exception as e:
+            print("[Capture] Shared capture unavailable, using per-component streams:", e)
+            capture = None
+
     def start_wake_listener():
         # Ensure previous listener is stopped
         try:
@@ -524,7 +597,9 @@ def main():
                 on_detect=on_wake,
                 keyword_path=keyword_path,
                 device_index=device_index,
-                on_level=lambda lvl: root.after(0, lambda: ui.update_mic_level(lvl)),
+                on_level=None if capture else ui.update_mic_level,
+                capture=capture,
+                on_ready=lambda ms: log_event("wake_trial", "wake_ready_latency", ms, "ms"),
             )
             wake_holder["obj"] = w
             w.start()
@@ -533,6 +608,21 @@ def main():
             print("[WAKE] start failed:", e)
             ui.append("Wake listener failed to start.", is_system=True)
 
+    def pause_wake_listener():
+        """Suspend detection; Porcupine and its stream stay alive for resume."""
+        w = wake_holder.get("obj")
+        if w:
+            try: w.pause()
+            except Exception: pass
+
+    def resume_wake_listener():
+        w = wake_holder.get("obj")
+        if w is not None and w.alive():
+            w.resume()
+            print("[WAKE] Listener resumed.")
+        else:
+            start_wake_listener()
+
     def _wake_watchdog():
         """Periodically checks if the wake listener is alive; restarts if it died."""
         while not shutdown_evt.is_set():
@@ -543,8 +633,8 @@ def main():
             if active_rec.get("obj") is not None:
                 continue
             w = wake_holder.get("obj")
-            if w is None:
-                continue  # intentionally stopped (e.g. during on_wake)
+            if w is None or w.paused:
+                continue  # intentionally stopped/paused (e.g. during on_wake)
             thread = getattr(w, "_thread", None)
             if thread is not None and not thread.is_alive():
                 print("[WAKE] Watchdog: listener thread died — restarting.")
@@ -553,22 +643,63 @@ def main():
     threading.Thread(target=_wake_watchdog, daemon=True, name="wake-watchdog").start()
 
     # Voice session
-    def voice_session():
+    def voice_session(auth=None):
+        """
+        auth: Future of (ok, score, thr) when the session was started
+        speculatively, before speaker verification finished (None = already
+        authenticated). Commands are only executed once it resolves to ok.
+        """
         force_stop_evt.clear()
-        # stop wake listener while in voice session
-        w = wake_holder.get("obj")
-        if w:
-            try: w.stop()
-            except: pass
-            wake_holder["obj"] = None
+        # pause wake listener while in voice session
+        pause_wake_listener()
+        command_wake_t = wake_time["t"]  # wake-to-first-command latency
+        denied = None
+
+        def listening_status():
+            if auth is not None and not auth.done():
+                return "Listening… (verifying speaker)"
+            return "Listening… say 'sleep' to stop."
 
         root.after(0, lambda: (
-            ui.set_status("Listening… say 'sleep' to stop."), ui.set_listening(True)
+            ui.set_status(listening_status()), ui.set_listening(True)
         ))
 
-        # create Leopard recognizer (reads PICOVOICE_LEOPARD_KEY from env)
-        rec = LeopardRecognizer(on_level=ui.update_mic_level, device_index=device_index)
+        # first session after startup: wait for the background model load
+        if not model_manager.ready.is_set():
+            root.after(0, lambda: ui.set_status("Loading speech model…"))
+            t_wait = time.time()
+            model_manager.wait()
+            log_event("stt_trial", "stt_model_wait", (time.time() - t_wait) * 1000, "ms")
+            root.after(0, lambda: ui.set_status(listening_status()))
+
+        # A speculative session reads the shared capture from the wake-word
+        # position, so a command spoken straight after the wake word is kept.
+        # (Sequential sessions start after "Access granted." and read from now.)
+        stt_pos = None
+        if capture is not None and auth is not None:
+            stt_pos = getattr(wake_holder.get("obj"), "detect_pos", None)
+
+        # take the resident Leopard recognizer (reads PICOVOICE_LEOPARD_KEY from env);
+        # only the mic stream is opened here, the engine stays loaded between sessions
+        rec = leopard_pool.acquire(
+            on_level=None if capture else ui.update_mic_level,
+            device_index=device_index,
+            stream=capture.subscribe("stt", start_pos=stt_pos) if capture else None,
+        )
         active_rec["obj"] = rec
+        if passive_verifier is not None:
+            rec.on_utterance = passive_verifier.submit
+
+        if wake_audio["pcm"] is not None:
+            try: rec.prime_noise(wake_audio["pcm"])
+            except Exception as e: print("[STT] Noise priming failed:", e)
+            wake_audio["pcm"] = None
+
+        if wake_time["t"] is not None:
+            ready_latency = (time.time() - wake_time["t"]) * 1000
+            wake_time["t"] = None
+            log_event("wake_trial", "wake_to_ready_latency", ready_latency, "ms")
+            print("[MEASURE] Wake-to-ready latency (ms):", ready_latency)
 
         STOP_WORDS = ("sleep","stop listening","hide window","goodbye","bye","quit","exit")
 
@@ -576,6 +707,15 @@ def main():
             while True:
                 if force_stop_evt.is_set() or shutdown_evt.is_set():
                     break
+                if auth is not None and auth.done() and not auth.result()[0]:
+                    denied = auth.result()[1]
+                    break
+
+                # Announcements queued with wait=False ("Opening …") may still be
+                # playing: listen only once the assistant has finished talking.
+                if tts_worker.busy:
+                    _wait_speech_idle()
+                    resume_mic()
 
                 pipeline_start = time.time()
                 text = rec.listen_once()
@@ -613,28 +753,128 @@ def main():
                     # The finally block will handle cleanup and restart wake listener.
                     break
 
+                # Speculative session: nothing runs until the speaker is verified
+                # (normally already decided by the time the command has been spoken)
+                if auth is not None:
+                    ok, score, _thr = auth.result()
+                    if not ok:
+                        denied = score
+                        break
+                    auth = None
+
+                if command_wake_t is not None:
+                    first_cmd_latency = (time.time() - command_wake_t) * 1000
+                    command_wake_t = None
+                    log_event("wake_trial", "wake_to_first_command_latency", first_cmd_latency, "ms")
+                    print("[MEASURE] Wake-to-first-command latency (ms):", first_cmd_latency)
+
                 try:
                     handle_text(text)
                 finally:
                     resume_mic()
 
         finally:
-            try: rec.close()
+            rec.on_utterance = None
+            if passive_verifier is not None:
+                passive_verifier.end()
+            try: leopard_pool.release(rec)
             except: pass
             active_rec["obj"] = None
 
-            # Revoke voice auth when session ends — text form locked again
-            voice_auth_granted.clear()
-            root.after(0, lambda: ui.set_text_input_locked(True, "Voice session ended — say 'Hey Torque' to re-authenticate."))
+            if denied is not None:
+                root.after(0, lambda: ui.set_caption(""))
+                deny_access(denied)
+            else:
+                # Revoke voice auth when session ends — text form locked again
+                voice_auth_granted.clear()
+                root.after(0, lambda: ui.set_text_input_locked(True, "Voice session ended — say 'Hey Torque' to re-authenticate."))
 
             root.after(0, lambda: (
                 ui.set_listening(False),
                 ui.set_status("Ready — listening for wake word: 'torque'"),
                 ui.set_caption("")
             ))
-            # restart wake listener after voice session ends (unless shutdown)
+            # resume wake listener after voice session ends (unless shutdown)
             if not shutdown_evt.is_set():
-                start_wake_listener()
+                resume_wake_listener()
+
+    AUTH_THRESHOLD = float(os.getenv("AUTH_VERIFY_THRESHOLD", "0.60"))
+    # Speculative mode: start STT right after the wake word and verify the
+    # speaker in parallel; commands run only once verification has passed.
+    # AUTH_SPECULATIVE_STT=0 restores verify -> "Access granted." -> listen.
+    SPECULATIVE_STT = os.getenv("AUTH_SPECULATIVE_STT", "1").strip() != "0"
+
+    def verify_speaker(sample):
+        t0 = time.time()
+        ok, score, thr = verify_svm(sample, VOICE_MODEL_PATH, threshold=AUTH_THRESHOLD)
+        t1 = time.time()
+
+        auth_latency = (t1 - t0) * 1000
+        log_event("auth_trial", "authentication_latency", auth_latency, "ms")
+        log_event("auth_trial", "auth_score", score, "prob")
+        print("[MEASURE] SVM verification time:", auth_latency)
+        print(f"[Auth] score={score:.3f} thr={thr:.3f} ok={ok}")
+        return ok, score, thr
+
+    def on_trust_revoked(trust):
+        """PassiveVerifier: the session's utterances stopped matching the enrolled voice."""
+        voice_auth_granted.clear()
+        log_event("auth_trial", "passive_revoke", trust, "prob")
+        ui.append(f"Speaker no longer verified (trust={trust:.2f}). Session locked.", is_system=True)
+        force_stop_evt.set()
+        pause_mic()  # unblock listen_once; the voice loop exits on force_stop_evt
+
+    def _log_passive_score(conf, trust, ms):
+        log_event("auth_trial", "passive_trust", trust, "prob")
+        log_event("auth_trial", "passive_verify_latency", ms, "ms")
+
+    # Re-verify every utterance STT already captured (AUTH_PASSIVE_VERIFY=0 disables);
+    # confidently verified ones also adapt the model (AUTH_ADAPT=0 disables)
+    passive_verifier = None
+    if os.getenv("AUTH_PASSIVE_VERIFY", "1").strip() != "0":
+        adapter = SpeakerAdapter(VOICE_MODEL_PATH) if os.getenv("AUTH_ADAPT", "1").strip() != "0" else None
+        passive_verifier = PassiveVerifier(
+            VOICE_MODEL_PATH, on_revoke=on_trust_revoked, on_score=_log_passive_score, adapter=adapter,
+        ).start()
+
+    def grant_access(score, spoken=True):
+        ui.append(f"Access granted (score={score:.2f}).", is_system=True)
+        if passive_verifier is not None:
+            passive_verifier.begin(score)
+        if spoken:
+            say("Access granted.", priority=PRIORITY_ALERT)
+        # Grant voice auth — unlock text form too
+        voice_auth_granted.set()
+        root.after(0, lambda: ui.set_text_input_locked(False))
+
+    def deny_access(score):
+        ui.append(f"Access denied (score={score:.2f}).", is_system=True)
+        say("Access denied.", priority=PRIORITY_ALERT)
+        voice_auth_granted.clear()
+        root.after(0, lambda: ui.set_text_input_locked(True, "Access denied — say 'Hey Torque' to try again."))
+
+    def start_speculative_session(sample):
+        """Listen now; verify on a side thread. voice_session gates commands on `auth`."""
+        auth = Future()
+
+        def _run_auth():
+            try:
+                smp = sample if sample is not None else record_seconds(2.0, device_index=AUTH_DEVICE_INDEX, capture=capture)
+                ok, score, thr = verify_speaker(smp)
+            except Exception as e:
+                print("[Auth] Verification failed:", e)
+                ok, score, thr = False, 0.0, AUTH_THRESHOLD
+            if ok:
+                # UI cue only: a sound now would land in the command being recorded
+                grant_access(score, spoken=False)
+                root.after(0, lambda: ui.set_status("Listening… say 'sleep' to stop."))
+            auth.set_result((ok, score, thr))
+            if not ok:
+                pause_mic()  # unblock listen_once; the session sees the denial and ends
+
+        threading.Thread(target=_run_auth, daemon=True, name="auth-verify").start()
+        earcon.play("listening")
+        threading.Thread(target=voice_session, kwargs={"auth": auth}, daemon=True).start()
 
     # Wake handler
     def on_wake(audio_data=None):
@@ -642,49 +882,38 @@ def main():
         print("[MEASURE] on_wake() started at:", time.time())
         if shutdown_evt.is_set():
             return
+        wake_time["t"] = time.time()
 
-        w = wake_holder.get("obj")
-        if w:
-            try: w.stop()
-            except: pass
-            wake_holder["obj"] = None
+        pause_wake_listener()
+        log_event("wake_trial", "wake_trigger", 1, "event")
 
         if audio_data is not None:
             # Seamless rolling buffer used
+            wake_audio["pcm"] = audio_data
+
+        # Without the wake buffer, verification records from the mic itself,
+        # which only works alongside STT when both read the shared capture.
+        if SPECULATIVE_STT and (audio_data is not None or capture is not None):
+            ui.set_status("Listening… (verifying speaker)")
+            start_speculative_session(audio_data)
+            return
+
+        if audio_data is not None:
             ui.set_status("Verifying speaker (Seamless)")
             sample = audio_data
         else:
             # Legacy fallback
             ui.set_status("Verifying speaker…")
-            sample = record_seconds(2.0, device_index=AUTH_DEVICE_INDEX)
-
-        t0 = time.time()
-        ok, score, thr = verify_svm(sample, VOICE_MODEL_PATH, threshold=float(os.getenv("AUTH_VERIFY_THRESHOLD", "0.60")))
-        t1 = time.time()
-
-        auth_latency = (t1 - t0) * 1000
-        log_event("auth_trial", "authentication_latency", auth_latency, "ms")
-        log_event("auth_trial", "auth_score", score, "prob")
-        log_event("wake_trial", "wake_trigger", 1, "event")
-        print("[MEASURE] SVM verification time:", auth_latency)
-        print(f"[Auth] score={score:.3f} thr={thr:.3f} ok={ok}")
-        print("[MEASURE] SVM verification time:", t1 - t0)
+            sample = record_seconds(2.0, device_index=AUTH_DEVICE_INDEX, capture=capture)
 
-        print(f"[Auth] score={score:.3f} thr={thr:.3f} ok={ok}")
+        ok, score, thr = verify_speaker(sample)
 
         if ok:
-            ui.append(f"Access granted (score={score:.2f}).", is_system=True)
-            say("Access granted.")
-            # Grant voice auth — unlock text form too
-            voice_auth_granted.set()
-            root.after(0, lambda: ui.set_text_input_locked(False))
+            grant_access(score)
             threading.Thread(target=voice_session, daemon=True).start()
         else:
-            ui.append(f"Access denied (score={score:.2f}).", is_system=True)
-            say("Access denied.")
-            voice_auth_granted.clear()
-            root.after(0, lambda: ui.set_text_input_locked(True, "Access denied — say 'Hey Torque' to try again."))
-            start_wake_listener()
+            deny_access(score)
+            resume_wake_listener()
         
 
 
@@ -700,6 +929,10 @@ def main():
             if w: w.stop()
         except: pass
 
+        try:
+            if capture: capture.stop()
+        except: pass
+
         # try:
         #     r = active_rec.get("obj")
         #     if r: r.close()
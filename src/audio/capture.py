@@ -0,0 +1,210 @@
+# src/audio/capture.py
+"""
+One microphone, many consumers.
+
+AudioCaptureService owns the only sd.InputStream. Its PortAudio callback
+writes every block into a shared Int16Ring; wake detection, speaker
+verification, STT and the level meter each subscribe() and get an
+AudioReader with their own read cursor. Handing the mic from one component
+to the next is a cursor move instead of closing one device and opening
+another, so nothing is lost in between and there is no stream-open latency.
+
+AudioReader mimics the parts of sd.InputStream the recognizers use
+(read/start/stop/close/active), so it can be passed anywhere a stream is.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from .level import level_from_mean_abs, mean_abs
+from .ring import Int16Ring
+
+
+class AudioReader:
+    """A consumer's view of the shared ring with its own cursor."""
+
+    def __init__(self, service: "AudioCaptureService", pos: int, name: str = ""):
+        self._service = service
+        self.pos = pos
+        self.name = name
+        self.active = True
+        self.closed = False
+        self._pinned = False  # cursor set by seek(): the next start() keeps it
+
+    # --- sd.InputStream-compatible API ---
+    def read(self, frames: int, timeout: Optional[float] = 2.0):
+        """
+        Block until `frames` new samples are available.
+        Returns (int16 array shaped (frames, 1), overflowed).
+        """
+        svc = self._service
+        ring = svc.ring
+        need = int(frames)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with svc._cond:
+            while self.active and not self.closed and svc.running and ring.write_pos - self.pos < need:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"[Capture] No audio for {timeout}s (reader '{self.name}')")
+                svc._cond.wait(remaining)
+
+        if not self.active or self.closed:
+            raise RuntimeError("Stream is stopped")
+        if not svc.running and ring.write_pos - self.pos < need:
+            raise RuntimeError("Stream is stopped (capture service ended)")
+
+        overflowed = False
+        if self.pos < ring.oldest_pos():
+            # fell behind by more than the ring holds: skip to the oldest valid audio
+            self.pos = ring.write_pos - need
+            overflowed = True
+
+        out = np.empty((need, 1), dtype=np.int16)
+        start = self.pos
+        self.pos = ring.copy_out(start, out[:, 0])
+        if start < ring.oldest_pos():
+            overflowed = True  # the writer lapped us mid-copy
+        return out, overflowed
+
+    def start(self):
+        """
+        Resume: audio produced while stopped is skipped, like a real stream,
+        unless the cursor was placed with seek() (e.g. subscribe(start_pos=...)),
+        in which case the first start() reads from there.
+        """
+        if self.closed:
+            return
+        if not self._pinned:
+            self.pos = self._service.ring.write_pos
+        self._pinned = False
+        self.active = True
+
+    def stop(self):
+        self.active = False
+        self._service._notify()
+
+    def close(self):
+        self.active = False
+        self.closed = True
+        self._service._unsubscribe(self)
+
+    # context-manager use mirrors `with sd.InputStream(...) as stream:`
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- extras beyond sd.InputStream ---
+    def seek(self, pos: int):
+        """Move the cursor (e.g. back to the wake-word position)."""
+        self.pos = max(self._service.ring.oldest_pos(), min(int(pos), self._service.ring.write_pos))
+        self._pinned = True
+
+
+class AudioCaptureService:
+    """
+    Owns the microphone. Start it once at process start; components subscribe.
+    """
+
+    def __init__(self, sample_rate=16000, device=None, blocksize=512, buffer_seconds=10.0):
+        self.sample_rate = int(sample_rate)
+        self.device = device
+        self.blocksize = int(blocksize)
+        self.ring = Int16Ring(int(buffer_seconds * self.sample_rate))
+        self.running = False
+        self.overflows = 0
+
+        self._stream = None
+        self._cond = threading.Condition()
+        self._readers = []
+        self._meter_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------
+    def start(self):
+        if self.running:
+            return
+        import sounddevice as sd
+
+        self._stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='int16',
+            blocksize=self.blocksize,
+            device=self.device,
+            callback=self._callback,
+        )
+        self.running = True
+        self._stream.start()
+        print("[Capture] Shared microphone stream started.")
+
+    def stop(self):
+        self.running = False
+        try:
+            if self._stream:
+                self._stream.stop()
+                self._stream.close()
+        except Exception:
+            pass
+        self._stream = None
+        self._notify()
+
+    def _callback(self, indata, frames, time_info, status):
+        # PortAudio thread: copy into the ring, publish, wake readers
+        if status and status.input_overflow:
+            self.overflows += 1
+        self.ring.write(indata[:, 0])
+        self._notify()
+
+    def _notify(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------
+    def subscribe(self, name: str = "", start_pos: Optional[int] = None) -> AudioReader:
+        """New consumer. By default it starts at 'now'; pass start_pos to rewind."""
+        reader = AudioReader(self, self.ring.write_pos, name)
+        if start_pos is not None:
+            reader.seek(start_pos)
+        with self._cond:
+            self._readers.append(reader)
+        return reader
+
+    def _unsubscribe(self, reader: AudioReader):
+        with self._cond:
+            if reader in self._readers:
+                self._readers.remove(reader)
+            self._cond.notify_all()
+
+    @property
+    def position(self) -> int:
+        return self.ring.write_pos
+
+    # ------------------------------------------------------------
+    def start_level_meter(self, on_level: Callable[[int], None]):
+        """Single mic-level consumer for the UI, independent of who else is listening."""
+        if self._meter_thread and self._meter_thread.is_alive():
+            return
+
+        def _run():
+            reader = self.subscribe("meter")
+            scratch = np.empty(self.blocksize, dtype=np.float32)
+            try:
+                while self.running:
+                    try:
+                        data, _ = reader.read(self.blocksize)
+                    except (RuntimeError, TimeoutError):
+                        if not self.running:
+                            break
+                        continue
+                    amp = mean_abs(data[:, 0], scratch)
+                    try: on_level(level_from_mean_abs(amp))
+                    except Exception: pass
+            finally:
+                reader.close()
+
+        self._meter_thread = threading.Thread(target=_run, daemon=True, name="mic-meter")
+        self._meter_thread.start()
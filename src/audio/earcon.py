@@ -0,0 +1,48 @@
+# src/audio/earcon.py
+"""
+Short non-blocking audio cues (earcons).
+
+Tones are synthesized once and played with sounddevice's background
+playback, so the caller never waits for them (unlike speak_now()).
+Kept short and quiet: they may be picked up by the mic while STT listens.
+"""
+import os
+
+import numpy as np
+
+SR = 22050
+
+# name -> [(frequency Hz, duration s), ...]
+_TONES = {
+    "listening": [(880, 0.07)],
+}
+
+_cache = {}
+
+
+def _render(name: str, volume=0.2) -> np.ndarray:
+    parts = []
+    for freq, dur in _TONES[name]:
+        t = np.arange(int(SR * dur)) / SR
+        tone = np.sin(2 * np.pi * freq * t) * np.hanning(len(t))
+        parts.append((volume * tone).astype(np.float32))
+    return np.concatenate(parts)
+
+
+def enabled() -> bool:
+    return os.getenv("AUTH_EARCON", "1").strip() != "0"
+
+
+def play(name: str):
+    """Start playing an earcon and return immediately. Never raises."""
+    if not enabled():
+        return
+    try:
+        import sounddevice as sd
+
+        pcm = _cache.get(name)
+        if pcm is None:
+            pcm = _cache[name] = _render(name)
+        sd.play(pcm, SR, blocking=False)
+    except Exception as e:
+        print(f"[Earcon] {name} failed:", e)
@@ -0,0 +1,122 @@
+# src/audio/file_source.py
+"""
+File-backed stand-in for the microphone.
+
+FileAudioSource replays a WAV/FLAC file (or an int16 array) through the same
+read/start/stop/close API as sd.InputStream, so any recognizer, the wake
+listener or a benchmark can run headless on recorded audio. as_pyaudio()
+gives the bytes-returning PyAudio flavour used by the faster-whisper,
+whisper.cpp and Vosk recognizers.
+
+After the recording ends it feeds `tail_silence_s` of zeros (so endpointers
+can fire) and then raises like a stopped stream.
+"""
+import time
+
+import numpy as np
+
+
+class FileAudioSource:
+    def __init__(self, audio, sample_rate=16000, realtime=False, tail_silence_s=2.0):
+        if isinstance(audio, np.ndarray):
+            pcm = audio
+        else:
+            import soundfile as sf
+            pcm, sr = sf.read(str(audio), dtype="int16")
+            if sr != sample_rate:
+                raise ValueError(f"{audio}: expected {sample_rate} Hz audio, got {sr} Hz")
+        if pcm.ndim > 1:
+            pcm = pcm[:, 0]
+        self.pcm = np.ascontiguousarray(pcm, dtype=np.int16)
+        self.sample_rate = int(sample_rate)
+        self.realtime = realtime
+        self.tail_samples = int(tail_silence_s * self.sample_rate)
+
+        self.pos = 0
+        self.active = False
+        self.last_read_t = 0.0
+        self._t0 = None
+        self._marks = []  # (end_pos, perf_counter) per read
+
+    @property
+    def duration_s(self) -> float:
+        return len(self.pcm) / float(self.sample_rate)
+
+    def rewind(self):
+        self.pos = 0
+        self._t0 = None
+        self._marks = []
+
+    # --- sd.InputStream-compatible API ---
+    def read(self, frames):
+        n = int(frames)
+        if self.pos >= len(self.pcm) + self.tail_samples:
+            raise RuntimeError("Stream is stopped (end of file)")
+
+        out = np.zeros((n, 1), dtype=np.int16)
+        avail = self.pcm[self.pos:self.pos + n]
+        out[:len(avail), 0] = avail
+        self.pos += n
+
+        if self.realtime:
+            # pace reads like a live mic: block until this audio "has been spoken"
+            if self._t0 is None:
+                self._t0 = time.perf_counter()
+            wait = self._t0 + self.pos / self.sample_rate - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+        self.last_read_t = time.perf_counter()
+        self._marks.append((self.pos, self.last_read_t))
+        return out, False
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- timing helpers for benchmarks ---
+    def delivered_at(self, sample_pos: int):
+        """perf_counter() time at which sample `sample_pos` was handed to the reader."""
+        for end_pos, t in self._marks:
+            if end_pos >= sample_pos:
+                return t
+        return None
+
+    def as_pyaudio(self) -> "_PyAudioView":
+        return _PyAudioView(self)
+
+
+class _PyAudioView:
+    """PyAudio-stream flavour of a FileAudioSource (read() returns bytes)."""
+
+    def __init__(self, src: FileAudioSource):
+        self.src = src
+        src.start()
+
+    def read(self, frames, exception_on_overflow=False):
+        data, _ = self.src.read(frames)
+        return data.tobytes()
+
+    def is_active(self):
+        return self.src.active
+
+    def start_stream(self):
+        self.src.start()
+
+    def stop_stream(self):
+        self.src.stop()
+
+    def close(self):
+        self.src.close()
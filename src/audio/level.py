@@ -0,0 +1,20 @@
+# src/audio/level.py
+"""
+Per-frame energy shared by the wake listener, the capture level meter and
+the recognizers: one pass over the int16 frame into a caller-owned float32
+scratch buffer, no per-frame buffer allocations.
+"""
+import numpy as np
+
+
+def mean_abs(frame_int16: np.ndarray, scratch: np.ndarray) -> float:
+    """Mean absolute int16 amplitude; `scratch` is float32 with len >= len(frame)."""
+    out = scratch[:len(frame_int16)]
+    out[:] = frame_int16        # plain cast copy: no ufunc casting buffer
+    np.abs(out, out=out)
+    return float(out.mean())
+
+
+def level_from_mean_abs(amp_int: float) -> int:
+    """Mean abs int16 amplitude -> mic level (0–100), boosted for UI."""
+    return int(min(1.0, (amp_int / 32768.0) * 3.0) * 100)
@@ -0,0 +1,75 @@
+# src/audio/ring.py
+"""
+Single-writer, multi-reader int16 ring buffer.
+
+The writer copies a block in and then publishes it by advancing `write_pos`
+(a monotonically increasing sample count). Readers never lock: each one owns
+an absolute cursor and copies out whatever lies between its cursor and
+`write_pos`. A reader that falls more than `capacity` samples behind has been
+overwritten and is moved forward (an overrun, reported to the caller).
+"""
+import numpy as np
+
+
+class Int16Ring:
+    def __init__(self, capacity: int):
+        self.capacity = int(capacity)
+        self.buf = np.zeros(self.capacity, dtype=np.int16)
+        self.write_pos = 0  # total samples ever written
+
+    def write(self, block: np.ndarray):
+        block = block.reshape(-1)
+        n = len(block)
+        if n >= self.capacity:
+            block, n = block[-self.capacity:], self.capacity
+        start = self.write_pos % self.capacity
+        first = min(n, self.capacity - start)
+        self.buf[start:start + first] = block[:first]
+        if first < n:
+            self.buf[:n - first] = block[first:]
+        # publish only after the data is in place
+        self.write_pos += n
+
+    def clear(self):
+        """Forget everything written (single-owner rings only: reader cursors aren't moved)."""
+        self.write_pos = 0
+
+    def oldest_pos(self) -> int:
+        return max(0, self.write_pos - self.capacity)
+
+    def copy_out(self, pos: int, out: np.ndarray) -> int:
+        """
+        Copy len(out) samples starting at absolute position `pos` into `out`.
+        The caller guarantees they are written and not yet overwritten.
+        Returns the position after the copied samples.
+        """
+        n = len(out)
+        start = pos % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self.buf[start:start + first]
+        if first < n:
+            out[first:] = self.buf[:n - first]
+        return pos + n
+
+    def segments(self, n: int):
+        """
+        The most recent n samples (fewer if not yet written) as two views in
+        time order; the second is empty unless the range wraps. No copy, so
+        only valid until the writer overwrites them.
+        """
+        n = min(n, self.write_pos, self.capacity)
+        start = (self.write_pos - n) % self.capacity
+        first = min(n, self.capacity - start)
+        return self.buf[start:start + first], self.buf[:n - first]
+
+    def snapshot(self, n: int) -> np.ndarray:
+        """Most recent n samples in order: a view when contiguous, else one copy."""
+        a, b = self.segments(n)
+        return a if not len(b) else np.concatenate((a, b))
+
+    def latest(self, n: int) -> np.ndarray:
+        """Ordered copy of the most recent n samples (fewer if not yet written)."""
+        n = min(n, self.write_pos, self.capacity)
+        out = np.empty(n, dtype=np.int16)
+        self.copy_out(self.write_pos - n, out)
+        return out
@@ -0,0 +1,170 @@
+# src/bench/auth_bench.py
+"""
+Speaker-verification accuracy and latency suite (headless, files only).
+
+Layout of the data directory (16 kHz WAVs, any length):
+    data_dir/enrolled/*.wav     the enrolled speaker; the first --enroll-count
+                                files (sorted) train the model, the rest are
+                                genuine trials
+    data_dir/impostor/**/*.wav  other speakers (subdirectories allowed)
+
+Every recording is cut into --window-s trials (the wake-time sample length).
+For each backend (svm_auth.BACKENDS, or --backends), the model is trained
+with enroll_svm() and every trial is scored the way verify_svm() does.
+Reported per backend:
+
+  * EER and the confidence threshold where FAR == FRR
+  * FAR / FRR at AUTH_VERIFY_THRESHOLD (--threshold)
+  * the lowest threshold with FAR <= --target-far, and the FRR it costs
+  * model size (.joblib, .npz) and scoring units
+  * cold load time (.joblib via joblib, .npz via np.load)
+  * per-verification latency: verify_svm() end to end and scoring only
+
+--json writes the same numbers for tracking across runs.
+
+Usage:
+    python -m src.bench.auth_bench data_dir [--enroll-count 5] [--threshold 0.6] [--json out.json]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from dotenv import load_dotenv
+from joblib import load
+
+from src.bench.speaker_model_bench import confidence, eer
+from src.voice_auth.model_cache import CompactGMM, load_npz, npz_path_for, speaker_models
+from src.voice_auth.svm_auth import BACKENDS, SR, enroll_svm, extract_mfcc_features, verify_svm
+
+
+def _trials(paths, window_s):
+    """(audio, MFCC frames) for each window_s chunk of every file."""
+    n = int(window_s * SR)
+    out = []
+    for p in paths:
+        y, sr = sf.read(p)
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        if sr != SR:
+            raise SystemExit(f"{p}: expected {SR} Hz, got {sr}")
+        for i in range(0, max(1, len(y) - n + 1), n):
+            chunk = y[i:i + n]
+            feats = extract_mfcc_features(chunk, SR)
+            if len(feats):
+                out.append((chunk, feats))
+    return out
+
+
+def _median_ms(fn, runs):
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return float(np.median(out))
+
+
+def threshold_for_far(genuine, impostor, target_far):
+    """Lowest confidence threshold with FAR <= target_far, and its FRR."""
+    genuine, impostor = np.asarray(genuine), np.asarray(impostor)
+    for t in np.unique(np.concatenate([genuine, impostor, [1.0]])):
+        if np.mean(impostor >= t) <= target_far:
+            return float(t), float(np.mean(genuine < t))
+    return 1.0, float(np.mean(genuine < 1.0))
+
+
+def evaluate(backend, enroll_wavs, genuine, impostor, threshold, target_far, runs, tmp):
+    path = os.path.join(tmp, f"{backend}.joblib")
+    t0 = time.perf_counter()
+    enroll_svm(enroll_wavs, path, backend=backend)
+    train_ms = (time.perf_counter() - t0) * 1000
+    model = speaker_models.get(path)
+
+    g = np.array([confidence(model, f) for _, f in genuine])
+    i = np.array([confidence(model, f) for _, f in impostor])
+    rate, eer_t = eer(g, i)
+    far_t, far_t_frr = threshold_for_far(g, i, target_far)
+
+    sample_audio, sample_feats = genuine[0]
+    npz = npz_path_for(path)
+    return {
+        "backend": backend,
+        "eer": rate,
+        "eer_threshold": eer_t,
+        "threshold": threshold,
+        "far": float(np.mean(i >= threshold)),
+        "frr": float(np.mean(g < threshold)),
+        "target_far": target_far,
+        "target_far_threshold": far_t,
+        "target_far_frr": far_t_frr,
+        "joblib_kib": os.path.getsize(path) / 1024,
+        "npz_kib": os.path.getsize(npz) / 1024,
+        "units": (f"{len(model.means)} components" if isinstance(model, CompactGMM)
+                  else f"{len(model.support_vectors)} support vectors"),
+        "train_ms": train_ms,
+        "load_joblib_ms": _median_ms(lambda: load(path), 5),
+        "load_npz_ms": _median_ms(lambda: load_npz(npz), 5),
+        "verify_ms": _median_ms(lambda: verify_svm(sample_audio, path, threshold), runs),
+        "score_ms": _median_ms(lambda: model.decision_function(sample_feats), runs),
+    }
+
+
+def _report(r):
+    print(f"[{r['backend']}]")
+    print(f"  EER                    {r['eer'] * 100:5.1f} %   at confidence {r['eer_threshold']:.2f}")
+    print(f"  FAR / FRR @ {r['threshold']:.2f}        {r['far'] * 100:5.1f} % / {r['frr'] * 100:5.1f} %")
+    print(f"  FAR <= {r['target_far'] * 100:g} %             threshold {r['target_far_threshold']:.2f}, "
+          f"FRR {r['target_far_frr'] * 100:5.1f} %")
+    print(f"  model                  {r['joblib_kib']:.0f} KiB joblib, {r['npz_kib']:.0f} KiB npz, {r['units']}")
+    print(f"  load                   joblib {r['load_joblib_ms']:.2f} ms   npz {r['load_npz_ms']:.2f} ms")
+    print(f"  verify                 {r['verify_ms']:.2f} ms end to end   {r['score_ms']:.3f} ms scoring")
+    print(f"  train                  {r['train_ms']:.0f} ms\n")
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("data_dir", type=Path)
+    ap.add_argument("--enroll-count", type=int, default=int(os.getenv("AUTH_ENROLL_SAMPLES", "5")))
+    ap.add_argument("--window-s", type=float, default=2.0)
+    ap.add_argument("--backends", default=",".join(BACKENDS))
+    ap.add_argument("--threshold", type=float, default=float(os.getenv("AUTH_VERIFY_THRESHOLD", "0.60")))
+    ap.add_argument("--target-far", type=float, default=0.01)
+    ap.add_argument("--runs", type=int, default=50)
+    ap.add_argument("--json", type=Path, default=None)
+    args = ap.parse_args()
+
+    enrolled = sorted((args.data_dir / "enrolled").glob("*.wav"))
+    impostor_wavs = sorted((args.data_dir / "impostor").rglob("*.wav"))
+    enroll_wavs = [p.as_posix() for p in enrolled[:args.enroll_count]]
+    genuine = _trials(enrolled[args.enroll_count:], args.window_s)
+    impostor = _trials(impostor_wavs, args.window_s)
+    if not enroll_wavs or not genuine or not impostor:
+        raise SystemExit("Need > --enroll-count WAVs in enrolled/ and at least one in impostor/.")
+    print(f"enroll {len(enroll_wavs)} files, {len(genuine)} genuine / {len(impostor)} impostor trials "
+          f"of {args.window_s:.1f} s\n")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in args.backends.split(","):
+            r = evaluate(backend.strip(), enroll_wavs, genuine, impostor,
+                         args.threshold, args.target_far, args.runs, tmp)
+            _report(r)
+            results.append(r)
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "data_dir": str(args.data_dir), "window_s": args.window_s,
+            "genuine_trials": len(genuine), "impostor_trials": len(impostor),
+            "results": results,
+        }, indent=2), encoding="utf-8")
+        print(f"results -> {args.json}")
+
+
+if __name__ == "__main__":
+    main()
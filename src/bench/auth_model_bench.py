@@ -0,0 +1,72 @@
+# src/bench/auth_model_bench.py
+"""
+Speaker model load time and verify latency: joblib-per-call vs cached .npz.
+
+Uses an enrolled model (VOICE_MODEL_PATH) and a WAV to verify (default: 2s
+of noise, which only exercises timing). Reports cold load time of each format
+and per-call verify latency for the old path (joblib.load + sklearn
+decision_function every call) and the cached compact model, plus the max
+score difference between them.
+
+Usage:
+    python -m src.bench.auth_model_bench [sample.wav] [--runs 50]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import soundfile as sf
+from dotenv import load_dotenv
+from joblib import load
+
+from src.voice_auth.model_cache import load_npz, npz_path_for, speaker_models
+from src.voice_auth.svm_auth import SR, extract_mfcc_features
+
+
+def _ms(fn, runs):
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return float(np.median(out))
+
+
+def _sklearn_scores(model, feats):
+    """The compact model's score computed with sklearn (same scale and calibration)."""
+    if hasattr(model, "means_"):  # GaussianMixture: calibrated log-likelihood
+        offset, scale = getattr(model, "score_calibration_", (0.0, 1.0))
+        return (model.score_samples(feats) - offset) / scale
+    if hasattr(model, "reduced_set_"):  # reduced-set SVM: its expansion, not the full one
+        from sklearn.metrics.pairwise import rbf_kernel
+        centres, weights = model.reduced_set_
+        return rbf_kernel(feats, centres, gamma=model._gamma) @ weights + model.intercept_[0]
+    return model.decision_function(feats)
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav", nargs="?")
+    ap.add_argument("--model", default=os.getenv("VOICE_MODEL_PATH", "voice_auth_svm.joblib"))
+    ap.add_argument("--runs", type=int, default=50)
+    args = ap.parse_args()
+
+    y = sf.read(args.wav)[0] if args.wav else np.random.default_rng(0).normal(0, 0.05, 2 * SR)
+    speaker_models.get(args.model)  # make sure the .npz exists
+    npz = npz_path_for(args.model)
+
+    print(f"model: {args.model} ({os.path.getsize(args.model) / 1024:.0f} KiB joblib, "
+          f"{os.path.getsize(npz) / 1024:.0f} KiB npz)")
+    print(f"  load  joblib {_ms(lambda: load(args.model), 5):8.2f} ms   npz {_ms(lambda: load_npz(npz), 5):8.2f} ms")
+
+    feats = extract_mfcc_features(y, SR, voiced_only=speaker_models.get(args.model).voiced_only)
+    old = lambda: _sklearn_scores(load(args.model), feats)
+    new = lambda: speaker_models.get(args.model).decision_function(feats)
+    print(f"  verify (excl. MFCC)  before {_ms(old, args.runs):8.2f} ms   after {_ms(new, args.runs):8.2f} ms")
+    print(f"  max |score diff|     {float(np.max(np.abs(old() - new()))):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# src/bench/denoise_bench.py
+"""
+A/B benchmark for the streaming noise suppressor in the Leopard capture path.
+
+Each labeled recording (<name>.wav + <name>.txt, 16 kHz mono) is optionally
+mixed with a noise recording at a target SNR, then transcribed by
+LeopardRecognizer twice: denoise off (A) and on (B). Both share one engine.
+Like a real session, the noise profile / VAD floor is primed from audio just
+before the utterance (the first --prime-s of the file, standing in for the
+wake buffer).
+
+Reports WER for A and B, the denoiser's CPU cost per 30ms frame (and as a
+fraction of real time), and post-speech prep latency (last frame read ->
+engine.process() entered).
+
+Usage:
+    python -m src.bench.denoise_bench path/to/wavs --noise fan.wav --snr 5
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+
+from src.audio.file_source import FileAudioSource
+from src.bench.leopard_capture import _TimedEngine
+from src.bench.metrics import wer
+from src.stt.denoise import StreamingDenoiser
+from src.stt.leopard_recognizer import LeopardRecognizer, create_leopard_engine
+
+
+def _mix(clean: np.ndarray, noise: np.ndarray, snr_db: float) -> np.ndarray:
+    reps = int(np.ceil(len(clean) / max(1, len(noise))))
+    n = np.tile(noise, reps)[:len(clean)].astype(np.float32)
+    c = clean.astype(np.float32)
+    pc, pn = np.mean(c * c), np.mean(n * n) + 1e-9
+    y = c + n * np.sqrt(pc / (pn * 10 ** (snr_db / 10.0)))
+    return np.clip(y, -32768, 32767).astype(np.int16)
+
+
+def _cpu_cost(pcms, hop=480):
+    """Denoiser process() CPU time per frame (µs) over all recordings."""
+    d = StreamingDenoiser(hop_samples=hop)
+    frames, t0 = 0, time.process_time()
+    for pcm in pcms:
+        d.reset()
+        for i in range(0, len(pcm) - hop + 1, hop):
+            d.process(pcm[i:i + hop], update_noise=False)
+            frames += 1
+    return (time.process_time() - t0) / max(1, frames) * 1e6
+
+
+def _transcribe_all(pcms, engine, denoise, prime_s, sr=16000):
+    hyps, post_ms = [], []
+    rec = None
+    for pcm in pcms:
+        src = FileAudioSource(pcm)
+        if rec is None:
+            rec = LeopardRecognizer(stream=src, engine=engine, denoise=denoise)
+        else:
+            rec.close_stream()
+            rec.open_stream(src)
+        rec.prime_noise(pcm[:int(prime_s * sr)])
+        hyps.append(rec.listen_once())
+        post_ms.append((engine.enter_t - src.last_read_t) * 1000)
+    if rec is not None:
+        rec.close()
+    return hyps, post_ms
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", type=Path)
+    ap.add_argument("--noise", type=Path, help="noise recording to mix in (default: use files as-is)")
+    ap.add_argument("--snr", type=float, default=5.0, help="mix SNR in dB")
+    ap.add_argument("--prime-s", type=float, default=0.3, help="leading audio used to prime the noise profile")
+    args = ap.parse_args()
+
+    import soundfile as sf
+    items = [(w, w.with_suffix(".txt").read_text(encoding="utf-8").strip())
+             for w in sorted(args.wav_dir.glob("*.wav")) if w.with_suffix(".txt").exists()]
+    if not items:
+        raise SystemExit("No labeled WAVs found (need <name>.wav + <name>.txt).")
+
+    noise = sf.read(str(args.noise), dtype="int16")[0] if args.noise else None
+    if noise is not None and noise.ndim > 1:
+        noise = noise[:, 0]
+    pcms = []
+    for wav, _ref in items:
+        pcm = sf.read(str(wav), dtype="int16")[0]
+        pcm = pcm[:, 0] if pcm.ndim > 1 else pcm
+        pcms.append(_mix(pcm, noise, args.snr) if noise is not None else pcm)
+    refs = [ref for _w, ref in items]
+
+    engine = _TimedEngine(create_leopard_engine())
+    try:
+        hyps_a, post_a = _transcribe_all(pcms, engine, False, args.prime_s)
+        hyps_b, post_b = _transcribe_all(pcms, engine, True, args.prime_s)
+    finally:
+        engine.delete()
+
+    us = _cpu_cost(pcms)
+    cond = f"noise={args.noise.name} @ {args.snr:g} dB" if args.noise else "as recorded"
+    print(f"\n{len(items)} utterances, {cond}")
+    print(f"  A (no denoise)  WER {wer(refs, hyps_a):6.3f}   post-speech prep {np.median(post_a):6.2f} ms")
+    print(f"  B (denoise)     WER {wer(refs, hyps_b):6.3f}   post-speech prep {np.median(post_b):6.2f} ms")
+    print(f"  denoiser CPU: {us:.1f} µs / 30ms frame ({us / 30000 * 100:.2f}% of real time)")
+
+
+if __name__ == "__main__":
+    main()
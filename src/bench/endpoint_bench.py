@@ -0,0 +1,110 @@
+# src/bench/endpoint_bench.py
+"""
+End-of-speech tail latency on recorded sessions: fixed vs adaptive endpointing.
+
+Uses the same labeled WAVs as vad_bench (16 kHz mono + <name>.json with
+{"speech": [[start_s, end_s], ...]}, one entry per utterance, internal pauses
+included). Audio is replayed in Leopard-sized 30ms frames through the adaptive
+VAD; its decisions drive either a fixed trailing-silence timeout (the old
+silence_ms=250 behaviour) or AdaptiveEndpointer. For every labeled utterance:
+
+  * tail latency   detected end - labeled end (p50/p90/p99), split into short
+                   (< --short-s) and long utterances
+  * cut-offs       utterances endpointed before their labeled end (a
+                   mid-utterance pause taken as the end)
+
+Completeness hooks need live partial transcripts and are not exercised here.
+
+Usage:
+    python -m src.bench.endpoint_bench path/to/sessions [--fixed-ms 250]
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from src.bench.vad_bench import FRAME, SR, _load
+from src.stt.endpoint import AdaptiveEndpointer
+from src.stt.vad import AdaptiveVAD
+
+
+class _FixedEndpointer:
+    def __init__(self, silence_ms):
+        self.frames = max(1, int(silence_ms / 30))
+        self.reset()
+
+    def reset(self):
+        self.silence = 0
+
+    def update(self, is_speech):
+        self.silence = 0 if is_speech else self.silence + 1
+        return self.silence >= self.frames
+
+
+def _segments(decisions, endpointer):
+    out, start = [], None
+    for i, d in enumerate(decisions):
+        if start is None:
+            if not d:
+                continue
+            start = i
+            endpointer.reset()
+        if endpointer.update(d):
+            out.append((start * FRAME / SR, (i + 1) * FRAME / SR))
+            start = None
+    if start is not None:
+        out.append((start * FRAME / SR, len(decisions) * FRAME / SR))
+    return out
+
+
+def evaluate(wav_dir: Path, fixed_ms=250, short_s=1.5):
+    results = {}
+    variants = (
+        ("fixed", lambda: _FixedEndpointer(fixed_ms)),
+        ("adaptive", lambda: AdaptiveEndpointer(chunk_ms=30)),  # LeopardRecognizer defaults
+    )
+    for name, make in variants:
+        tails = {"short": [], "long": []}
+        cutoffs = total = 0
+        for wav in sorted(wav_dir.glob("*.wav")):
+            y, labels = _load(wav)
+            if not labels:
+                continue
+            vad = AdaptiveVAD(SR, FRAME)
+            n = len(y) // FRAME
+            decisions = [vad.update(y[i * FRAME:(i + 1) * FRAME]) for i in range(n)]
+            segs = _segments(decisions, make())  # one endpointer per session (pause stats carry over)
+            for ls, le in labels:
+                total += 1
+                # the detected utterance that started inside this label
+                seg = next(((s, e) for s, e in segs if ls - 0.25 <= s <= le), None)
+                if seg is None:
+                    continue
+                if seg[1] < le - 0.05:
+                    cutoffs += 1
+                    continue
+                tails["short" if le - ls < short_s else "long"].append((seg[1] - le) * 1000)
+
+        row = {"utterances": total, "cutoffs": cutoffs}
+        for kind, vals in tails.items():
+            for p in (50, 90, 99):
+                row[f"{kind}_tail_ms_p{p}"] = float(np.percentile(vals, p)) if vals else None
+        results[name] = row
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", type=Path)
+    ap.add_argument("--fixed-ms", type=int, default=250)
+    ap.add_argument("--short-s", type=float, default=1.5, help="utterances shorter than this count as short")
+    args = ap.parse_args()
+
+    for name, r in evaluate(args.wav_dir, args.fixed_ms, args.short_s).items():
+        print(f"[{name}]")
+        for k, v in r.items():
+            print(f"  {k:<22} {v if v is None or isinstance(v, int) else round(v, 1)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# src/bench/enroll_bench.py
+"""
+Enrollment time-to-model and adaptation retrain cost.
+
+Enrollment: simulates recording N samples (each "recording" sleeps for the
+sample length) and measures the wait after the last sample until the model
+is saved, for the old path (write WAVs, enroll_svm re-reads and extracts
+serially, then trains) and EnrollmentSession (features extracted while the
+next sample records, so only training remains).
+
+Adaptation: offers M more utterances to a SpeakerAdapter and prints the
+retrain time as the reservoir fills; it levels off at --max-clips.
+
+Samples come from a WAV directory (cycled) or synthetic audio.
+
+Usage:
+    python -m src.bench.enroll_bench [wav_dir] [--samples 10] [--seconds 2.0] [--adapt 40]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from src.voice_auth.enrollment import EnrollmentSession, SpeakerAdapter
+from src.voice_auth.svm_auth import SR, enroll_svm
+
+
+def _samples(wav_dir, n, seconds):
+    if wav_dir:
+        wavs = sorted(Path(wav_dir).glob("*.wav"))
+        return [sf.read(wavs[i % len(wavs)])[0][:int(seconds * SR)] for i in range(n)]
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SR)) / SR
+    return [0.2 * sum(np.sin(2 * np.pi * 130 * k * t + rng.uniform(0, 6)) / k for k in range(1, 15))
+            + rng.normal(0, 0.01, len(t)) for _ in range(n)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", nargs="?")
+    ap.add_argument("--samples", type=int, default=10)
+    ap.add_argument("--seconds", type=float, default=2.0)
+    ap.add_argument("--adapt", type=int, default=40)
+    ap.add_argument("--max-clips", type=int, default=20)
+    ap.add_argument("--backend", default=None)
+    args = ap.parse_args()
+
+    samples = _samples(args.wav_dir, args.samples + args.adapt, args.seconds)
+    enroll, extra = samples[:args.samples], samples[args.samples:]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # before: WAVs on disk, serial extraction after the last recording
+        paths = []
+        for i, y in enumerate(enroll):
+            time.sleep(args.seconds)
+            p = os.path.join(tmp, f"enroll_{i + 1}.wav")
+            sf.write(p, y, SR)
+            paths.append(p)
+        t0 = time.perf_counter()
+        enroll_svm(paths, os.path.join(tmp, "old.joblib"), backend=args.backend)
+        old_ms = (time.perf_counter() - t0) * 1000
+
+        # after: in-memory, extraction overlapped with recording
+        session = EnrollmentSession()
+        for y in enroll:
+            time.sleep(args.seconds)
+            session.add(y)
+        model_path = os.path.join(tmp, "new.joblib")
+        t0 = time.perf_counter()
+        session.finish(model_path, backend=args.backend)
+        new_ms = (time.perf_counter() - t0) * 1000
+
+        print(f"\n[Enroll] {args.samples} x {args.seconds:.1f} s samples, wait after last sample:")
+        print(f"  WAV files + serial extraction  {old_ms:8.1f} ms")
+        print(f"  in-memory, overlapped          {new_ms:8.1f} ms")
+
+        adapter = SpeakerAdapter(model_path, min_confidence=0.0, max_clips=args.max_clips, retrain_every=1)
+        print(f"\n[Adapt] retrain time as clips are offered (cap {args.max_clips}):")
+        for i, y in enumerate(extra, 1):
+            adapter.offer(y, 1.0)
+            adapter.wait()
+            if i % 5 == 0 and adapter.retrain_ms is not None:
+                print(f"  after {i:3d} offers  {adapter.retrain_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# src/bench/leopard_capture.py
+"""
+Leopard capture-path benchmark: per-utterance allocations and post-speech latency.
+
+Replays one utterance (a 16 kHz mono WAV, or a synthetic burst) through
+LeopardRecognizer via an in-memory stream, comparing the preallocated
+capture path against the previous list/concatenate/tolist path.
+
+Usage:
+    python -m src.bench.leopard_capture [utterance.wav] [--runs 20]
+
+Needs PICOVOICE_LEOPARD_KEY (the real engine is used for both paths).
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from dotenv import load_dotenv
+
+from src.audio.file_source import FileAudioSource
+from src.stt.leopard_recognizer import LeopardRecognizer
+
+
+class _TimedEngine:
+    """Wraps the real engine to timestamp when process() is entered."""
+
+    def __init__(self, engine):
+        self._engine = engine
+        self.enter_t = 0.0
+
+    def process(self, pcm):
+        self.enter_t = time.perf_counter()
+        return self._engine.process(pcm)
+
+    def delete(self):
+        self._engine.delete()
+
+
+def _legacy_listen_once(rec: LeopardRecognizer, start_threshold=4, silence_threshold=3) -> str:
+    """The pre-ring-buffer capture path, kept here as the 'before' baseline."""
+    speaking, silence_count, frames, buf = False, 0, 0, []
+    while frames < rec.max_frames:
+        data, _ = rec._stream.read(rec.frame_samples)
+        frame = data.flatten()
+        frames += 1
+        f = frame.astype(np.float32) / 32768.0
+        _level = int(min(1.0, float(np.mean(np.abs(f))) * 3.0) * 100)
+        amp_int = np.mean(np.abs(frame.astype(np.float32)))
+        if not speaking:
+            if amp_int >= start_threshold:
+                speaking = True
+                buf.append(frame)
+        else:
+            buf.append(frame)
+            if amp_int < silence_threshold:
+                silence_count += 1
+                if silence_count >= rec.silence_frames_to_stop and frames >= rec.min_frames:
+                    break
+            else:
+                silence_count = 0
+    if not buf:
+        return ""
+    pcm = np.concatenate(buf).astype(np.float32)
+    max_val = np.max(np.abs(pcm))
+    if max_val > 0:
+        pcm = pcm / max_val
+    pcm_int16 = (pcm * 32767).astype(np.int16)
+    pcm_int16 = np.concatenate([np.zeros(1600, dtype=np.int16), pcm_int16])
+    transcript, _ = rec.engine.process(pcm_int16.tolist())
+    return transcript.strip()
+
+
+def _synthetic_utterance(sr=16000) -> np.ndarray:
+    """0.3s quiet, 1.5s voiced-like burst, 0.6s quiet."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(1.5 * sr)) / sr
+    voiced = 3000 * np.sin(2 * np.pi * 180 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    quiet = lambda s: rng.normal(0, 1.0, int(s * sr))
+    y = np.concatenate([quiet(0.3), voiced + rng.normal(0, 200, len(t)), quiet(0.6)])
+    return np.clip(y, -32768, 32767).astype(np.int16)
+
+
+def _run(label, fn, rec, stream, engine, runs):
+    peaks, post_ms = [], []
+    for _ in range(runs):
+        stream.rewind()
+        tracemalloc.start()
+        fn()
+        _cur, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+
+        # post-speech latency = last audio frame read -> engine.process() entered
+        stream.rewind()
+        fn()
+        post_ms.append((engine.enter_t - stream.last_read_t) * 1000)
+
+    print(f"{label:<8} alloc peak/utt: {np.median(peaks) / 1024:8.1f} KiB   "
+          f"post-speech prep: {np.median(post_ms):6.2f} ms (median of {runs})")
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav", nargs="?", help="16 kHz mono utterance (default: synthetic)")
+    ap.add_argument("--runs", type=int, default=20)
+    args = ap.parse_args()
+
+    pcm = args.wav if args.wav else _synthetic_utterance()
+    stream = FileAudioSource(pcm)
+    rec = LeopardRecognizer(stream=stream)
+    engine = _TimedEngine(rec.engine)
+    rec.engine = engine
+
+    try:
+        _run("before", lambda: _legacy_listen_once(rec), rec, stream, engine, args.runs)
+        _run("after", rec.listen_once, rec, stream, engine, args.runs)
+    finally:
+        rec.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# src/bench/metrics.py
+"""Shared scoring helpers for the STT/wake/auth benchmarks."""
+import re
+
+_NORM_RE = re.compile(r"[^a-z0-9' ]+")
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(_NORM_RE.sub(" ", (text or "").lower()).split())
+
+
+def word_errors(ref: str, hyp: str):
+    """(edit distance in words, reference word count) after normalization."""
+    r, h = normalize_text(ref).split(), normalize_text(hyp).split()
+    prev = list(range(len(h) + 1))
+    for i, rw in enumerate(r, 1):
+        cur = [i] + [0] * len(h)
+        for j, hw in enumerate(h, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (rw != hw))
+        prev = cur
+    return prev[-1], len(r)
+
+
+def wer(refs, hyps) -> float:
+    """Corpus word error rate over paired lists of strings."""
+    errs = words = 0
+    for ref, hyp in zip(refs, hyps):
+        e, n = word_errors(ref, hyp)
+        errs, words = errs + e, words + n
+    return errs / max(1, words)
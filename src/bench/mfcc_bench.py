@@ -0,0 +1,104 @@
+# src/bench/mfcc_bench.py
+"""
+Auth MFCC front-end: extraction time, feature parity and verify accuracy.
+
+Extraction: python_speech_features.mfcc() (the old path) against the NumPy
+front-end on all frames and on voiced frames only, for one WAV (default: a
+synthetic 2.5 s wake pre-roll, ~0.8 s of voiced signal in silence and
+noise). Reports median ms per call, frames kept, and the max absolute
+difference from python_speech_features on the full frame set.
+
+Accuracy (optional, same directory layout as speaker_model_bench): enrolls
+and scores with all frames vs voiced frames only and prints EER and
+FRR/FAR at AUTH_VERIFY_THRESHOLD for each.
+
+Usage:
+    python -m src.bench.mfcc_bench [sample.wav] [--runs 200]
+    python -m src.bench.mfcc_bench --dirs enroll_dir genuine_dir impostor_dir [--backend svm]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from dotenv import load_dotenv
+from python_speech_features import mfcc
+
+from src.bench.speaker_model_bench import _windows, confidence, eer
+from src.voice_auth import svm_auth
+from src.voice_auth.features import front_end
+from src.voice_auth.model_cache import speaker_models
+from src.voice_auth.svm_auth import N_MFCC, SR, enroll_svm
+
+
+def _preroll():
+    rng = np.random.default_rng(0)
+    y = rng.normal(0, 0.002, int(2.5 * SR))
+    t = np.arange(int(0.8 * SR)) / SR
+    voiced = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 20))
+    y[int(1.2 * SR):int(2.0 * SR)] += 0.2 * voiced * np.hanning(len(t))
+    return y
+
+
+def _ms(fn, runs):
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return float(np.median(out))
+
+
+def extraction(y, runs):
+    fe = front_end(SR, N_MFCC, 512)
+    ref = mfcc(y, SR, numcep=N_MFCC, nfft=512)
+    full = fe.mfcc(y)
+    voiced = fe.mfcc(y, voiced_only=True)
+    print(f"signal {len(y) / SR:.2f} s, {len(ref)} frames")
+    print(f"  python_speech_features  {_ms(lambda: mfcc(y, SR, numcep=N_MFCC, nfft=512), runs):7.3f} ms  {len(ref):4d} frames")
+    print(f"  numpy, all frames       {_ms(lambda: fe.mfcc(y), runs):7.3f} ms  {len(full):4d} frames")
+    print(f"  numpy, voiced only      {_ms(lambda: fe.mfcc(y, voiced_only=True), runs):7.3f} ms  {len(voiced):4d} frames")
+    print(f"  max |diff| vs reference {float(np.max(np.abs(ref - full))):.2e}")
+
+
+def accuracy(enroll_dir, genuine_dir, impostor_dir, backend, threshold, window_s=2.0):
+    enroll_wavs = [p.as_posix() for p in sorted(enroll_dir.glob("*.wav"))]
+    with tempfile.TemporaryDirectory() as tmp:
+        for voiced in (False, True):
+            svm_auth.VOICED_ONLY = voiced  # enrollment and scoring use the same selection
+            path = os.path.join(tmp, f"{backend}_{int(voiced)}.joblib")
+            enroll_svm(enroll_wavs, path, backend=backend)
+            model = speaker_models.get(path)
+            g = [confidence(model, f) for f in _windows(genuine_dir, window_s)]
+            i = [confidence(model, f) for f in _windows(impostor_dir, window_s)]
+            rate, _ = eer(g, i)
+            frr = float(np.mean(np.array(g) < threshold))
+            far = float(np.mean(np.array(i) >= threshold))
+            print(f"  {'voiced only' if voiced else 'all frames ':<11}  EER {rate * 100:5.1f} %   "
+                  f"FRR / FAR @ {threshold:.2f}  {frr * 100:5.1f} % / {far * 100:5.1f} %")
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav", nargs="?")
+    ap.add_argument("--runs", type=int, default=200)
+    ap.add_argument("--dirs", nargs=3, type=Path, metavar=("ENROLL", "GENUINE", "IMPOSTOR"))
+    ap.add_argument("--backend", default=os.getenv("AUTH_MODEL_BACKEND", "svm"))
+    ap.add_argument("--threshold", type=float, default=float(os.getenv("AUTH_VERIFY_THRESHOLD", "0.60")))
+    args = ap.parse_args()
+
+    y = sf.read(args.wav)[0] if args.wav else _preroll()
+    if y.ndim > 1:
+        y = y.mean(axis=1)
+    extraction(y, args.runs)
+    if args.dirs:
+        print(f"\n[{args.backend}]")
+        accuracy(*args.dirs, args.backend, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
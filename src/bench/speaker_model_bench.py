@@ -0,0 +1,112 @@
+# src/bench/speaker_model_bench.py
+"""
+Speaker model backends: equal error rate and verification latency.
+
+Enrolls every backend in svm_auth.BACKENDS from the same WAVs, then scores
+held-out genuine and impostor WAVs (16 kHz mono, cut into --window-s chunks
+like the 2 s wake-time recording) with the cached compact model, exactly as
+verify_svm() does. Reports per backend:
+
+  * EER              equal error rate over the window scores
+  * FRR @ threshold  genuine windows rejected at AUTH_VERIFY_THRESHOLD
+  * FAR @ threshold  impostor windows accepted at AUTH_VERIFY_THRESHOLD
+  * model size       .npz bytes and scoring units (support vectors / components)
+  * verify ms        median decision_function time per window (excl. MFCC)
+
+Usage:
+    python -m src.bench.speaker_model_bench enroll_dir genuine_dir impostor_dir [--window-s 2.0]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from dotenv import load_dotenv
+
+from src.voice_auth.model_cache import CompactGMM, npz_path_for, speaker_models
+from src.voice_auth.svm_auth import BACKENDS, SR, enroll_svm, extract_mfcc_features
+
+
+def _windows(wav_dir: Path, window_s: float):
+    """MFCC frames of each window_s chunk of every WAV in wav_dir."""
+    n = int(window_s * SR)
+    out = []
+    for wav in sorted(wav_dir.glob("*.wav")):
+        y = sf.read(wav)[0]
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        for i in range(0, max(1, len(y) - n + 1), n):
+            feats = extract_mfcc_features(y[i:i + n], SR)
+            if len(feats):
+                out.append(feats)
+    return out
+
+
+def confidence(model, feats) -> float:
+    """verify_svm()'s confidence for one window."""
+    return float(1.0 / (1.0 + np.exp(-float(np.mean(model.decision_function(feats))) * 2.0)))
+
+
+def eer(genuine, impostor):
+    """Equal error rate and the confidence threshold where FAR and FRR meet."""
+    genuine, impostor = np.asarray(genuine), np.asarray(impostor)
+    ts = np.unique(np.concatenate([genuine, impostor]))
+    frr = np.array([np.mean(genuine < t) for t in ts])
+    far = np.array([np.mean(impostor >= t) for t in ts])
+    k = int(np.argmin(np.abs(far - frr)))
+    return float((far[k] + frr[k]) / 2), float(ts[k])
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("enroll_dir", type=Path)
+    ap.add_argument("genuine_dir", type=Path)
+    ap.add_argument("impostor_dir", type=Path)
+    ap.add_argument("--window-s", type=float, default=2.0)
+    ap.add_argument("--backends", default=",".join(BACKENDS))
+    ap.add_argument("--threshold", type=float, default=float(os.getenv("AUTH_VERIFY_THRESHOLD", "0.60")))
+    args = ap.parse_args()
+
+    enroll_wavs = [p.as_posix() for p in sorted(args.enroll_dir.glob("*.wav"))]
+    genuine = _windows(args.genuine_dir, args.window_s)
+    impostor = _windows(args.impostor_dir, args.window_s)
+    if not enroll_wavs or not genuine or not impostor:
+        raise SystemExit("Need WAVs in all three directories.")
+    print(f"enroll {len(enroll_wavs)} WAVs, genuine {len(genuine)} / impostor {len(impostor)} "
+          f"windows of {args.window_s:.1f} s\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in args.backends.split(","):
+            path = os.path.join(tmp, f"{backend}.joblib")
+            t0 = time.perf_counter()
+            enroll_svm(enroll_wavs, path, backend=backend)
+            train_s = time.perf_counter() - t0
+            model = speaker_models.get(path)
+
+            g = [confidence(model, f) for f in genuine]
+            i = [confidence(model, f) for f in impostor]
+            rate, at = eer(g, i)
+            frr = float(np.mean(np.array(g) < args.threshold))
+            far = float(np.mean(np.array(i) >= args.threshold))
+
+            lat = []
+            for feats in (genuine + impostor)[:200]:
+                t0 = time.perf_counter()
+                model.decision_function(feats)
+                lat.append((time.perf_counter() - t0) * 1000)
+            units = (f"{len(model.means)} components" if isinstance(model, CompactGMM)
+                     else f"{len(model.support_vectors)} support vectors")
+
+            print(f"[{backend}]")
+            print(f"  EER                 {rate * 100:5.1f} %  (at confidence {at:.2f})")
+            print(f"  FRR / FAR @ {args.threshold:.2f}   {frr * 100:5.1f} % / {far * 100:5.1f} %")
+            print(f"  model               {os.path.getsize(npz_path_for(path)) / 1024:.0f} KiB npz, {units}")
+            print(f"  verify (excl. MFCC) {np.median(lat):.3f} ms   train {train_s:.1f} s\n")
+
+
+if __name__ == "__main__":
+    main()
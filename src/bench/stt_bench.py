@@ -0,0 +1,206 @@
+# src/bench/stt_bench.py
+"""
+Recorded-audio STT benchmark across engines.
+
+Replays a directory of labeled WAVs through each recognizer's own
+listen_once() using FileAudioSource in place of the microphone, and reports
+per engine:
+  * WER                 against <name>.txt transcripts
+  * RTF                 listen_once() wall time / audio duration
+  * endpoint->text ms   from the moment the last labeled speech sample was
+                        delivered to when text came back (<name>.json
+                        {"speech": [[start_s, end_s], ...]}; default: energy-based)
+  * peak RSS            sampled with psutil while the engine runs; each engine
+                        runs in its own process (recognizers cache their models
+                        at class level), and the growth over that process's
+                        baseline before the model load is reported too
+
+Results are written to bench_results/stt-<tag>-<timestamp>.json; pass
+--compare with an older results file to print the deltas.
+
+Usage:
+    python -m src.bench.stt_bench path/to/wavs --engines leopard,vosk --tag v1.2
+    python -m src.bench.stt_bench path/to/wavs --realtime   # paced like a live mic
+"""
+import argparse
+import json
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import psutil
+from dotenv import load_dotenv
+
+from src.audio.file_source import FileAudioSource
+from src.bench.metrics import wer
+
+ENGINES = ("leopard", "faster-whisper", "whisper-cpp", "vosk")
+
+
+# ------------------------------------------------------------
+# Engine adapters: build once, then point at a new source per file
+# ------------------------------------------------------------
+def _make_recognizer(engine, src: FileAudioSource):
+    if engine == "leopard":
+        from src.stt.leopard_recognizer import LeopardRecognizer
+        return LeopardRecognizer(stream=src)
+    if engine == "faster-whisper":
+        from src.stt.faster_whisper_recognizer import FasterWhisperRecognizer
+        return FasterWhisperRecognizer(stream=src.as_pyaudio())
+    if engine == "whisper-cpp":
+        from src.stt.whisper_recognizer import SpeechRecognizer
+        return SpeechRecognizer(stream=src.as_pyaudio())
+    if engine == "vosk":
+        from src.stt.vosk_recognizer import VoskRecognizer
+        return VoskRecognizer(stream=src.as_pyaudio())
+    raise ValueError(f"unknown engine {engine!r}")
+
+
+def _attach(engine, rec, src: FileAudioSource):
+    if engine == "leopard":
+        rec.close_stream()
+        rec.open_stream(src)
+    else:
+        rec.stream = src.as_pyaudio()
+
+
+class _PeakRSS:
+    def __init__(self, interval=0.05):
+        self.proc = psutil.Process()
+        self.baseline = self.proc.memory_info().rss
+        self.peak = self.baseline
+        self._stop = threading.Event()
+        self._t = threading.Thread(target=self._run, args=(interval,), daemon=True)
+
+    def _run(self, interval):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.proc.memory_info().rss)
+            time.sleep(interval)
+
+    def __enter__(self):
+        self._t.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._t.join()
+
+
+def _speech_end_sample(wav: Path, pcm: np.ndarray, sr=16000) -> int:
+    """Labeled speech end, else the last 10ms window within 20 dB of the loudest one."""
+    side = wav.with_suffix(".json")
+    if side.exists():
+        segs = json.loads(side.read_text(encoding="utf-8")).get("speech", [])
+        if segs:
+            return int(max(e for _s, e in segs) * sr)
+    win = sr // 100
+    n = len(pcm) // win
+    if n == 0:
+        return len(pcm)
+    rms = np.sqrt(np.mean(pcm[:n * win].astype(np.float32).reshape(n, win) ** 2, axis=1))
+    loud = np.nonzero(rms >= 0.1 * rms.max())[0]
+    return int((loud[-1] + 1) * win) if len(loud) else len(pcm)
+
+
+def run_engine(engine, items, realtime=False):
+    refs, hyps, rtf, e2t = [], [], [], []
+    with _PeakRSS() as rss:
+        rec = None
+        for wav, ref in items:
+            src = FileAudioSource(wav, realtime=realtime)
+            if rec is None:
+                rec = _make_recognizer(engine, src)  # model load excluded from timings
+            else:
+                _attach(engine, rec, src)
+
+            t0 = time.perf_counter()
+            try:
+                text = rec.listen_once() or ""
+            except Exception as e:
+                print(f"  [{engine}] {wav.name}: {e}")
+                text = ""
+            t1 = time.perf_counter()
+
+            refs.append(ref)
+            hyps.append(text)
+            rtf.append((t1 - t0) / max(src.duration_s, 1e-6))
+            eos = src.delivered_at(_speech_end_sample(wav, src.pcm))
+            if eos is not None:
+                e2t.append((t1 - eos) * 1000)
+        if rec is not None:
+            try: rec.close()
+            except Exception: pass
+
+    return {
+        "utterances": len(refs),
+        "wer": wer(refs, hyps),
+        "rtf_mean": float(np.mean(rtf)) if rtf else None,
+        "endpoint_to_text_ms_p50": float(np.median(e2t)) if e2t else None,
+        "endpoint_to_text_ms_p90": float(np.percentile(e2t, 90)) if e2t else None,
+        "peak_rss_mb": rss.peak / (1024 * 1024),
+        "rss_growth_mb": (rss.peak - rss.baseline) / (1024 * 1024),
+        "hypotheses": dict(zip([w.name for w, _ in items], hyps)),
+    }
+
+
+def run_engine_isolated(engine, items, realtime=False):
+    """run_engine() in a fresh process, so one engine's memory can't inflate the next."""
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(run_engine, engine, items, realtime).result()
+
+
+def _fmt(v):
+    return "-" if v is None else (f"{v:.3f}" if isinstance(v, float) else str(v))
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", type=Path)
+    ap.add_argument("--engines", default=",".join(ENGINES))
+    ap.add_argument("--realtime", action="store_true", help="pace audio like a live mic")
+    ap.add_argument("--tag", default="dev", help="version label stored with the results")
+    ap.add_argument("--out-dir", type=Path, default=Path("bench_results"))
+    ap.add_argument("--compare", type=Path, help="previous results JSON to diff against")
+    args = ap.parse_args()
+
+    items = [(w, w.with_suffix(".txt").read_text(encoding="utf-8").strip())
+             for w in sorted(args.wav_dir.glob("*.wav")) if w.with_suffix(".txt").exists()]
+    if not items:
+        raise SystemExit("No labeled WAVs found (need <name>.wav + <name>.txt).")
+
+    results = {"tag": args.tag, "timestamp": datetime.now().isoformat(timespec="seconds"),
+               "realtime": args.realtime, "engines": {}}
+    for engine in [e.strip() for e in args.engines.split(",") if e.strip()]:
+        print(f"[Bench] {engine}: {len(items)} files…")
+        try:
+            results["engines"][engine] = run_engine_isolated(engine, items, args.realtime)
+        except Exception as e:  # missing model/key/package: report and keep going
+            print(f"[Bench] {engine} skipped: {e}")
+
+    prev = json.loads(args.compare.read_text(encoding="utf-8"))["engines"] if args.compare else {}
+    keys = ("wer", "rtf_mean", "endpoint_to_text_ms_p50", "endpoint_to_text_ms_p90", "peak_rss_mb", "rss_growth_mb")
+    print(f"\n{'engine':<16}" + "".join(f"{k:>26}" for k in keys))
+    for engine, r in results["engines"].items():
+        cells = []
+        for k in keys:
+            cell = _fmt(r[k])
+            old = prev.get(engine, {}).get(k)
+            if old is not None and r[k] is not None:
+                cell += f" ({r[k] - old:+.3f})"
+            cells.append(f"{cell:>26}")
+        print(f"{engine:<16}" + "".join(cells))
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    out = args.out_dir / f"stt-{args.tag}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\n[Bench] Results saved -> {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# src/bench/ui_level_bench.py
+"""
+Tk event-queue load and UI latency: per-frame level events vs LevelMeter polling.
+
+Runs an EKGWidget in a real Tk window while `--writers` audio-like threads
+report a mic level every 30ms, in two modes:
+
+  before   each frame posts root.after(0, ekg.update_level) (the old path)
+  after    each frame calls LevelMeter.push(); the EKG polls it per animation frame
+
+Reports Tk events posted per second by the audio threads, UI latency (a probe
+posted with root.after(0) every 50ms, like a click handler, p50/p99), and
+level display lag (a loud frame pushed -> EKG level updated, p50).
+
+Needs a display. Usage:
+    python -m src.bench.ui_level_bench [--seconds 10] [--writers 3]
+"""
+import argparse
+import threading
+import time
+import tkinter as tk
+
+import numpy as np
+
+from src.ui.app import EKGWidget
+from src.ui.level_meter import LevelMeter
+
+
+def _run_mode(mode, seconds, writers):
+    root = tk.Tk()
+    meter = LevelMeter() if mode == "after" else None
+    ekg = EKGWidget(root, height=44, meter=meter)
+    ekg.pack(fill="x")
+
+    stop = threading.Event()
+    posted = [0]
+    probe_ms, lag_ms = [], []
+    loud_t = [None]
+
+    def _writer(k):
+        i = 0
+        while not stop.is_set():
+            i += 1
+            loud = k == 0 and i % 33 == 0  # ~1 loud frame per second from writer 0
+            lvl = 90 if loud else 5
+            if loud and loud_t[0] is None:
+                loud_t[0] = time.perf_counter()
+            if mode == "before":
+                posted[0] += 1
+                root.after(0, lambda l=lvl: ekg.update_level(l))
+            else:
+                meter.push(lvl)
+            time.sleep(0.03)
+
+    def _probe():
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            root.after(0, lambda t0=t0: probe_ms.append((time.perf_counter() - t0) * 1000))
+            time.sleep(0.05)
+
+    def _watch_level():
+        # runs on the Tk thread: detect when the loud frame reaches the widget
+        if loud_t[0] is not None and ekg.level >= 0.5:
+            lag_ms.append((time.perf_counter() - loud_t[0]) * 1000)
+            loud_t[0] = None
+        if not stop.is_set():
+            root.after(5, _watch_level)
+
+    threads = [threading.Thread(target=_writer, args=(k,), daemon=True) for k in range(writers)]
+    threads.append(threading.Thread(target=_probe, daemon=True))
+    for t in threads:
+        t.start()
+    root.after(5, _watch_level)
+    root.after(int(seconds * 1000), lambda: (stop.set(), root.quit()))
+    cpu0 = time.process_time()
+    root.mainloop()
+    cpu = time.process_time() - cpu0
+    for t in threads:
+        t.join(timeout=1.0)
+    root.destroy()
+
+    return {
+        "audio_tk_events_per_s": posted[0] / seconds,
+        "ui_latency_ms_p50": float(np.median(probe_ms)) if probe_ms else None,
+        "ui_latency_ms_p99": float(np.percentile(probe_ms, 99)) if probe_ms else None,
+        "level_lag_ms_p50": float(np.median(lag_ms)) if lag_ms else None,
+        "cpu_s": cpu,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--writers", type=int, default=3, help="concurrent audio threads reporting levels")
+    args = ap.parse_args()
+
+    for mode in ("before", "after"):
+        r = _run_mode(mode, args.seconds, args.writers)
+        print(f"[{mode}]")
+        for k, v in r.items():
+            print(f"  {k:<22} {'-' if v is None else round(v, 2)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# src/bench/vad_bench.py
+"""
+VAD evaluation on recorded WAVs: false-trigger rate and endpoint delay.
+
+Each WAV (16 kHz mono) may have a sidecar <name>.json with labeled speech:
+    {"speech": [[0.82, 2.10], [4.00, 5.35]]}
+WAVs without a sidecar are treated as noise-only (fan, office, TV...).
+
+Audio is replayed in Leopard-sized 30ms frames through the adaptive VAD and
+through the old fixed mean-amplitude gate (start 4 / stop 3) for comparison.
+
+Usage:
+    python -m src.bench.vad_bench path/to/wavs [--silence-ms 250]
+"""
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from src.stt.vad import AdaptiveVAD
+
+SR = 16000
+FRAME = 480  # 30ms
+
+
+class _FixedGate:
+    """The previous hard-coded mean-amplitude thresholds."""
+
+    def __init__(self, start=4, stop=3):
+        self.start, self.stop = start, stop
+        self.in_speech = False
+
+    def update(self, frame):
+        amp = float(np.mean(np.abs(frame.astype(np.float32))))
+        self.in_speech = amp >= (self.stop if self.in_speech else self.start)
+        return self.in_speech
+
+
+def _load(path: Path):
+    y, sr = sf.read(str(path), dtype="int16")
+    if y.ndim > 1:
+        y = y[:, 0]
+    if sr != SR:
+        raise SystemExit(f"{path}: expected {SR} Hz, got {sr}")
+    labels = []
+    side = path.with_suffix(".json")
+    if side.exists():
+        labels = [tuple(seg) for seg in json.loads(side.read_text(encoding="utf-8")).get("speech", [])]
+    return y, labels
+
+
+def _utterances(decisions, silence_frames):
+    """Turn per-frame decisions into (start_s, end_s) the way recognizers endpoint."""
+    out, start, silence = [], None, 0
+    for i, d in enumerate(decisions):
+        if start is None:
+            if d:
+                start, silence = i, 0
+        else:
+            silence = 0 if d else silence + 1
+            if silence >= silence_frames:
+                out.append((start * FRAME / SR, (i + 1) * FRAME / SR))
+                start = None
+    if start is not None:
+        out.append((start * FRAME / SR, len(decisions) * FRAME / SR))
+    return out
+
+
+def _score(utts, labels, duration_s, tolerance_s=0.25):
+    false_triggers, delays, hits = 0, [], set()
+    for s, e in utts:
+        match = next((k for k, (ls, le) in enumerate(labels) if ls - tolerance_s <= s <= le), None)
+        if match is None:
+            false_triggers += 1
+            continue
+        if match not in hits:
+            hits.add(match)
+            delays.append(e - labels[match][1])
+    speech_s = sum(le - ls for ls, le in labels)
+    return false_triggers, max(0.0, duration_s - speech_s), delays, len(labels) - len(hits)
+
+
+def evaluate(wav_dir: Path, silence_ms=250):
+    silence_frames = max(1, int(silence_ms / 30))
+    totals = {}
+    for name, make in (("adaptive", lambda: AdaptiveVAD(SR, FRAME)), ("fixed", _FixedGate)):
+        ft, nonspeech_s, delays, misses = 0, 0.0, [], 0
+        for wav in sorted(wav_dir.glob("*.wav")):
+            y, labels = _load(wav)
+            vad = make()
+            n = len(y) // FRAME
+            decisions = [vad.update(y[i * FRAME:(i + 1) * FRAME]) for i in range(n)]
+            f, ns, d, m = _score(_utterances(decisions, silence_frames), labels, n * FRAME / SR)
+            ft, nonspeech_s, misses = ft + f, nonspeech_s + ns, misses + m
+            delays.extend(d)
+        totals[name] = {
+            "false_triggers": ft,
+            "false_triggers_per_min": ft / max(nonspeech_s / 60.0, 1e-9),
+            "endpoint_delay_ms_p50": float(np.median(delays) * 1000) if delays else None,
+            "endpoint_delay_ms_p90": float(np.percentile(delays, 90) * 1000) if delays else None,
+            "missed_utterances": misses,
+        }
+    return totals
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", type=Path)
+    ap.add_argument("--silence-ms", type=int, default=250)
+    args = ap.parse_args()
+
+    for name, r in evaluate(args.wav_dir, args.silence_ms).items():
+        print(f"[{name}]")
+        for k, v in r.items():
+            print(f"  {k:<24} {v if v is None or isinstance(v, int) else round(v, 2)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# src/bench/vosk_command_bench.py
+"""
+Vosk command-grammar benchmark: decode speed and accuracy vs the free-form model.
+
+Replays labeled WAVs (16 kHz mono, transcript in a sidecar <name>.txt)
+through three decoders:
+  free      KaldiRecognizer without grammar
+  grammar   KaldiRecognizer constrained to the command vocabulary
+  hybrid    grammar, re-decoded free-form when confidence is low (what
+            VoskRecognizer's command mode does)
+
+Usage:
+    python -m src.bench.vosk_command_bench path/to/wavs [--model VOSK_MODEL]
+"""
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import soundfile as sf
+from dotenv import load_dotenv
+from vosk import KaldiRecognizer, Model, SetLogLevel
+
+from src.bench.metrics import wer
+from src.intent_router import IntentRouter
+from src.stt.command_grammar import CommandVocabulary
+from src.stt.vosk_recognizer import grammar_result_confident
+
+CHUNK = 4000
+
+
+def _decode(rec, pcm_bytes):
+    rec.Reset()
+    for i in range(0, len(pcm_bytes), CHUNK * 2):
+        rec.AcceptWaveform(pcm_bytes[i:i + CHUNK * 2])
+    return json.loads(rec.FinalResult())
+
+
+def _build_vocab():
+    router = IntentRouter()
+    from src.tools.registry import load_all_tools
+    load_all_tools(router, {})
+    return CommandVocabulary(router)
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", type=Path)
+    ap.add_argument("--model", default=os.getenv("VOSK_MODEL", ""))
+    ap.add_argument("--min-conf", type=float, default=0.6)
+    args = ap.parse_args()
+
+    SetLogLevel(-1)
+    model = Model(args.model)
+    phrases = _build_vocab().phrases()
+    t0 = time.perf_counter()
+    grammar = KaldiRecognizer(model, 16000, json.dumps(phrases + ["[unk]"]))
+    grammar.SetWords(True)
+    print(f"grammar: {len(phrases)} entries, built in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    free = KaldiRecognizer(model, 16000)
+
+    refs, hyps = [], {"free": [], "grammar": [], "hybrid": []}
+    secs = {"free": 0.0, "grammar": 0.0, "hybrid": 0.0}
+    audio_s, fallbacks = 0.0, 0
+    for wav in sorted(args.wav_dir.glob("*.wav")):
+        side = wav.with_suffix(".txt")
+        if not side.exists():
+            continue
+        y, sr = sf.read(str(wav), dtype="int16")
+        if sr != 16000:
+            print(f"skip {wav.name}: {sr} Hz")
+            continue
+        pcm = (y if y.ndim == 1 else y[:, 0]).tobytes()
+        audio_s += len(pcm) / 2 / 16000
+        refs.append(side.read_text(encoding="utf-8").strip())
+
+        t = time.perf_counter(); res_f = _decode(free, pcm); dt_f = time.perf_counter() - t
+        t = time.perf_counter(); res_g = _decode(grammar, pcm); dt_g = time.perf_counter() - t
+
+        hyps["free"].append(res_f.get("text", ""))
+        hyps["grammar"].append(res_g.get("text", "").replace("[unk]", ""))
+        secs["free"] += dt_f
+        secs["grammar"] += dt_g
+        if grammar_result_confident(res_g, args.min_conf):
+            hyps["hybrid"].append(hyps["grammar"][-1])
+            secs["hybrid"] += dt_g
+        else:
+            fallbacks += 1
+            hyps["hybrid"].append(hyps["free"][-1])
+            secs["hybrid"] += dt_g + dt_f
+
+    if not refs:
+        raise SystemExit("No labeled WAVs found (need <name>.wav + <name>.txt).")
+    print(f"{len(refs)} utterances, {audio_s:.1f}s audio, hybrid fallbacks: {fallbacks}")
+    for name in ("free", "grammar", "hybrid"):
+        print(f"  {name:<8} WER {wer(refs, hyps[name]) * 100:5.1f}%   RTF {secs[name] / audio_s:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# src/bench/wake_bench.py
+"""
+Wake-word replay benchmark: detection latency, false accepts, misses, CPU.
+
+Feeds long recorded WAV streams (16 kHz mono) through WakeWordListener's own
+processing loop with a FileAudioSource in place of the mic. A sidecar
+<name>.json marks the keyword utterances:
+    {"wake": [[start_s, end_s], ...]}
+WAVs without one (TV, chatter, silence...) are all negatives.
+
+A detection counts as a hit if it lands between the start of a labeled
+keyword and `--window-s` after its end; its latency is detection time minus
+the keyword's end. Every other detection is a false accept.
+
+Reports per file and in total: hits/misses, detection latency p50/p90,
+false accepts per hour of audio and CPU seconds per audio hour.
+
+Usage:
+    python -m src.bench.wake_bench path/to/streams [--sensitivity 0.6]
+
+Needs PORCUPINE_ACCESS_KEY and PORCUPINE_KEYWORD_PATH (as in main.py).
+"""
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+
+from src.audio.file_source import FileAudioSource
+from src.wake.pvporcupine import WakeWordListener
+
+
+def _labels(wav: Path):
+    side = wav.with_suffix(".json")
+    if not side.exists():
+        return []
+    return [tuple(seg) for seg in json.loads(side.read_text(encoding="utf-8")).get("wake", [])]
+
+
+def replay(wav: Path, access_key, keyword_path, sensitivity=None):
+    """Run one file through the listener loop; returns (detection times s, duration s, cpu s)."""
+    src = FileAudioSource(wav, tail_silence_s=0.5)
+    detections = []
+
+    def _on_detect(_audio=None):
+        detections.append(src.pos / float(src.sample_rate))
+
+    listener = WakeWordListener(
+        access_key=access_key, on_detect=_on_detect, keyword_path=keyword_path,
+        sensitivity=sensitivity, stream=src,
+    )
+    cpu0 = time.process_time()
+    listener._run()  # synchronous: returns when the file is exhausted
+    return detections, src.duration_s, time.process_time() - cpu0
+
+
+def score(detections, labels, window_s=1.5):
+    hits, latencies, false_accepts = set(), [], 0
+    for t in detections:
+        k = next((i for i, (s, e) in enumerate(labels) if s <= t <= e + window_s and i not in hits), None)
+        if k is None:
+            false_accepts += 1
+        else:
+            hits.add(k)
+            latencies.append((t - labels[k][1]) * 1000)
+    return len(hits), len(labels) - len(hits), false_accepts, latencies
+
+
+def main():
+    load_dotenv()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wav_dir", type=Path)
+    ap.add_argument("--sensitivity", type=float, default=None)
+    ap.add_argument("--window-s", type=float, default=1.5, help="max detection delay after keyword end")
+    args = ap.parse_args()
+
+    access_key = os.getenv("PORCUPINE_ACCESS_KEY", "").strip()
+    keyword_path = os.getenv("PORCUPINE_KEYWORD_PATH", "").strip() or None
+    wavs = sorted(args.wav_dir.glob("*.wav"))
+    if not wavs:
+        raise SystemExit("No WAVs found.")
+
+    hits = misses = fa = 0
+    audio_s = cpu_s = 0.0
+    latencies = []
+    for wav in wavs:
+        labels = _labels(wav)
+        dets, dur, cpu = replay(wav, access_key, keyword_path, args.sensitivity)
+        h, m, f, lat = score(dets, labels, args.window_s)
+        hits, misses, fa = hits + h, misses + m, fa + f
+        audio_s, cpu_s = audio_s + dur, cpu_s + cpu
+        latencies.extend(lat)
+        print(f"  {wav.name:<32} {dur / 60:6.1f} min  hits {h}/{len(labels)}  false accepts {f}")
+
+    hours = max(audio_s / 3600.0, 1e-9)
+    print(f"\n[Wake] {len(wavs)} files, {audio_s / 3600:.2f} h audio"
+          f"{'' if args.sensitivity is None else f', sensitivity {args.sensitivity}'}")
+    print(f"  hits / misses          {hits} / {misses}")
+    if latencies:
+        print(f"  detection latency ms   p50 {np.median(latencies):.0f}  p90 {np.percentile(latencies, 90):.0f}")
+    print(f"  false accepts / hour   {fa / hours:.2f}")
+    print(f"  CPU s / audio hour     {cpu_s / hours:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# src/bench/wake_buffer_bench.py
+"""
+Wake-listener pre-roll: per-frame allocations and detection snapshot cost.
+
+Replays 512-sample frames through the old path (deque of flattened frames,
+float conversion for the level meter, concatenate + astype on detection) and
+the new one (Int16Ring write, shared mean_abs into a scratch buffer,
+snapshot_float32) without Porcupine, and reports per frame:
+
+  * temporary bytes   tracemalloc peak above the steady state
+  * live blocks       allocations still held after the frame (buffer growth)
+  * time              µs per frame
+
+plus the same numbers for the detection snapshot.
+
+Usage:
+    python -m src.bench.wake_buffer_bench [--frames 2000]
+"""
+import argparse
+import collections
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.audio.level import level_from_mean_abs, mean_abs
+from src.audio.ring import Int16Ring
+from src.wake.pvporcupine import snapshot_float32
+
+SR = 16000
+BLOCK = 512
+MAX_BLOCKS = int(2.5 * SR / BLOCK)
+
+
+class _Legacy:
+    def __init__(self):
+        self.buf = collections.deque(maxlen=MAX_BLOCKS)
+
+    def frame(self, data):
+        pcm = data.flatten()
+        self.buf.append(pcm)
+        f = pcm.astype(np.float32) / 32768.0
+        return int(max(0.0, min(1.0, float(np.mean(np.abs(f))) * 3.0)) * 100)
+
+    def snapshot(self):
+        return np.concatenate(self.buf).astype(np.float32) / 32768.0
+
+
+class _Ring:
+    def __init__(self):
+        self.ring = Int16Ring(MAX_BLOCKS * BLOCK)
+        self.scratch = np.empty(BLOCK, dtype=np.float32)
+
+    def frame(self, data):
+        pcm = data[:, 0]
+        self.ring.write(pcm)
+        return level_from_mean_abs(mean_abs(pcm, self.scratch))
+
+    def snapshot(self):
+        return snapshot_float32(self.ring, self.ring.capacity)
+
+
+def _measure(fn, reps):
+    tracemalloc.start()
+    tmp, live, t = [], [], 0.0
+    for _ in range(reps):
+        snap0 = tracemalloc.take_snapshot() if len(live) < 20 else None
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        fn()
+        t += time.perf_counter() - t0
+        cur, peak = tracemalloc.get_traced_memory()
+        tmp.append(peak - before)
+        if snap0 is not None:
+            diff = tracemalloc.take_snapshot().compare_to(snap0, "lineno")
+            live.append(sum(max(0, d.count_diff) for d in diff if d.traceback[0].filename != tracemalloc.__file__))
+    tracemalloc.stop()
+    return np.mean(tmp), np.mean(live), t / reps * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=2000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(-3000, 3000, size=(BLOCK, 1), dtype=np.int16) for _ in range(64)]
+
+    for name, cls in (("before", _Legacy), ("after", _Ring)):
+        impl = cls()
+        for i in range(MAX_BLOCKS + 8):  # fill the pre-roll (steady state)
+            impl.frame(frames[i % len(frames)])
+        it = iter(range(10 ** 9))
+        tmp, live, us = _measure(lambda: impl.frame(frames[next(it) % len(frames)]), args.frames)
+        stmp, slive, sus = _measure(impl.snapshot, 50)
+        print(f"[{name}] per frame: {tmp:8.0f} B temp  {live:5.1f} live blocks  {us:6.1f} µs"
+              f" | snapshot: {stmp / 1024:7.1f} KiB temp  {sus:7.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
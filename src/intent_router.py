@@ -33,6 +33,7 @@ class IntentRouter:
         self.examples: Dict[str, List[str]] = {}
         self.handlers: Dict[str, Callable[[str], str]] = {}
         self._anchors: Dict[str, List[str]] = {}
+        self.version = 0  # bumped on add_intent (lets grammar/vocab caches rebuild)
 
         self._labels: List[str] = []
         self._example_matrix = None
@@ -76,6 +77,7 @@ class IntentRouter:
         self.examples[name] = examples or []
         self.handlers[name] = handler
         self._anchors[name] = [a.lower() for a in (anchors or [])]
+        self.version += 1
 
     def build(self):
         """Precompute embeddings matrix if using SentenceTransformer."""
@@ -0,0 +1,168 @@
+# src/stt/batch_transcribe.py
+"""
+Batch transcription of recorded audio (enrollment captures, debug dumps…).
+
+Decodes every WAV/FLAC under a directory with one backend across a process
+pool. Each worker loads its model once in the pool initializer and keeps it
+resident for all files it handles. Results are appended to a JSONL file as
+they complete, and --resume skips files already present in that file.
+
+Usage:
+    python -m src.stt.batch_transcribe recordings/ --backend faster-whisper --out out.jsonl
+    python -m src.stt.batch_transcribe recordings/ --backend vosk --out out.jsonl --resume
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+BACKENDS = ("faster-whisper", "whisper-cpp", "vosk")
+AUDIO_EXTS = {".wav", ".flac"}
+SR = 16000
+
+# per-worker state (set by _init_worker)
+_BACKEND = None
+_MODEL = None
+
+
+# ------------------------------------------------------------
+# Worker side
+# ------------------------------------------------------------
+def _init_worker(backend: str, threads: int):
+    global _BACKEND, _MODEL
+    os.environ.setdefault("OMP_NUM_THREADS", str(threads))
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    _BACKEND = backend
+    if backend == "faster-whisper":
+        from src.stt.faster_whisper_recognizer import FasterWhisperRecognizer
+        FasterWhisperRecognizer._load_model()
+        _MODEL = FasterWhisperRecognizer._model
+    elif backend == "whisper-cpp":
+        from src.stt.whisper_recognizer import SpeechRecognizer
+        SpeechRecognizer._preload_model()
+        _MODEL = SpeechRecognizer._model
+    elif backend == "vosk":
+        from vosk import Model, SetLogLevel
+        from src.setup.vosk_setup import ensure_vosk_model
+        SetLogLevel(-1)
+        _MODEL = Model(ensure_vosk_model())
+    else:
+        raise ValueError(f"unknown backend {backend!r}")
+
+
+def _load_audio(path: str) -> np.ndarray:
+    """Mono float32 at 16 kHz (linear resample if needed)."""
+    import soundfile as sf
+    y, sr = sf.read(path, dtype="float32")
+    if y.ndim > 1:
+        y = y.mean(axis=1)
+    if sr != SR and len(y):
+        n = int(round(len(y) * SR / float(sr)))
+        y = np.interp(np.linspace(0, len(y) - 1, n), np.arange(len(y)), y).astype(np.float32)
+    return y
+
+
+def _transcribe(path: str) -> dict:
+    t0 = time.perf_counter()
+    try:
+        audio = _load_audio(path)
+        if _BACKEND == "faster-whisper":
+            segments, _ = _MODEL.transcribe(audio, beam_size=1)
+            text = " ".join(seg.text for seg in segments).strip()
+        elif _BACKEND == "whisper-cpp":
+            text = _MODEL.transcribe(audio, language="en").get("text", "").strip()
+        else:
+            from vosk import KaldiRecognizer
+            rec = KaldiRecognizer(_MODEL, SR)
+            pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+            for i in range(0, len(pcm), 8000):
+                rec.AcceptWaveform(pcm[i:i + 8000])
+            text = json.loads(rec.FinalResult()).get("text", "").strip()
+        return {"path": path, "text": text, "duration_s": round(len(audio) / SR, 3),
+                "decode_s": round(time.perf_counter() - t0, 3), "backend": _BACKEND}
+    except Exception as e:
+        return {"path": path, "error": str(e), "backend": _BACKEND}
+
+
+# ------------------------------------------------------------
+# Driver side
+# ------------------------------------------------------------
+def _done_paths(out_path: Path) -> set:
+    """Paths already transcribed in out_path; trims a half-written last line."""
+    if not out_path.exists():
+        return set()
+    raw = out_path.read_bytes()
+    if raw and not raw.endswith(b"\n"):
+        raw = raw[:raw.rfind(b"\n") + 1]
+        out_path.write_bytes(raw)
+    done = set()
+    for line in raw.decode("utf-8", errors="replace").splitlines():
+        try:
+            row = json.loads(line)
+        except ValueError:
+            continue
+        if "text" in row:
+            done.add(row["path"])
+    return done
+
+
+def transcribe_dir(root: Path, backend: str, out_path: Path, workers: int = 0, resume: bool = False):
+    files = sorted(str(p) for p in root.rglob("*") if p.suffix.lower() in AUDIO_EXTS)
+    if resume:
+        done = _done_paths(out_path)
+        files = [f for f in files if f not in done]
+        print(f"[Batch] Resuming: {len(done)} already done, {len(files)} to go.")
+    elif out_path.exists():
+        out_path.unlink()
+    if not files:
+        print("[Batch] Nothing to transcribe.")
+        return
+
+    workers = workers or max(1, (os.cpu_count() or 2) // 2)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    print(f"[Batch] {len(files)} files, backend={backend}, {workers} workers x {threads} threads")
+
+    t0 = time.perf_counter()
+    audio_s = ok = failed = 0
+    with open(out_path, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(backend, threads)) as pool:
+        futures = [pool.submit(_transcribe, f) for f in files]
+        for fut in as_completed(futures):
+            row = fut.result()
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+            out.flush()
+            if "error" in row:
+                failed += 1
+                print(f"[Batch] FAILED {row['path']}: {row['error']}")
+            else:
+                ok += 1
+                audio_s += row["duration_s"]
+
+    wall = time.perf_counter() - t0
+    print(f"[Batch] Done: {ok} ok, {failed} failed, {audio_s:.1f}s audio in {wall:.1f}s "
+          f"(x{audio_s / max(wall, 1e-9):.1f} real time) -> {out_path}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("audio_dir", type=Path)
+    ap.add_argument("--backend", choices=BACKENDS, default="faster-whisper")
+    ap.add_argument("--out", type=Path, default=Path("transcripts.jsonl"))
+    ap.add_argument("--workers", type=int, default=0, help="processes (default: half the CPUs)")
+    ap.add_argument("--resume", action="store_true", help="skip files already in --out")
+    args = ap.parse_args(argv)
+    if not args.audio_dir.is_dir():
+        sys.exit(f"Not a directory: {args.audio_dir}")
+    transcribe_dir(args.audio_dir, args.backend, args.out, args.workers, args.resume)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# src/stt/command_grammar.py
+"""
+Vocabulary for Vosk's grammar-constrained command mode.
+
+Most voice traffic is short commands built from words we already know:
+router examples (add_intent), app names from the apps index, and the folder
+aliases in tools/files.py. CommandVocabulary collects them into the phrase
+list KaldiRecognizer accepts as a grammar, and exposes a cheap signature so
+the recognizer only rebuilds when an intent is added or the app index is
+rescanned.
+"""
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+from ..apps.indexer import INDEX_PATH
+
+_PHRASE_RE = re.compile(r"[^a-z' ]+")
+
+
+def normalize_phrase(text: str) -> str:
+    """Lowercase, drop digits/punctuation (Kaldi vocab words), squeeze spaces."""
+    return " ".join(_PHRASE_RE.sub(" ", (text or "").lower()).split())
+
+
+class CommandVocabulary:
+    def __init__(
+        self,
+        router=None,
+        index_path: str = INDEX_PATH,
+        folder_aliases: Optional[Dict[str, object]] = None,
+        extra: Optional[Iterable[str]] = None,
+    ):
+        self.router = router
+        self.index_path = index_path
+        if folder_aliases is None:
+            from ..tools.files import FOLDER_ALIASES
+            folder_aliases = FOLDER_ALIASES
+        self.folder_aliases = folder_aliases
+        self.extra = list(extra or [])
+
+    def signature(self):
+        """Changes whenever an intent is registered or the app index is rewritten."""
+        try:
+            index_mtime = os.path.getmtime(self.index_path)
+        except OSError:
+            index_mtime = 0.0
+        router_version = getattr(self.router, "version", 0) if self.router else 0
+        return (router_version, index_mtime, len(self.folder_aliases), len(self.extra))
+
+    def phrases(self) -> List[str]:
+        """
+        Whole phrases plus every individual word: Vosk grammars decode any
+        sequence of the listed entries, so single words let new combinations
+        ("open" + an app name) through without enumerating them.
+        """
+        raw = list(self.extra)
+        if self.router is not None:
+            for exs in self.router.examples.values():
+                raw.extend(exs)
+        raw.extend(self.folder_aliases.keys())
+        raw.extend(self._app_names())
+
+        out = set()
+        for text in raw:
+            p = normalize_phrase(text)
+            if not p:
+                continue
+            out.add(p)
+            out.update(p.split())
+        return sorted(out)
+
+    def _app_names(self) -> List[str]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return list(json.load(f).keys())
+        except Exception:
+            return []
@@ -0,0 +1,116 @@
+# src/stt/denoise.py
+"""
+Streaming spectral subtraction for the STT capture path.
+
+noisereduce works on the whole utterance after end of speech, which put its
+full cost on the latency path. StreamingDenoiser instead cleans each capture
+frame as it is read: frames are analysed in 50%-overlapping sqrt-Hann blocks
+of two hops, the noise power spectrum is subtracted with an over-subtraction
+factor and a spectral floor, and blocks are overlap-added back. Output lags
+input by exactly one hop; flush() returns the final hop once capture stops.
+
+The noise profile is seeded by prime() from known non-speech audio (the quiet
+part of the wake-word rolling buffer) and keeps adapting on frames the VAD
+marks as silence while waiting for speech. Only such frames ever feed the
+estimate; until one has arrived, frames pass through at unit gain.
+"""
+import numpy as np
+
+_EPS = 1e-10
+
+
+class StreamingDenoiser:
+    def __init__(
+        self,
+        hop_samples=480,          # one capture frame (30ms @ 16kHz)
+        over_subtract=1.5,        # >1 removes a bit more than the estimate
+        floor=0.1,                # minimum gain (-20 dB): limits musical noise
+        noise_smoothing=0.9,      # recursive average for silence updates
+        gain_smoothing=0.5,       # temporal smoothing of the gain per bin
+    ):
+        self.hop = int(hop_samples)
+        self.n = 2 * self.hop
+        self.over_subtract = over_subtract
+        self.floor = floor
+        self.noise_smoothing = noise_smoothing
+        self.gain_smoothing = gain_smoothing
+
+        # periodic sqrt-Hann: analysis * synthesis sums to 1 at 50% overlap
+        k = np.arange(self.n, dtype=np.float32)
+        self._window = np.sqrt(0.5 - 0.5 * np.cos(2.0 * np.pi * k / self.n)).astype(np.float32)
+
+        self.noise_psd = None     # (n//2 + 1,) power per bin, None = not estimated yet
+        self._block = np.zeros(self.n, dtype=np.float32)
+        self._tail = np.zeros(self.hop, dtype=np.float32)
+        self._out = np.zeros(self.hop, dtype=np.float32)
+        self._gain = np.ones(self.n // 2 + 1, dtype=np.float32)
+
+    # ------------------------------------------------------------
+    def reset(self):
+        """Start a new utterance: clear the overlap state, keep the noise profile."""
+        self._block[:] = 0.0
+        self._tail[:] = 0.0
+        self._gain[:] = 1.0
+
+    def _psd(self, blocks: np.ndarray) -> np.ndarray:
+        spec = np.fft.rfft(blocks * self._window, axis=-1)
+        return (spec.real ** 2 + spec.imag ** 2).astype(np.float32)
+
+    def prime(self, pcm: np.ndarray, quiet_fraction=0.3):
+        """
+        Seed the noise profile from audio that is mostly non-speech (int16 or
+        float in [-1, 1], e.g. the wake buffer): the quietest `quiet_fraction`
+        of its blocks are averaged, so the keyword itself is ignored.
+        """
+        x = np.asarray(pcm).reshape(-1)
+        if x.dtype != np.int16:
+            x = x.astype(np.float32) * 32768.0
+        nblocks = (len(x) - self.n) // self.hop + 1
+        if nblocks <= 0:
+            return
+        idx = np.arange(self.n)[None, :] + self.hop * np.arange(nblocks)[:, None]
+        psd = self._psd(x[idx].astype(np.float32))
+        energy = psd.sum(axis=1)
+        keep = energy <= np.quantile(energy, quiet_fraction)
+        self.noise_psd = psd[keep].mean(axis=0)
+
+    # ------------------------------------------------------------
+    def process(self, frame: np.ndarray, update_noise=False) -> np.ndarray:
+        """
+        Feed one hop of int16 audio; returns the cleaned previous hop as float32
+        (int16 scale, clipped). The returned array is reused on the next call.
+        With update_noise=True the frame also refines (or seeds) the noise
+        estimate; without any estimate yet the audio passes through unchanged.
+        """
+        block = self._block
+        block[:self.hop] = block[self.hop:]
+        block[self.hop:] = frame
+
+        spec = np.fft.rfft(block * self._window)
+        power = spec.real ** 2 + spec.imag ** 2
+
+        if update_noise:
+            if self.noise_psd is None:
+                self.noise_psd = power.astype(np.float32)
+            else:
+                a = self.noise_smoothing
+                self.noise_psd = a * self.noise_psd + (1.0 - a) * power
+
+        if self.noise_psd is not None:
+            gain = np.sqrt(np.maximum(1.0 - self.over_subtract * self.noise_psd / (power + _EPS), self.floor ** 2))
+            g = self.gain_smoothing
+            self._gain = (g * self._gain + (1.0 - g) * gain).astype(np.float32)
+        # else: no noise estimate yet (never primed, speech from the first
+        # frame): keep unit gain rather than subtract the speech from itself
+
+        y = np.fft.irfft(spec * self._gain, n=self.n).astype(np.float32) * self._window
+
+        out = self._out
+        np.add(self._tail, y[:self.hop], out=out)
+        self._tail[:] = y[self.hop:]
+        np.clip(out, -32768.0, 32767.0, out=out)
+        return out
+
+    def flush(self) -> np.ndarray:
+        """Return the last hop fed to process() (pushes one hop of silence)."""
+        return self.process(np.zeros(self.hop, dtype=np.int16))
@@ -0,0 +1,109 @@
+# src/stt/endpoint.py
+"""
+Adaptive end-of-speech detection.
+
+A fixed trailing-silence timeout is a bad fit for both ends of the range:
+"next song" pays the full wait, while a long question with a thinking pause
+gets cut off. AdaptiveEndpointer picks the timeout per utterance from
+
+  * utterance length   short commands end after `short_silence_ms`, long
+                       utterances stretch towards `long_silence_ms`
+  * speaking rate      pauses the speaker made mid-utterance (tracked across
+                       utterances) are not treated as the end: past the
+                       short-command length the timeout stays above
+                       `pause_factor` x their running average
+  * completeness       when a partial transcript is complete (e.g. the router
+                       already matches an intent), `complete_silence_ms` wins
+
+and feeds on the same per-chunk VAD decisions the recognizers already make.
+"""
+from typing import Callable, Optional
+
+
+def router_completeness(router, min_score: Optional[float] = None) -> Callable[[str], bool]:
+    """is_complete() hook: a partial is complete once the router confidently matches an intent."""
+    def _is_complete(text: str) -> bool:
+        if len((text or "").split()) < 2:
+            return False
+        label, score = router.route(text)
+        threshold = min_score if min_score is not None else getattr(router, "threshold", 0.5)
+        return label is not None and score >= threshold
+    return _is_complete
+
+
+class AdaptiveEndpointer:
+    def __init__(
+        self,
+        chunk_ms: float,
+        short_silence_ms=200,       # timeout for short commands
+        long_silence_ms=700,        # timeout for long utterances
+        complete_silence_ms=120,    # timeout once the partial is complete
+        max_silence_ms=1200,        # hard upper bound
+        short_speech_ms=600,        # utterances up to this long count as short
+        long_speech_ms=2500,        # ... and from this long as long
+        pause_factor=1.5,           # timeout >= pause_factor * typical mid-utterance pause
+        pause_smoothing=0.3,        # running-average weight of each new pause
+        is_complete: Optional[Callable[[str], bool]] = None,
+    ):
+        self.chunk_ms = float(chunk_ms)
+        self.short_silence_ms = short_silence_ms
+        self.long_silence_ms = long_silence_ms
+        self.complete_silence_ms = complete_silence_ms
+        self.max_silence_ms = max_silence_ms
+        self.short_speech_ms = short_speech_ms
+        self.long_speech_ms = long_speech_ms
+        self.pause_factor = pause_factor
+        self.pause_smoothing = pause_smoothing
+        self.is_complete = is_complete
+
+        self.pause_avg_ms = None   # survives reset(): it's a property of the speaker
+        self.reset()
+
+    def reset(self):
+        """New utterance (keeps the speaker's pause statistics)."""
+        self.speech_ms = 0.0
+        self.silence_ms = 0.0
+        self.complete = False
+        self.endpoint_timeout_ms = None  # timeout that fired, for metrics
+
+    # ------------------------------------------------------------
+    def set_partial(self, text: str):
+        """Report the latest partial transcript (safe to call from a decoder thread)."""
+        if self.is_complete is None:
+            return
+        try:
+            self.complete = bool(self.is_complete(text))
+        except Exception as e:
+            print("[Endpoint] completeness check failed:", e)
+            self.complete = False
+
+    def timeout_ms(self) -> float:
+        span = max(1.0, self.long_speech_ms - self.short_speech_ms)
+        frac = min(1.0, max(0.0, (self.speech_ms - self.short_speech_ms) / span))
+        t = self.short_silence_ms + frac * (self.long_silence_ms - self.short_silence_ms)
+        if self.pause_avg_ms is not None and self.speech_ms > self.short_speech_ms:
+            # short commands rarely pause; longer speech may be mid-sentence
+            t = max(t, self.pause_factor * self.pause_avg_ms)
+        t = min(t, self.max_silence_ms)
+        if self.complete:
+            t = min(t, self.complete_silence_ms)
+        return t
+
+    def update(self, is_speech: bool) -> bool:
+        """Feed one chunk's VAD decision (only after speech started). True = end of speech."""
+        if is_speech:
+            if self.silence_ms > 0:
+                # speech resumed: that silence was a mid-utterance pause
+                a = self.pause_smoothing
+                p = self.silence_ms
+                self.pause_avg_ms = p if self.pause_avg_ms is None else (1 - a) * self.pause_avg_ms + a * p
+                self.silence_ms = 0.0
+            self.speech_ms += self.chunk_ms
+            return False
+
+        self.silence_ms += self.chunk_ms
+        timeout = self.timeout_ms()
+        if self.silence_ms >= timeout:
+            self.endpoint_timeout_ms = timeout
+            return True
+        return False
@@ -1,18 +1,97 @@
 # src/stt/faster_whisper_recognizer.py
 import os
+import re
+import threading
 import numpy as np
 import pyaudio
 from faster_whisper import WhisperModel
 
+from .endpoint import AdaptiveEndpointer
+from .vad import AdaptiveVAD
+
+_WORD_NORM_RE = re.compile(r"[^a-z0-9']+")
+
+
+def _norm_word(w: str) -> str:
+    return _WORD_NORM_RE.sub("", w.lower())
+
+
+class _LocalAgreement:
+    """
+    LocalAgreement-2 commit policy for re-decoded sliding windows.
+
+    A word is committed once two consecutive decodes agree on it (same
+    normalized text, in order, after the last committed word). Committed words
+    are never revised; everything after them stays tentative.
+    """
+
+    def __init__(self):
+        self.committed = []   # [(start_s, end_s, text)]
+        self.tentative = []   # rest of the latest hypothesis
+
+    @property
+    def committed_end(self) -> float:
+        return self.committed[-1][1] if self.committed else 0.0
+
+    def _after_commit(self, words):
+        # keep words whose midpoint lies beyond the committed audio
+        end = self.committed_end
+        return [w for w in words if (w[0] + w[1]) / 2.0 >= end]
+
+    def insert(self, words):
+        new = self._after_commit(words)
+        k = 0
+        while (k < len(new) and k < len(self.tentative)
+               and _norm_word(new[k][2]) == _norm_word(self.tentative[k][2])):
+            k += 1
+        self.committed.extend(new[:k])
+        self.tentative = new[k:]
+        return new[:k]
+
+    def committed_text(self) -> str:
+        return "".join(w[2] for w in self.committed).strip()
+
+    def tentative_text(self) -> str:
+        return "".join(w[2] for w in self.tentative).strip()
+
+
 class FasterWhisperRecognizer:
+    """
+    faster-whisper STT.
+
+    With streaming=True (or when listen_once gets an on_partial callback) the
+    utterance is re-decoded every `step_s` while the user is still talking,
+    stable prefixes are committed by local agreement, and after endpointing only
+    the uncommitted tail is decoded, so end-of-speech latency no longer grows
+    with utterance length.
+    """
     _model = None  # static shared model
 
-    def __init__(self, on_level=None):
+    def __init__(self, on_level=None, vad=None, streaming=False, on_partial=None,
+                 step_s=1.0, max_seconds=20.0, stream=None, endpointer=None, is_complete=None):
         self.on_level = on_level
         self.sample_rate = 16000
         self.chunk = 16000 // 10  # 100ms
-        self.pa = pyaudio.PyAudio()
-        self.stream = self.pa.open(
+        # 20ms analysis windows, 5 per chunk
+        self.vad = vad or AdaptiveVAD(sample_rate=self.sample_rate, frame_samples=320)
+        # End of speech: ~300ms for short commands up to ~1s for long questions;
+        # in streaming mode `is_complete(partial_text)` (e.g. router_completeness)
+        # can cut it shorter once the command is already recognizable.
+        self.endpointer = endpointer or AdaptiveEndpointer(
+            chunk_ms=100, short_silence_ms=300, long_silence_ms=1000,
+            complete_silence_ms=200, max_silence_ms=1500, is_complete=is_complete,
+        )
+
+        self.streaming = streaming
+        self.on_partial = on_partial  # on_partial(committed_text, tentative_text)
+        self.step_chunks = max(1, int(step_s * 10))
+        self.max_chunks = int(max_seconds * 10)
+        self._audio = np.zeros(self.max_chunks * self.chunk, dtype=np.float32)
+
+        # Audio input; `stream` may be any pre-opened PyAudio-style source
+        # (e.g. FileAudioSource(...).as_pyaudio() for benchmarks)
+        self.pa = None if stream is not None else pyaudio.PyAudio()
+        self.stream = stream if stream is not None else self.pa.open(
             format=pyaudio.paInt16,
             channels=1,
             rate=self.sample_rate,
@@ -34,7 +113,10 @@ class FasterWhisperRecognizer:
         cls._model = WhisperModel(
             model_size_or_path=path,
             device="cpu",
-            compute_type="int8"  # FASTEST + small RAM
+            compute_type="int8",  # FASTEST + small RAM
+            # two workers (weights shared): the final streaming decode runs
+            # alongside a still-running partial decode instead of queueing
+            num_workers=2,
         )
 
     def _amp(self, data):
@@ -42,10 +124,15 @@ class FasterWhisperRecognizer:
         lvl = min(1.0, abs(arr).mean() / 16000)
         return int(lvl * 100)
 
-    def listen_once(self):
+    def listen_once(self, on_partial=None):
+        on_partial = on_partial or self.on_partial
+        if self.streaming or on_partial:
+            return self._listen_streaming(on_partial)
+
         buf = []
-        silence = 0
         speaking = False
+        self.vad.reset()
+        self.endpointer.reset()
 
         for _ in range(200):
             data = self.stream.read(self.chunk, exception_on_overflow=False)
@@ -53,19 +140,18 @@ class FasterWhisperRecognizer:
             if self.on_level:
                 self.on_level(self._amp(data))
 
-            arr = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-            vol = abs(arr).mean()
+            pcm = np.frombuffer(data, dtype=np.int16)
+            is_speech = self.vad.update(pcm)
+            arr = pcm.astype(np.float32)
 
             if not speaking:
-                if vol > 200:     # start talking
-                    speaking = True
-                    buf.append(arr)
-            else:
-                buf.append(arr)
-                if vol < 100:
-                    silence += 1
-                    if silence > 10:  # end of speech
-                        break
+                if not is_speech:
+                    continue
+                speaking = True   # start talking
+
+            buf.append(arr)
+            if self.endpointer.update(is_speech):  # end of speech
+                break
 
         if not buf:
             return ""
@@ -75,6 +161,131 @@ class FasterWhisperRecognizer:
         segments, _ = self._model.transcribe(audio, beam_size=1)
         return " ".join([seg.text for seg in segments]).strip()
 
+    # ------------------------------------------------------------
+    # Streaming mode
+    # ------------------------------------------------------------
+    def _decode_words(self, audio, offset_s, prompt, stop=None):
+        """Word timings for `audio`; stops early (between segments) once `stop` is set."""
+        segments, _ = self._model.transcribe(
+            audio,
+            beam_size=1,
+            word_timestamps=True,
+            initial_prompt=prompt or None,
+            condition_on_previous_text=False,
+        )
+        words = []
+        for seg in segments:  # lazy: each iteration decodes the next segment
+            if stop is not None and stop.is_set():
+                break
+            for w in (seg.words or []):
+                words.append((offset_s + w.start, offset_s + w.end, w.word))
+        return words
+
+    def _listen_streaming(self, on_partial=None):
+        sr = self.sample_rate
+        audio = self._audio
+        agree = _LocalAgreement()
+        lock = threading.Lock()
+        kick = threading.Event()
+        done = threading.Event()
+        filled = [0]  # samples captured so far (append-only)
+
+        def _emit():
+            if on_partial:
+                try: on_partial(agree.committed_text(), agree.tentative_text())
+                except Exception: pass
+
+        def _worker():
+            # Re-decode [committed tail .. now] whenever the capture loop kicks us.
+            while not done.is_set():
+                if not kick.wait(0.05):
+                    continue
+                kick.clear()
+                with lock:
+                    start_s = max(0.0, agree.committed_end - 0.5)
+                    prompt = agree.committed_text()[-200:]
+                end = filled[0]
+                start = int(start_s * sr)
+                if end - start < sr // 2:
+                    continue
+                # own copy: a late decode must not read the buffer the next
+                # listen_once is already filling
+                window = audio[start:end].copy()
+                try:
+                    words = self._decode_words(window, start_s, prompt, stop=done)
+                except Exception as e:
+                    print("[FasterWhisper] streaming decode failed:", e)
+                    continue
+                if done.is_set():
+                    break  # final pass owns the result now
+                with lock:
+                    agree.insert(words)
+                    partial = f"{agree.committed_text()} {agree.tentative_text()}"
+                self.endpointer.set_partial(partial)
+                _emit()
+
+        worker = threading.Thread(target=_worker, daemon=True, name="fw-stream")
+        worker.start()
+
+        speaking = False
+        chunks = 0
+        self.vad.reset()
+        self.endpointer.reset()
+        try:
+            for _ in range(self.max_chunks * 2):
+                data = self.stream.read(self.chunk, exception_on_overflow=False)
+
+                if self.on_level:
+                    self.on_level(self._amp(data))
+
+                pcm = np.frombuffer(data, dtype=np.int16)
+                is_speech = self.vad.update(pcm)
+
+                if not speaking:
+                    if not is_speech:
+                        continue
+                    speaking = True
+                ended = self.endpointer.update(is_speech)
+
+                pos = filled[0]
+                audio[pos:pos + len(pcm)] = pcm
+                audio[pos:pos + len(pcm)] *= (1.0 / 32768.0)
+                filled[0] = pos + len(pcm)
+                chunks += 1
+
+                if ended or chunks >= self.max_chunks:  # end of speech
+                    break
+                if chunks % self.step_chunks == 0:
+                    kick.set()
+        finally:
+            # Not joined: a partial decode still in flight is discarded when it
+            # returns (done is set) and runs on its own copy of the audio, so
+            # the final pass below never waits for it.
+            done.set()
+
+        if not filled[0]:
+            return ""
+
+        # Finalize: decode only the audio after the committed words.
+        with lock:
+            start_s = max(0.0, agree.committed_end - 0.5)
+            prompt = agree.committed_text()[-200:]
+            committed = list(agree.committed)
+        start = int(start_s * sr)
+        try:
+            tail = self._decode_words(audio[start:filled[0]], start_s, prompt)
+        except Exception as e:
+            print("[FasterWhisper] final decode failed:", e)
+            tail = []
+        end_s = committed[-1][1] if committed else 0.0
+        tail = [w for w in tail if (w[0] + w[1]) / 2.0 >= end_s]
+
+        text = "".join(w[2] for w in committed + tail).strip()
+        if on_partial:
+            try: on_partial(text, "")
+            except Exception: pass
+        return text
+
     def pause(self):
         try: self.stream.stop_stream()
         except: pass
@@ -87,6 +298,7 @@ class FasterWhisperRecognizer:
         try:
             self.stream.stop_stream()
             self.stream.close()
-            self.pa.terminate()
+            if self.pa:
+                self.pa.terminate()
         except:
             pass
@@ -4,26 +4,39 @@ import time
 import numpy as np
 import sounddevice as sd
 
-try:
-    import noisereduce as nr
-    # _HAS_NR = True
-    # Disable NR for speed (user requested lower latency)
-    _HAS_NR = False
-except ImportError:
-    _HAS_NR = False
-    print("[Leopard] 'noisereduce' not found. Noise reduction disabled.")
-
 from pvleopard import create
 
+from ..audio.level import level_from_mean_abs, mean_abs
+from .denoise import StreamingDenoiser
+from .endpoint import AdaptiveEndpointer
+from .vad import AdaptiveVAD
+
+
+def create_leopard_engine(access_key=None, attempts=3):
+    """Create a pvleopard engine, retrying transient init failures."""
+    key = (access_key if access_key is not None else os.getenv("PICOVOICE_LEOPARD_KEY", "")).strip()
+    if not key:
+        raise RuntimeError("PICOVOICE_LEOPARD_KEY missing in .env")
+
+    for attempt in range(attempts):
+        try:
+            return create(access_key=key)
+        except Exception as e:
+            print(f"[Leopard] Initialization attempt {attempt+1} failed: {e}")
+            time.sleep(0.15)
+
+    raise RuntimeError(f"Failed to initialize Leopard engine after {attempts} attempts.")
+
 
 class LeopardRecognizer:
     """
     Optimized Leopard Offline STT
     - Faster reaction time
     - Better accuracy via:
-        * Noise reduction (optional)
+        * Streaming noise suppression during capture (src/stt/denoise.py)
         * Gain normalization
-        * VAD-based buffering
+        * Adaptive VAD-based buffering (src/stt/vad.py)
+        * Adaptive end-of-speech timeout (src/stt/endpoint.py)
         * Start-padding fix
     """
 
@@ -33,89 +46,145 @@ class LeopardRecognizer:
         device_index=None,
         sample_rate=16000,
         frame_ms=30,
-        start_threshold=4,        # more sensitive
-        silence_threshold=3,      # slightly below start threshold
-        silence_ms=250,           # faster stop → lower latency
+        silence_ms=200,           # end-of-speech timeout for short commands (grows for long ones)
         min_seconds=0.2,         # accept short commands
         max_seconds=6.0,          # limit long recordings
-        language="en"
+        language="en",
+        stream=None,              # optional pre-opened audio source
+        vad=None,                 # optional AdaptiveVAD (shared noise floor)
+        engine=None,              # optional resident engine (not deleted on close)
+        denoise=None,             # streaming spectral subtraction; None = STT_DENOISE env (on)
+        endpointer=None,          # optional AdaptiveEndpointer (e.g. with an is_complete hook)
+        on_utterance=None,        # optional callback(raw int16 PCM) per transcribed utterance
     ):
         self.on_level = on_level
         self.sample_rate = sample_rate
         self.frame_samples = int(sample_rate * (frame_ms / 1000.0))
-        self.start_threshold = start_threshold
-        self.silence_threshold = silence_threshold
         self.silence_frames_to_stop = max(1, int(silence_ms / frame_ms))
         self.min_frames = int((min_seconds * sample_rate) / self.frame_samples)
         self.max_frames = int((max_seconds * sample_rate) / self.frame_samples)
 
         self.language = language
 
+        # Speech start/stop decisions (adaptive noise floor + hysteresis)
+        self.vad = vad or AdaptiveVAD(sample_rate=sample_rate, frame_samples=self.frame_samples)
+        self.endpointer = endpointer or AdaptiveEndpointer(chunk_ms=frame_ms, short_silence_ms=silence_ms)
+
+        # Noise suppression runs per frame while capturing (one frame of lag),
+        # so nothing is left to do after the endpoint but flush the last frame.
+        if denoise is None:
+            denoise = os.getenv("STT_DENOISE", "1").strip() != "0"
+        self.denoiser = StreamingDenoiser(hop_samples=self.frame_samples) if denoise else None
+
         # ---------------------------
         #  Leopard Engine
         # ---------------------------
-        key = os.getenv("PICOVOICE_LEOPARD_KEY", "").strip()
-        if not key:
-            raise RuntimeError("PICOVOICE_LEOPARD_KEY missing in .env")
+        # A caller-supplied engine (see src/stt/pool.py) outlives this
+        # recognizer; one we create ourselves is deleted in close().
+        self._owns_engine = engine is None
+        self.engine = engine if engine is not None else create_leopard_engine()
 
-        self.engine = None
-        for attempt in range(3):
-            try:
-                self.engine = create(access_key=key)
-                break
-            except Exception as e:
-                print(f"[Leopard] Initialization attempt {attempt+1} failed: {e}")
-                time.sleep(0.15)
-                
-        if not self.engine:
-            raise RuntimeError("Failed to initialize Leopard engine after 3 attempts.")
+        # ---------------------------
+        # Capture buffers (preallocated once per recognizer)
+        # ---------------------------
+        # Layout: [ start pad | (max_frames + 1) * frame_samples ]
+        # The pad stays zero forever and doubles as Leopard's start-padding,
+        # so the engine input is a plain slice of this buffer. The extra frame
+        # holds the denoiser's flushed last hop.
+        self.pad_samples = 1600  # ~100ms silence (fixes Leopard's first-word cut)
+        self._pcm = np.zeros(self.pad_samples + (self.max_frames + 1) * self.frame_samples, dtype=np.int16)
+        self._abs = np.empty(self.frame_samples, dtype=np.float32)  # per-frame scratch
+
+        # Raw (un-denoised, un-normalized) copy of the utterance for on_utterance
+        # consumers such as passive speaker verification; only filled when set.
+        # The callback gets a view of this reused buffer and must copy it.
+        self.on_utterance = on_utterance
+        self._raw = None
+        self._raw_end = 0
 
         # ---------------------------
         # Audio System (SoundDevice)
         # ---------------------------
         self.device_index = device_index
-        # We will create the stream on demand or keep it open?
-        # PyAudio allows explicit open. SD is similar.
-        self._stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=1,
-            dtype='int16',
-            blocksize=self.frame_samples,
-            device=self.device_index
-        )
+        self._stream = None
+        self.open_stream(stream)
+
+    def open_stream(self, source=None):
+        """
+        Open (or re-open after close_stream()) the audio stream. The engine is untouched.
+        source: caller-provided audio source (anything with sd.InputStream's
+        read/start/stop/close, e.g. a shared-capture AudioReader); otherwise a
+        private sd.InputStream is opened.
+        """
+        if self._stream is not None:
+            return
+        if source is not None:
+            self._stream = source
+        else:
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype='int16',
+                blocksize=self.frame_samples,
+                device=self.device_index
+            )
         self._stream.start()
 
+    def prime_noise(self, pcm: np.ndarray):
+        """
+        Seed the noise profile (denoiser and VAD floor) from audio recorded just
+        before the session, e.g. the wake word's rolling buffer (int16 or float).
+        """
+        if self.denoiser is not None:
+            self.denoiser.prime(pcm)
+        x = np.asarray(pcm)
+        if x.dtype != np.int16:
+            x = np.clip(x * 32768.0, -32768, 32767).astype(np.int16)
+        self.vad.prime(x)
+
     # ============================================================
-    # Helper: compute mic level (0–100)
+    # Helper: per-frame energy (computed once, no allocations)
     # ============================================================
+    def _frame_energy(self, frame_int16: np.ndarray) -> float:
+        """Mean absolute int16 amplitude of one frame.
+
+        |x| is written into a preallocated float32 scratch buffer so the level
+        meter, the VAD and the peak tracker all share a single pass.
+        """
+        return mean_abs(frame_int16, self._abs)
+
+    @staticmethod
+    def _level_from_energy(amp_int: float) -> int:
+        """Mean abs int16 amplitude -> mic level (0–100), boosted for UI."""
+        return level_from_mean_abs(amp_int)
+
     def _amp_level(self, frame_int16: np.ndarray) -> int:
-        # frame_int16 is already int16 numpy array
-        f = frame_int16.astype(np.float32) / 32768.0
-        amp = float(np.mean(np.abs(f)))  
-        return int(min(1.0, amp * 3.0) * 100)
+        return self._level_from_energy(self._frame_energy(frame_int16))
 
     # ============================================================
     # READ AUDIO UNTIL USER FINISHES SPEAKING
     # ============================================================
-    def listen_once(self) -> str:
-        if self._stream is None:
-            return ""
-
+    def _capture(self):
+        """
+        Record one utterance into the preallocated buffer.
+        Returns (end_idx, peak): speech occupies self._pcm[pad_samples:end_idx] and
+        peak is its max absolute sample value. end_idx == pad_samples means no speech.
+        """
         speaking = False
-        silence_count = 0
         frames = 0
-        buf = [] # list of numpy arrays
-
-        try:
-            # Do NOT auto-restart stream here. 
-            # If it is paused (inactive), we should respect that or throw/return.
-            if not self._stream.active:
-                # If stream is inactive, we can't read. 
-                # Should we return empty immediately?
-                # Yes, returning empty lets the loop check for typing_busy_evt.
-                return ""
-        except:
-            pass
+        pos = self.pad_samples
+        peak = 0.0
+        self.vad.reset()
+        self.endpointer.reset()
+        denoiser = self.denoiser
+        if denoiser is not None:
+            denoiser.reset()
+        raw = None
+        if self.on_utterance is not None:
+            if self._raw is None:
+                self._raw = np.zeros(self.max_frames * self.frame_samples, dtype=np.int16)
+            raw = self._raw
+        raw_end = 0
 
         while frames < self.max_frames:
             try:
@@ -131,85 +200,104 @@ class LeopardRecognizer:
                 print("[Leopard] Stream read error:", e)
                 break
 
-            # data is (frames, channels) e.g. (512, 1) result is 2D
-            frame = data.flatten() # 1D int16 array
-            
+            # data is (frames, channels) e.g. (480, 1); take a 1D view, no copy
+            frame = data[:, 0] if data.ndim > 1 else data
             frames += 1
 
+            # 'amp_int' is the mean absolute value of the int16 samples,
+            # shared by the UI level and the peak tracker below.
+            amp_int = self._frame_energy(frame)
+            is_speech = self.vad.update(frame)
+
             # UI mic level update
             if self.on_level:
                 try:
-                    self.on_level(self._amp_level(frame))
+                    self.on_level(self._level_from_energy(amp_int))
                 except:
                     pass
 
-            # VAD check
-            f_float = frame.astype(np.float32)
-            amp_int = np.mean(np.abs(f_float)) # mean abs of int16 values
-
-            # Scale amp to match previous PyAudio threshold logic (approx)
-            # PyAudio bytes -> frombuffer -> mean(abs) 
-            # If start_threshold=4 means int16 value ~4 (very sensitive?)
-            # Or 4%? The original code did:
-            # f = frombuffer(frame)...; amp = mean(abs(f))
-            # Wait, original code:
-            # f = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
-            # amp = np.mean(np.abs(f))
-            # Yes, so 'amp' is mean absolute value of int16 samples.
-            
+            # Denoise every frame (pre-speech too, to keep the overlap state and
+            # learn the noise from leading silence); output lags by one frame.
+            if denoiser is not None:
+                cleaned = denoiser.process(frame, update_noise=not speaking and not is_speech)
+
             # --------------------------
             # VAD START
             # --------------------------
             if not speaking:
-                if amp_int >= self.start_threshold:
-                    speaking = True
-                    buf.append(frame)
+                if not is_speech:
+                    continue
+                speaking = True
+
+            # VAD STOP condition (timeout adapts to utterance length / pauses)
+            ended = self.endpointer.update(is_speech)
+
+            if raw is not None:
+                raw[raw_end:raw_end + len(frame)] = frame
+                raw_end += len(frame)
+
+            # Copy the frame straight into the capture buffer
+            if denoiser is not None:
+                pos, peak = self._store(cleaned, pos, peak)
             else:
-                buf.append(frame)
+                n = len(frame)
+                self._pcm[pos:pos + n] = frame
+                pos += n
+                peak = max(peak, float(self._abs[:n].max()))
+
+            if ended and frames >= self.min_frames:
+                break
+
+        if denoiser is not None and speaking:
+            pos, peak = self._store(denoiser.flush(), pos, peak)
+
+        self._raw_end = raw_end
+        return pos, peak
+
+    def _store(self, cleaned: np.ndarray, pos: int, peak: float):
+        """Append one denoised (float32) frame to the capture buffer; update the peak."""
+        n = len(cleaned)
+        self._pcm[pos:pos + n] = cleaned
+        np.abs(cleaned, out=self._abs[:n])
+        return pos + n, max(peak, float(self._abs[:n].max()))
 
-                # VAD STOP condition
-                if amp_int < self.silence_threshold:
-                    silence_count += 1
-                    if silence_count >= self.silence_frames_to_stop and frames >= self.min_frames:
-                        break
-                else:
-                    silence_count = 0
+    def listen_once(self) -> str:
+        if self._stream is None:
+            return ""
+
+        try:
+            # Do NOT auto-restart stream here. 
+            # If it is paused (inactive), we should respect that or throw/return.
+            if not self._stream.active:
+                # If stream is inactive, we can't read. 
+                # Should we return empty immediately?
+                # Yes, returning empty lets the loop check for typing_busy_evt.
+                return ""
+        except:
+            pass
+
+        end_idx, peak = self._capture()
 
         # No speech captured
-        if not buf:
+        if end_idx <= self.pad_samples:
             return ""
 
         # ============================================================
-        # PROCESS AUDIO CLEANING
+        # PROCESS AUDIO CLEANING (in place on the capture buffer)
         # ============================================================
-        
-        # Concatenate all frames
-        if not buf:
-            return ""
-        
-        pcm = np.concatenate(buf).astype(np.float32)
+        speech = self._pcm[self.pad_samples:end_idx]
 
-        # Step 1: Noise Reduction (major accuracy boost)
-        if _HAS_NR:
-            try:
-                pcm = nr.reduce_noise(y=pcm, sr=self.sample_rate)
-            except Exception:
-                pass
+        # Step 1: Noise suppression already happened frame-by-frame in _capture().
 
         # Step 2: Gain Normalization (avoids too-quiet speech)
-        max_val = np.max(np.abs(pcm))
-        if max_val > 0:
-            pcm = pcm / max_val
-
-        # Step 3: Restore int16
-        pcm_int16 = (pcm * 32767).astype(np.int16)
+        # Scales to full int16 range directly, truncating like astype(int16).
+        if peak > 0:
+            np.multiply(speech, 32767.0 / peak, out=speech, casting="unsafe")
 
-        # Step 4: Start-padding (fixes Leopard's first-word cut issue)
-        pad = np.zeros(1600, dtype=np.int16)  # ~100ms silence
-        pcm_int16 = np.concatenate([pad, pcm_int16])
-
-        # Convert to list for pvleopard
-        pcm_list = pcm_int16.tolist()
+        # Step 3: Start-padding is already in front of the speech (self._pcm[:pad]).
+        # memoryview hands pvleopard a zero-copy view of the buffer instead of
+        # materializing a list of Python ints.
+        pcm_view = memoryview(self._pcm[:end_idx])
 
         # ============================================================
         # Run Leopard
@@ -217,7 +305,7 @@ class LeopardRecognizer:
         try:
             import time
             start = time.time()
-            transcript, words = self.engine.process(pcm_list)
+            transcript, words = self.engine.process(pcm_view)
             end = time.time()
             print("[MEASURE] STT engine latency:", end - start)
         except Exception as e:
@@ -232,6 +320,12 @@ class LeopardRecognizer:
             if avg_conf < 0.35:
                 return ""
 
+        if text and self.on_utterance is not None:
+            try:
+                self.on_utterance(self._raw[:self._raw_end])
+            except Exception as e:
+                print("[LeopardRecognizer] on_utterance error:", e)
+
         return text
 
 
@@ -257,7 +351,8 @@ class LeopardRecognizer:
         except Exception:
             pass
 
-    def close(self):
+    def close_stream(self):
+        """Release the microphone but keep the engine loaded."""
         try:
             if self._stream:
                 self._stream.stop()
@@ -265,8 +360,11 @@ class LeopardRecognizer:
         except:
             pass
         self._stream = None
-        
-        if self.engine:
+
+    def close(self):
+        self.close_stream()
+
+        if self.engine and self._owns_engine:
             self.engine.delete()
             self.engine = None
 
@@ -0,0 +1,100 @@
+# src/stt/model_manager.py
+"""
+Background loading of the configured STT model.
+
+Every recognizer loads its model lazily in its first constructor, so without
+this the first voice session after startup stalls while weights are read.
+STTModelManager.start() kicks the load off on a daemon thread at process
+start; sessions call wait() (showing a status while it blocks) and the load
+time is available as `load_ms` for metrics.
+
+The engine is start()'s argument, else STT_ENGINE (leopard | faster-whisper |
+whisper-cpp | vosk, default leopard). Callers that always use one engine
+(main.py's voice loop uses the Leopard pool) should pass it explicitly so a
+different STT_ENGINE can't preload a model nobody uses.
+"""
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+
+def _load_leopard():
+    from .pool import leopard_pool
+    leopard_pool.warm()
+
+
+def _load_faster_whisper():
+    from .faster_whisper_recognizer import FasterWhisperRecognizer
+    if FasterWhisperRecognizer._model is None:
+        FasterWhisperRecognizer._load_model()
+
+
+def _load_whisper_cpp():
+    from .whisper_recognizer import SpeechRecognizer
+    SpeechRecognizer._preload_model()
+
+
+def _load_vosk():
+    from .vosk_recognizer import VoskRecognizer
+    VoskRecognizer._load_model()
+
+
+LOADERS = {
+    "leopard": _load_leopard,
+    "faster-whisper": _load_faster_whisper,
+    "whisper-cpp": _load_whisper_cpp,
+    "vosk": _load_vosk,
+}
+
+
+class STTModelManager:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.engine = None
+        self.future = None
+        self.ready = threading.Event()  # set once the load finished (even if it failed)
+        self.load_ms = None
+        self.error = None
+
+    def start(self, engine=None) -> Future:
+        """Begin loading `engine` (default: STT_ENGINE) on a background thread. Idempotent."""
+        with self._lock:
+            if self.future is not None:
+                return self.future
+            self.engine = (engine or os.getenv("STT_ENGINE", "leopard")).strip().lower()
+            self.future = Future()
+            threading.Thread(target=self._run, daemon=True, name="stt-preload").start()
+            return self.future
+
+    def _run(self):
+        loader = LOADERS.get(self.engine)
+        t0 = time.time()
+        try:
+            if loader is None:
+                raise ValueError(f"unknown STT_ENGINE {self.engine!r}")
+            loader()
+            self.load_ms = (time.time() - t0) * 1000
+            print(f"[MEASURE] STT model load ({self.engine}): {self.load_ms:.1f} ms")
+            self.future.set_result(self.engine)
+        except Exception as e:
+            self.load_ms = (time.time() - t0) * 1000
+            self.error = e
+            print(f"[STT] {self.engine} preload failed:", e)
+            self.future.set_exception(e)
+        finally:
+            self.ready.set()
+
+    def wait(self, timeout=None) -> bool:
+        """
+        Block until the preload finished. Returns True if the model is loaded;
+        False on timeout or failure (the recognizer will then load it itself).
+        Starts the load if nobody did.
+        """
+        self.start()
+        if not self.ready.wait(timeout):
+            return False
+        return self.error is None
+
+
+model_manager = STTModelManager()
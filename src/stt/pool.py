@@ -0,0 +1,107 @@
+# src/stt/pool.py
+"""
+Process-wide pool that keeps the Leopard engine (and its recognizer buffers
+and VAD noise floor) resident across voice sessions.
+
+A voice session only opens the microphone stream on acquire() and closes it
+again on release(); pvleopard.create() runs once per access key/config
+instead of once per wake word.
+"""
+import os
+import threading
+import time
+
+from .leopard_recognizer import LeopardRecognizer, create_leopard_engine
+
+
+class LeopardPool:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engine = None
+        self._engine_key = None
+        self._rec = None
+        self._rec_config = None
+        self._in_use = False
+
+    # ------------------------------------------------------------
+    def _ensure_engine(self, key: str):
+        """Create the engine, or rebuild it when the access key changed. Lock held."""
+        if self._engine is not None and self._engine_key == key:
+            return
+        self._drop_engine()
+        t0 = time.time()
+        self._engine = create_leopard_engine(key)
+        self._engine_key = key
+        print(f"[MEASURE] Leopard engine load: {(time.time() - t0) * 1000:.1f} ms")
+
+    def _drop_engine(self):
+        if self._rec is not None:
+            try: self._rec.close_stream()
+            except Exception: pass
+            self._rec = None
+            self._rec_config = None
+        if self._engine is not None:
+            try: self._engine.delete()
+            except Exception: pass
+            self._engine = None
+            self._engine_key = None
+
+    # ------------------------------------------------------------
+    def warm(self):
+        """Load the engine ahead of the first session (safe to call from a thread)."""
+        key = os.getenv("PICOVOICE_LEOPARD_KEY", "").strip()
+        with self._lock:
+            if not self._in_use:
+                self._ensure_engine(key)
+
+    def acquire(self, on_level=None, device_index=None, stream=None, **kwargs) -> LeopardRecognizer:
+        """
+        Return a recognizer with an open mic stream (`stream` if given, e.g. a
+        shared-capture reader, else a private sd.InputStream).
+        The resident recognizer is reused while the key and config match;
+        if it's already checked out, a standalone recognizer is returned.
+        """
+        key = os.getenv("PICOVOICE_LEOPARD_KEY", "").strip()
+        config = (device_index, tuple(sorted(kwargs.items())))
+
+        with self._lock:
+            if self._in_use:
+                print("[LeopardPool] Resident recognizer busy — creating a standalone one.")
+                return LeopardRecognizer(on_level=on_level, device_index=device_index, stream=stream, **kwargs)
+
+            self._ensure_engine(key)
+            if self._rec is not None and self._rec_config != config:
+                try: self._rec.close_stream()
+                except Exception: pass
+                self._rec = None
+
+            if self._rec is None:
+                self._rec = LeopardRecognizer(
+                    on_level=on_level, device_index=device_index, engine=self._engine,
+                    stream=stream, **kwargs
+                )
+                self._rec_config = config
+            else:
+                self._rec.on_level = on_level
+                self._rec.open_stream(stream)
+
+            self._in_use = True
+            return self._rec
+
+    def release(self, rec: LeopardRecognizer):
+        """Close the mic stream; the engine stays loaded for the next session."""
+        with self._lock:
+            if rec is self._rec:
+                rec.close_stream()
+                self._in_use = False
+                return
+        # standalone recognizer from a busy pool
+        rec.close()
+
+    def shutdown(self):
+        with self._lock:
+            self._drop_engine()
+            self._in_use = False
+
+
+leopard_pool = LeopardPool()
@@ -0,0 +1,157 @@
+# src/stt/vad.py
+"""
+Adaptive voice activity detection shared by all STT recognizers.
+
+Every chunk handed to AdaptiveVAD.update() is split into fixed analysis
+windows and three features are computed for all windows at once:
+
+  * energy (dBFS) relative to a tracked noise floor (SNR)
+  * zero-crossing rate
+  * spectral flatness (1.0 = white noise, ~0 = strongly voiced / tonal)
+
+Speech START needs a voiced-looking window (high SNR, low flatness, moderate
+ZCR) for `start_ms`. Once in speech, the state only drops when SNR falls below
+the lower `stop_snr_db`, so fricatives and trailing syllables don't flap the
+decision (hysteresis). The noise floor follows quiet windows quickly downward
+and slowly upward, so a fan switching on raises the floor instead of
+triggering STT.
+"""
+import math
+import numpy as np
+
+_EPS = 1e-10
+
+
+def frame_features(windows: np.ndarray):
+    """
+    Vectorized features for a (n_windows, window_len) int16/float array.
+    Returns (energy_dbfs, zcr, flatness), each shaped (n_windows,).
+    """
+    x = windows.astype(np.float32) / 32768.0 if windows.dtype == np.int16 else windows.astype(np.float32)
+    n = x.shape[1]
+
+    power = np.mean(x * x, axis=1)
+    energy_db = 10.0 * np.log10(power + _EPS)
+
+    signs = np.signbit(x)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(max(1, n - 1))
+
+    spec = np.abs(np.fft.rfft(x * _hann(n), axis=1)) ** 2 + _EPS
+    flatness = np.exp(np.mean(np.log(spec), axis=1)) / np.mean(spec, axis=1)
+
+    return energy_db, zcr, flatness
+
+
+_HANN_CACHE = {}
+
+
+def _hann(n: int) -> np.ndarray:
+    w = _HANN_CACHE.get(n)
+    if w is None:
+        w = _HANN_CACHE[n] = np.hanning(n).astype(np.float32)
+    return w
+
+
+class AdaptiveVAD:
+    """
+    Noise-floor tracking VAD with hysteresis.
+
+    update(chunk) -> bool is called once per audio chunk read from the mic and
+    returns whether the chunk belongs to speech. `started` is True for the
+    chunk on which speech began. The noise floor survives reset(), so a
+    recognizer keeps its calibration across listen_once() calls.
+    """
+
+    def __init__(
+        self,
+        sample_rate=16000,
+        frame_samples=480,        # analysis window (chunks are split into these)
+        start_snr_db=10.0,        # SNR to enter speech
+        stop_snr_db=5.0,          # SNR to stay in speech (hysteresis)
+        start_ms=30,              # voiced evidence needed before triggering
+        min_speech_dbfs=-60.0,    # absolute gate: never trigger below this
+        max_flatness=0.45,        # start needs a non-noise-like spectrum
+        max_zcr=0.35,             # start needs a non-hiss zero-crossing rate
+        floor_down=0.5,           # floor smoothing when energy drops (fast)
+        floor_up=0.03,            # floor smoothing when energy rises (slow)
+        floor_up_speech=0.002,    # creep while "in speech" (recovers from step noise)
+        initial_floor_dbfs=None,  # seed; None = first window
+    ):
+        self.sample_rate = sample_rate
+        self.frame_samples = int(frame_samples)
+        self.start_snr_db = start_snr_db
+        self.stop_snr_db = stop_snr_db
+        self.start_windows = max(1, int(math.ceil(start_ms * sample_rate / 1000.0 / self.frame_samples)))
+        self.min_speech_dbfs = min_speech_dbfs
+        self.max_flatness = max_flatness
+        self.max_zcr = max_zcr
+        self.floor_down = floor_down
+        self.floor_up = floor_up
+        self.floor_up_speech = floor_up_speech
+
+        self.noise_floor_db = initial_floor_dbfs
+        self.in_speech = False
+        self.started = False
+        self._voiced_run = 0
+
+    # ------------------------------------------------------------
+    def reset(self):
+        """Forget the speech state for a new utterance (keeps the noise floor)."""
+        self.in_speech = False
+        self.started = False
+        self._voiced_run = 0
+
+    def prime(self, pcm: np.ndarray):
+        """Seed the noise floor from known non-speech audio (e.g. leading silence)."""
+        windows = self._windows(pcm)
+        if len(windows):
+            energy_db, _, _ = frame_features(windows)
+            self.noise_floor_db = float(np.percentile(energy_db, 20))
+
+    def _windows(self, chunk: np.ndarray) -> np.ndarray:
+        chunk = np.asarray(chunk).reshape(-1)
+        n = len(chunk) // self.frame_samples
+        if n == 0:
+            return chunk[:0].reshape(0, self.frame_samples)
+        return chunk[:n * self.frame_samples].reshape(n, self.frame_samples)
+
+    # ------------------------------------------------------------
+    def update(self, chunk: np.ndarray) -> bool:
+        windows = self._windows(chunk)
+        self.started = False
+        if not len(windows):
+            return self.in_speech
+
+        energy_db, zcr, flatness = frame_features(windows)
+        if self.noise_floor_db is None:
+            self.noise_floor_db = float(energy_db[0])
+
+        voiced = (flatness <= self.max_flatness) & (zcr <= self.max_zcr) & (energy_db >= self.min_speech_dbfs)
+
+        for e, v in zip(energy_db.tolist(), voiced.tolist()):
+            snr = e - self.noise_floor_db
+            if not self.in_speech:
+                if v and snr >= self.start_snr_db:
+                    self._voiced_run += 1
+                    if self._voiced_run >= self.start_windows:
+                        self.in_speech = True
+                        self.started = True
+                else:
+                    self._voiced_run = 0
+            else:
+                if snr < self.stop_snr_db:
+                    self.in_speech = False
+                    self._voiced_run = 0
+            self._track_floor(e)
+
+        return self.in_speech
+
+    def _track_floor(self, energy_db: float):
+        floor = self.noise_floor_db
+        if energy_db < floor:
+            a = self.floor_down
+        elif self.in_speech:
+            a = self.floor_up_speech
+        else:
+            a = self.floor_up
+        self.noise_floor_db = floor + a * (energy_db - floor)
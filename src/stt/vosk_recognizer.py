@@ -1,29 +1,62 @@
 import os
 import json
+import time
 import numpy as np
 import pyaudio
 from vosk import Model, KaldiRecognizer
 
+from .vad import AdaptiveVAD
+
+
+def grammar_result_confident(res, min_conf=0.6) -> bool:
+    """True if a grammar-mode Result() (with SetWords) is trustworthy."""
+    text = res.get("text", "")
+    words = res.get("result") or []
+    if not text or "[unk]" in text or not words:
+        return False
+    return sum(w.get("conf", 0.0) for w in words) / len(words) >= min_conf
+
+
 class VoskRecognizer:
     _loaded_model = None
 
-    def __init__(self, model_path=None, on_level=None):
+    def __init__(self, model_path=None, on_level=None, vad=None, max_utterance_s=10.0,
+                 command_vocab=None, command_min_conf=0.6, stream=None):
         self.on_level = on_level
         self.rate = 16000
         self.chunk = 4000
+        self.max_utterance_s = max_utterance_s
+        self._listeners = []
 
-        model_path = model_path or os.getenv("VOSK_MODEL")
-
-        if VoskRecognizer._loaded_model is None:
-            print("[VOSK] Loading model once:", model_path)
-            VoskRecognizer._loaded_model = Model(model_path)
+        # Command mode: grammar-constrained decoding over a CommandVocabulary
+        # (src/stt/command_grammar.py), falling back to open vocabulary when
+        # the grammar result is low-confidence.
+        self.command_vocab = command_vocab
+        self.command_min_conf = command_min_conf
+        self._command_rec = None
+        self._command_sig = None
+        # 25ms analysis windows, 10 per chunk
+        self.vad = vad or AdaptiveVAD(sample_rate=self.rate, frame_samples=400)
 
-        self.model = VoskRecognizer._loaded_model
+        self.model = VoskRecognizer._load_model(model_path)
         self.rec = KaldiRecognizer(self.model, self.rate)
 
-        self.pa = pyaudio.PyAudio()
-        self.stream = None
-        self._open_stream()
+        # Audio input; `stream` may be any pre-opened PyAudio-style source
+        # (e.g. FileAudioSource(...).as_pyaudio() for benchmarks)
+        self._external_stream = stream is not None
+        self.pa = None if stream is not None else pyaudio.PyAudio()
+        self.stream = stream
+        if stream is None:
+            self._open_stream()
+
+    @classmethod
+    def _load_model(cls, model_path=None):
+        """Load the Vosk model once per process (also used by the background preloader)."""
+        if cls._loaded_model is None:
+            model_path = model_path or os.getenv("VOSK_MODEL")
+            print("[VOSK] Loading model once:", model_path)
+            cls._loaded_model = Model(model_path)
+        return cls._loaded_model
 
     def _open_stream(self):
         if self.stream:
@@ -41,27 +74,163 @@ class VoskRecognizer:
             frames_per_buffer=self.chunk
         )
 
-    def listen_once(self):
+    # ------------------------------------------------------------
+    # Grammar-constrained command mode
+    # ------------------------------------------------------------
+    def set_command_vocabulary(self, vocab):
+        """Enable command mode with `vocab` (None switches back to open vocabulary)."""
+        self.command_vocab = vocab
+        self._command_rec = None
+        self._command_sig = None
+
+    def _command_recognizer(self):
+        """Grammar recognizer, rebuilt only when the vocabulary signature changes."""
+        if self.command_vocab is None:
+            return None
+        sig = self.command_vocab.signature()
+        if self._command_rec is None or sig != self._command_sig:
+            t0 = time.time()
+            phrases = self.command_vocab.phrases()
+            rec = KaldiRecognizer(self.model, self.rate, json.dumps(phrases + ["[unk]"], ensure_ascii=False))
+            rec.SetWords(True)
+            self._command_rec, self._command_sig = rec, sig
+            print(f"[VOSK] Command grammar built: {len(phrases)} entries in {(time.time() - t0) * 1000:.0f} ms")
+        return self._command_rec
+
+    def _decode_open(self, chunks) -> str:
+        """Re-decode a buffered utterance with the free-form model."""
+        self.rec.Reset()
+        for c in chunks:
+            self.rec.AcceptWaveform(c)
+        return json.loads(self.rec.FinalResult()).get("text", "").strip()
+
+    def _finalize(self, rec, res, chunks) -> str:
+        if rec is self.rec or grammar_result_confident(res, self.command_min_conf):
+            return res.get("text", "").replace("[unk]", "").strip()
+        print("[VOSK] Low grammar confidence — falling back to open vocabulary.")
+        return self._decode_open(chunks)
+
+    # ------------------------------------------------------------
+    # Partial-result streaming
+    # ------------------------------------------------------------
+    def add_partial_listener(self, fn):
+        """
+        Subscribe to hypotheses as they are decoded: fn(text, t_seconds, final).
+        Use for live captions; partials are revised until the final one.
+        """
+        self._listeners.append(fn)
+
+    def remove_partial_listener(self, fn):
+        try: self._listeners.remove(fn)
+        except ValueError: pass
+
+    def _publish(self, text, t, final, on_partial=None):
+        for fn in ([on_partial] if on_partial else []) + list(self._listeners):
+            try: fn(text, t, final)
+            except Exception as e: print("[VOSK] partial listener failed:", e)
+
+    def stream_partials(self, max_utterance_s=None, timeout_s=None, on_partial=None):
+        """
+        Generator over one utterance: yields ("partial", text, t) whenever
+        Kaldi's PartialResult() changes and finally ("final", text, t).
+        t is seconds of audio since the call started.
+
+        max_utterance_s bounds an utterance from its first speech chunk
+        (FinalResult() is forced after it); timeout_s ends the call if no
+        speech starts in time (nothing is yielded).
+        """
+        max_utt = self.max_utterance_s if max_utterance_s is None else max_utterance_s
+        chunk_s = self.chunk / float(self.rate)
+
+        # Kaldi does its own endpointing once speech is flowing; the VAD only
+        # keeps background noise out of the decoder until speech starts.
+        # The chunk before the trigger is fed as well so onsets aren't clipped.
+        rec = self._command_recognizer() or self.rec
+        rec.Reset()
+        self.vad.reset()
+        speaking = False
+        prev = None
+        last_partial = ""
+        chunks = []  # utterance audio, kept for the open-vocabulary fallback
+        speech_t0 = 0.0
+        t = 0.0
         while True:
             try:
                 data = self.stream.read(self.chunk, exception_on_overflow=False)
             except Exception:
+                if self._external_stream:
+                    return  # caller-owned source ended
                 # Stream closed -> reopen safely
                 self._open_stream()
                 continue
+            t += chunk_s
 
             if self.on_level:
                 lvl = int(np.abs(np.frombuffer(data, dtype=np.int16)).mean() / 300)
                 self.on_level(min(100, lvl))
 
-            if self.rec.AcceptWaveform(data):
-                res = json.loads(self.rec.Result())
-                return res.get("text", "").strip()
+            if not speaking:
+                if not self.vad.update(np.frombuffer(data, dtype=np.int16)):
+                    prev = data
+                    if timeout_s is not None and t >= timeout_s:
+                        return
+                    continue
+                speaking = True
+                speech_t0 = t - chunk_s
+                if prev:
+                    rec.AcceptWaveform(prev)
+                    if rec is not self.rec:
+                        chunks.append(prev)
+
+            if rec is not self.rec:
+                chunks.append(data)
+
+            if rec.AcceptWaveform(data):
+                res = json.loads(rec.Result())
+                heard = res.get("text", "").strip()
+                if rec is self.rec:
+                    heard = heard.replace("[unk]", "").strip()
+                # In grammar mode an out-of-vocabulary utterance comes back as
+                # "[unk]": exactly what the open-vocabulary fallback is for.
+                # Only an empty result after it counts as noise.
+                if heard:
+                    text = self._finalize(rec, res, chunks)
+                    if text:
+                        self._publish(text, t, True, on_partial)
+                        yield "final", text, t
+                        return
+                # noise-only segment: re-arm the VAD
+                self.vad.reset()
+                speaking = False
+                prev = None
+                last_partial = ""
+                chunks = []
+                continue
+
+            partial = json.loads(rec.PartialResult()).get("partial", "").strip()
+            if partial and partial != last_partial:
+                last_partial = partial
+                self._publish(partial, t, False, on_partial)
+                yield "partial", partial, t
+
+            if max_utt and t - speech_t0 >= max_utt:
+                res = json.loads(rec.FinalResult())
+                text = self._finalize(rec, res, chunks)
+                self._publish(text, t, True, on_partial)
+                yield "final", text, t
+                return
+
+    def listen_once(self, on_partial=None, timeout_s=None):
+        for kind, text, _t in self.stream_partials(timeout_s=timeout_s, on_partial=on_partial):
+            if kind == "final":
+                return text
+        return ""
 
     def close(self):
         try:
             self.stream.stop_stream()
             self.stream.close()
-            self.pa.terminate()
+            if self.pa:
+                self.pa.terminate()
         except:
             pass
@@ -4,6 +4,8 @@ import numpy as np
 import pyaudio
 from whispercpp import Whisper
 
+from .vad import AdaptiveVAD
+
 class SpeechRecognizer:
     """
     Whisper.cpp speech recognizer using mic streaming.
@@ -13,17 +15,20 @@ class SpeechRecognizer:
     _model = None
     _loaded_name = None
 
-    def __init__(self, on_level=None):
+    def __init__(self, on_level=None, vad=None, stream=None):
         self.on_level = on_level
         self.sample_rate = 16000
         self.chunk = 1600  # 100 ms chunks
+        # 20ms analysis windows, 5 per chunk
+        self.vad = vad or AdaptiveVAD(sample_rate=self.sample_rate, frame_samples=320)
 
         # Load model once globally
         SpeechRecognizer._preload_model()
 
-        # Audio input
-        self.pa = pyaudio.PyAudio()
-        self.stream = self.pa.open(
+        # Audio input; `stream` may be any pre-opened PyAudio-style source
+        # (e.g. FileAudioSource(...).as_pyaudio() for benchmarks)
+        self.pa = None if stream is not None else pyaudio.PyAudio()
+        self.stream = stream if stream is not None else self.pa.open(
             format=pyaudio.paInt16,
             channels=1,
             rate=self.sample_rate,
@@ -55,7 +60,7 @@ class SpeechRecognizer:
     # ---------------------------------------------------------
     def listen_once(self):
         """
-        Simple VAD-like mechanism:
+        Adaptive VAD (src/stt/vad.py):
         - Detect voice start
         - Record until silence
         - Transcribe
@@ -64,6 +69,7 @@ class SpeechRecognizer:
         frames = []
         silence = 0
         started = False
+        self.vad.reset()
 
         for _ in range(200):  # ~20 seconds max
             data = self.stream.read(self.chunk, exception_on_overflow=False)
@@ -72,18 +78,19 @@ class SpeechRecognizer:
             if self.on_level:
                 self.on_level(self._amp_level(data))
 
-            arr = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-            vol = np.abs(arr).mean()
+            pcm = np.frombuffer(data, dtype=np.int16)
+            is_speech = self.vad.update(pcm)
+            arr = pcm.astype(np.float32)
 
             # start speech
             if not started:
-                if vol > 150:
+                if is_speech:
                     started = True
                     frames.append(arr)
                 continue
             else:
                 frames.append(arr)
-                if vol < 80:
+                if not is_speech:
                     silence += 1
                     if silence > 8:  # 800 ms silence
                         break
@@ -118,6 +125,7 @@ class SpeechRecognizer:
         try:
             self.stream.stop_stream()
             self.stream.close()
-            self.pa.terminate()
+            if self.pa:
+                self.pa.terminate()
         except Exception:
             pass
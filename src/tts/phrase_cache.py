@@ -0,0 +1,243 @@
+# src/tts/phrase_cache.py
+"""
+Pre-rendered audio for the assistant's fixed phrases.
+
+"Access granted.", "Let me look that up online..." and the list summaries
+were synthesized from scratch every time. PhraseCache renders a phrase once
+through the engine's save-to-file path (tts_local.render_to_file), keyed by
+(text, voice, rate), and plays the PCM through sounddevice afterwards, which
+starts in milliseconds instead of spinning up the synthesizer. Playback has
+its own sd.OutputStream, so it neither cuts off nor is cut off by the
+module-level sd.play() the earcons use.
+
+  * fixed phrases   registered up front (add_fixed), rendered in the
+                    background and persisted under TTS_PHRASE_CACHE_DIR
+                    (default .tts_cache) so later runs only load them
+  * dynamic phrases anything else spoken `promote_after` times is rendered
+                    too and kept in memory, LRU-bounded to
+                    TTS_PHRASE_CACHE_SIZE entries
+  * metrics         hits / misses / hit_rate over every lookup; repeat counts
+                    for promotion are kept for at most `max_seen` recent texts
+
+All methods except lookup bookkeeping are meant to run on the TTS thread
+(see worker.TTSWorker), which owns the engine.
+"""
+import collections
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from .tts_local import render_to_file, voice_signature
+
+
+class _ClipPlayer:
+    """One float32 mono output stream, reused for every clip (opened per sample rate)."""
+
+    def __init__(self):
+        self._stream = None
+        self._sr = None
+        self._lock = threading.Lock()
+        self._pcm = None
+        self._pos = 0
+        self._done = threading.Event()
+        self._interrupted = False
+
+    def _callback(self, outdata, frames, time_info, status):
+        with self._lock:
+            pcm = self._pcm
+            n = 0 if pcm is None else min(frames, len(pcm) - self._pos)
+            if n > 0:
+                outdata[:n, 0] = pcm[self._pos:self._pos + n]
+                self._pos += n
+            outdata[n:] = 0
+            if pcm is not None and self._pos >= len(pcm):
+                self._pcm = None
+                self._done.set()
+
+    def play(self, pcm, sr) -> float:
+        """Play to the end (or until stop()); returns start latency in ms."""
+        import sounddevice as sd
+
+        t0 = time.perf_counter()
+        if self._stream is None or self._sr != sr:
+            self.close()
+            self._stream = sd.OutputStream(samplerate=sr, channels=1, dtype="float32",
+                                           callback=self._callback)
+            self._sr = sr
+        mono = np.ascontiguousarray(pcm if pcm.ndim == 1 else pcm.mean(axis=1), dtype=np.float32)
+        duration_s = len(mono) / sr  # not from self._pcm: stop()/the callback may clear it
+        with self._lock:
+            self._pcm = mono
+            self._pos = 0
+            self._interrupted = False
+            self._done.clear()
+        self._stream.start()
+        start_ms = (time.perf_counter() - t0) * 1000
+        finished = self._done.wait(duration_s + 2.0)
+        if self._interrupted or not finished:
+            self._stream.abort()
+        else:
+            self._stream.stop()  # drains what is already buffered
+        return start_ms
+
+    def stop(self):
+        """Interrupt the clip being played (any thread)."""
+        with self._lock:
+            if self._pcm is not None:
+                self._pcm = None
+                self._interrupted = True
+            self._done.set()
+
+    def close(self):
+        if self._stream is not None:
+            try: self._stream.close()
+            except Exception: pass
+        self._stream = None
+
+
+class PhraseCache:
+    def __init__(self, cache_dir=None, max_dynamic=None, promote_after=2, max_chars=120, max_seen=256):
+        self.cache_dir = cache_dir or os.getenv("TTS_PHRASE_CACHE_DIR", ".tts_cache")
+        self.max_dynamic = int(max_dynamic if max_dynamic is not None else os.getenv("TTS_PHRASE_CACHE_SIZE", "64"))
+        self.promote_after = int(promote_after)
+        self.max_chars = int(max_chars)
+        self.max_seen = int(max_seen)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._fixed_texts = set()
+        self._fixed = {}                              # key -> (pcm, sr)
+        self._dynamic = collections.OrderedDict()     # key -> (pcm, sr), LRU order
+        self._seen = collections.OrderedDict()        # dynamic text -> times spoken uncached, LRU order
+        self._signature = None
+        self._player = _ClipPlayer()
+
+    # ------------------------------------------------------------
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate,
+                "fixed": len(self._fixed), "dynamic": len(self._dynamic)}
+
+    def _key(self, text: str):
+        if self._signature is None:
+            self._signature = voice_signature()
+        if self._signature is None:
+            return None
+        return (text, *self._signature)
+
+    def _file_for(self, key) -> str:
+        digest = hashlib.sha1("|".join(map(str, key)).encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{digest}.wav")
+
+    # ------------------------------------------------------------
+    def add_fixed(self, texts):
+        """Register phrases that are always cached (render with ensure_fixed())."""
+        with self._lock:
+            self._fixed_texts.update(t.strip() for t in texts if t and t.strip())
+
+    def pending_fixed(self):
+        """Registered fixed phrases not loaded yet (for the current voice/rate)."""
+        if self._key("") is None:
+            return []
+        with self._lock:
+            return [t for t in sorted(self._fixed_texts) if self._key(t) not in self._fixed]
+
+    def ensure_fixed(self, text: str) -> bool:
+        """Load a fixed phrase from disk, or render and persist it."""
+        key = self._key(text)
+        if key is None:
+            return False
+        path = self._file_for(key)
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = path + ".tmp.wav"
+            if not render_to_file(text, tmp):
+                return False
+            os.replace(tmp, path)
+        clip = self._load(path)
+        if clip is None:
+            return False
+        with self._lock:
+            self._fixed[key] = clip
+        return True
+
+    def render_dynamic(self, text: str) -> bool:
+        key = self._key(text)
+        if key is None:
+            return False
+        fd, tmp = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            clip = self._load(tmp) if render_to_file(text, tmp) else None
+        finally:
+            try: os.remove(tmp)
+            except OSError: pass
+        if clip is None:
+            return False
+        with self._lock:
+            self._dynamic[key] = clip
+            self._dynamic.move_to_end(key)
+            while len(self._dynamic) > self.max_dynamic:
+                self._dynamic.popitem(last=False)
+            self._seen.pop(text, None)
+        return True
+
+    @staticmethod
+    def _load(path: str):
+        try:
+            import soundfile as sf
+            pcm, sr = sf.read(path, dtype="float32", always_2d=False)
+        except Exception as e:
+            print(f"[TTS] Could not load cached phrase {path}: {e}")
+            return None
+        return (pcm, int(sr)) if len(pcm) else None
+
+    # ------------------------------------------------------------
+    def lookup(self, text: str):
+        """(pcm, sr) if cached; counts a hit or a miss."""
+        key = self._key(text)
+        with self._lock:
+            clip = None
+            if key is not None:
+                clip = self._fixed.get(key)
+                if clip is None:
+                    clip = self._dynamic.get(key)
+                    if clip is not None:
+                        self._dynamic.move_to_end(key)
+            if clip is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if text not in self._fixed_texts and len(text) <= self.max_chars:
+                    self._seen[text] = self._seen.pop(text, 0) + 1
+                    while len(self._seen) > self.max_seen:
+                        self._seen.popitem(last=False)
+            return clip
+
+    def should_render(self, text: str) -> bool:
+        """Miss on a dynamic phrase that keeps coming back (and is short enough)."""
+        if len(text) > self.max_chars or self.max_dynamic <= 0:
+            return False
+        with self._lock:
+            return text in self._fixed_texts or self._seen.get(text, 0) >= self.promote_after
+
+    def render(self, text: str) -> bool:
+        return self.ensure_fixed(text) if text in self._fixed_texts else self.render_dynamic(text)
+
+    # ------------------------------------------------------------
+    def play(self, clip) -> float:
+        """Play cached PCM to the end (or until stop()); returns start latency in ms."""
+        pcm, sr = clip
+        return self._player.play(pcm, sr)
+
+    def stop(self):
+        self._player.stop()
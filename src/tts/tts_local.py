@@ -104,6 +104,60 @@ def _pyttsx3_say(text: str):
     except Exception:
         pass
 
+# ----------------- Offline rendering (phrase cache) -----------------
+def voice_signature():
+    """(voice id, rate) of the engine speak_now() uses, or None if unavailable."""
+    if _IS_WIN:
+        try:
+            import comtypes.client
+            global _sapi_voice
+            if _sapi_voice is None:
+                _sapi_voice = comtypes.client.CreateObject("SAPI.SpVoice")
+            return (str(_sapi_voice.Voice.Id), int(_sapi_voice.Rate))
+        except Exception:
+            return None
+    e = _init_engine()
+    if e is None:
+        return None
+    try:
+        return (str(e.getProperty("voice")), int(e.getProperty("rate")))
+    except Exception:
+        return None
+
+def render_to_file(text: str, path: str) -> bool:
+    """
+    Synthesize `text` into an audio file instead of the speakers, with the
+    same voice and rate as speak_now(). Returns False if the engine can't.
+    """
+    if not text:
+        return False
+    try:
+        if _IS_WIN:
+            import comtypes.client
+            if voice_signature() is None:
+                return False
+            # a separate voice, so the live one keeps its speaker output
+            voice = comtypes.client.CreateObject("SAPI.SpVoice")
+            voice.Voice = _sapi_voice.Voice
+            voice.Rate = _sapi_voice.Rate
+            stream = comtypes.client.CreateObject("SAPI.SpFileStream")
+            stream.Open(path, 3)  # SSFMCreateForWrite
+            try:
+                voice.AudioOutputStream = stream
+                voice.Speak(text, 0)
+            finally:
+                stream.Close()
+        else:
+            e = _init_engine()
+            if e is None:
+                return False
+            e.save_to_file(text, path)
+            e.runAndWait()
+        return os.path.exists(path) and os.path.getsize(path) > 0
+    except Exception as ex:
+        print(f"[TTS] render_to_file failed: {ex}")
+        return False
+
 # ----------------- Public API -----------------
 def speak_now(text: str):
     """Blocking speak. Uses PowerShell on Windows, pyttsx3 elsewhere."""
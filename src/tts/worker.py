@@ -0,0 +1,237 @@
+# src/tts/worker.py
+"""
+One thread owns the TTS engine and speaks requests from a priority queue.
+
+speak_now() runs on whichever thread calls it: the voice loop, the typed
+command thread and on_wake could overlap on the engine or queue behind each
+other in arbitrary order, and every caller was blocked for its utterance.
+Here callers only enqueue:
+
+    fut = tts_worker.say("Access denied.", priority=PRIORITY_ALERT)
+    fut.result()                  # optional: wait for the end of speech
+
+  * priority      lower runs first (alerts, then answers, then list summaries);
+                  FIFO within a priority
+  * coalescing    the same text already queued returns the queued future; a
+                  request with `key` replaces queued requests with that key
+                  (e.g. repeated "Let me look that up…" status lines)
+  * cancellation  cancel(request_id) drops a queued request or stops the one
+                  being spoken; cancel_all() does both for everything
+
+The future resolves to True when the text was spoken to the end, False if it
+was interrupted; it is cancelled if it never started.
+
+With a PhraseCache (TTS_PHRASE_CACHE=1, the default), cached phrases are
+played as PCM instead of synthesized, and phrase rendering runs here too, as
+PRIORITY_BACKGROUND jobs between utterances (the engine is never shared).
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from .phrase_cache import PhraseCache
+from .tts_local import speak_now, stop_all_tts
+
+PRIORITY_ALERT = 0
+PRIORITY_ANSWER = 1
+PRIORITY_SUMMARY = 2
+PRIORITY_BACKGROUND = 9   # cache rendering: only when nothing is waiting to be said
+
+
+class SpeechFuture(Future):
+    def __init__(self, request_id: int, text: str):
+        super().__init__()
+        self.request_id = request_id
+        self.text = text
+
+
+class _Request:
+    __slots__ = ("future", "priority", "key", "on_start", "on_end", "queued_at", "interrupted", "job")
+
+    def __init__(self, future, priority, key, on_start, on_end, job=None):
+        self.job = job
+        self.future = future
+        self.priority = priority
+        self.key = key
+        self.on_start = on_start
+        self.on_end = on_end
+        self.queued_at = time.perf_counter()
+        self.interrupted = False
+
+
+class TTSWorker:
+    def __init__(self, speak_fn=speak_now, stop_fn=stop_all_tts, phrases: Optional[PhraseCache] = None):
+        self._speak = speak_fn
+        self._stop_engine = stop_fn
+        self.phrases = phrases
+        self._cond = threading.Condition()
+        self._heap = []                     # (priority, seq, _Request)
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._current: Optional[_Request] = None
+        self._thread = None
+
+    def start(self):
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="tts")
+                self._thread.start()
+        return self
+
+    # ------------------------------------------------------------
+    def say(self, text: str, priority=PRIORITY_ANSWER, key=None,
+            on_start: Optional[Callable[[], None]] = None,
+            on_end: Optional[Callable[[], None]] = None) -> SpeechFuture:
+        """Queue `text`; returns immediately. on_start/on_end run on the TTS thread."""
+        text = (text or "").strip()
+        fut = SpeechFuture(next(self._ids), text)
+        if not text:
+            fut.set_result(True)
+            return fut
+
+        self.start()
+        with self._cond:
+            for _p, _s, req in self._heap:
+                if req.job is not None or req.future.done():
+                    continue
+                if req.future.text == text:
+                    return req.future  # already queued
+                if key is not None and req.key == key:
+                    req.future.cancel()  # superseded
+            heapq.heappush(self._heap, (priority, next(self._seq), _Request(fut, priority, key, on_start, on_end)))
+            self._cond.notify_all()  # the worker, not just a wait_idle() caller
+        return fut
+
+    def submit(self, fn: Callable[[], object], priority=PRIORITY_BACKGROUND) -> Future:
+        """Run fn() on the TTS thread (engine work such as phrase rendering)."""
+        fut = Future()
+        self.start()
+        with self._cond:
+            heapq.heappush(self._heap, (priority, next(self._seq), _Request(fut, priority, None, None, None, job=fn)))
+            self._cond.notify_all()
+        return fut
+
+    def warm_phrases(self, texts):
+        """Register fixed phrases and load/render them in the background."""
+        if self.phrases is None:
+            return
+        self.phrases.add_fixed(texts)
+
+        def _schedule():
+            for t in self.phrases.pending_fixed():
+                self.submit(lambda t=t: self.phrases.ensure_fixed(t))
+        self.submit(_schedule)
+
+    def _stop(self):
+        if self.phrases is not None:
+            self.phrases.stop()
+        self._stop_engine()
+
+    def cancel(self, request_id: int) -> bool:
+        with self._cond:
+            cur = self._current
+            if cur is not None and cur.future.request_id == request_id:
+                cur.interrupted = True
+                self._stop()
+                return True
+            for _p, _s, req in self._heap:
+                if req.job is None and req.future.request_id == request_id:
+                    return req.future.cancel()
+        return False
+
+    def cancel_all(self):
+        """Drop everything queued and stop the current utterance."""
+        with self._cond:
+            for _p, _s, req in self._heap:
+                if req.job is None:
+                    req.future.cancel()
+            self._heap = [item for item in self._heap if item[2].job is not None]
+            heapq.heapify(self._heap)
+            cur = self._current
+            if cur is not None:
+                cur.interrupted = True
+            self._cond.notify_all()
+        try:
+            self._stop()
+        except Exception:
+            pass
+
+    @property
+    def speaking(self) -> bool:
+        """True while an utterance is being spoken (not just queued)."""
+        return self._current is not None
+
+    @property
+    def busy(self) -> bool:
+        return self._current is not None or any(r.job is None and not r.future.done() for _p, _s, r in self._heap)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is being spoken or queued; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self.busy, timeout)
+
+    # ------------------------------------------------------------
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                _p, _s, req = heapq.heappop(self._heap)
+                if not req.future.set_running_or_notify_cancel():
+                    self._cond.notify_all()  # may have been the last thing "queued"
+                    continue  # cancelled or superseded while queued
+                if req.job is None:
+                    self._current = req
+
+            if req.job is not None:
+                try:
+                    req.future.set_result(req.job())
+                except Exception as e:
+                    req.future.set_exception(e)
+                continue
+
+            wait_ms = (time.perf_counter() - req.queued_at) * 1000
+            print(f"[MEASURE] TTS queue wait: {wait_ms:.1f} ms (priority {req.priority})")
+            error = None
+            try:
+                if req.on_start:
+                    try: req.on_start()
+                    except Exception: pass
+                self._say(req.future.text)
+            except Exception as e:
+                error = e
+            with self._cond:
+                self._current = None
+                self._cond.notify_all()
+            # on_end first, so a caller waiting on the future sees its effects
+            if req.on_end:
+                try: req.on_end()
+                except Exception: pass
+            if error is not None:
+                req.future.set_exception(error)
+            else:
+                req.future.set_result(not req.interrupted)
+
+    def _say(self, text: str):
+        """Cached PCM if available, else the engine (and maybe render it for next time)."""
+        phrases = self.phrases
+        clip = phrases.lookup(text) if phrases is not None else None
+        if clip is not None:
+            try:
+                start_ms = phrases.play(clip)
+                print(f"[MEASURE] Cached phrase start: {start_ms:.1f} ms (hit rate {phrases.hit_rate:.0%})")
+                return
+            except Exception as e:
+                print("[TTS] Cached playback failed, synthesizing:", e)
+        self._speak(text)
+        if phrases is not None and phrases.should_render(text):
+            self.submit(lambda: phrases.render(text))
+
+
+tts_worker = TTSWorker(
+    phrases=PhraseCache() if os.getenv("TTS_PHRASE_CACHE", "1").strip() != "0" else None,
+)
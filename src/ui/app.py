@@ -2,6 +2,8 @@
 import math
 import tkinter as tk
 
+from .level_meter import LevelMeter
+
 # ── Design Tokens (Reference Image Match) ─────────────────────────────────────
 BG_MAIN        = "#004163"
 BG_BUBBLE      = "#002238"
@@ -123,13 +125,14 @@ class AvatarWidget(tk.Canvas):
 
 # ── Layered EKG Wave ───────────────────────────────────────────────────────────
 class EKGWidget(tk.Canvas):
-    def __init__(self, master, height=48):
+    def __init__(self, master, height=48, meter=None):
         super().__init__(master, height=height, bg=BG_MAIN, highlightthickness=0)
         self.current_w = 400
         self.view_height = height
         self.buf = [0.0] * 64
         self.tick = 0
         self.level = 0.0
+        self.meter = meter  # LevelMeter polled once per animation frame
         self.bind("<Configure>", self._on_configure)
         self.after(36, self._run)
 
@@ -146,6 +149,8 @@ class EKGWidget(tk.Canvas):
     def _run(self):
         try:
             self.tick += 1
+            if self.meter is not None:
+                self.level = min(1.0, self.meter.poll() / 100.0)
             spike = 0.8 * self.level if (self.level > 0.35 and self.tick % 7 == 0) else 0.0
             val = min(1.0, self.level * 0.7 + spike + 0.08 * math.sin(self.tick * 0.6))
             self.buf.pop(0)
@@ -178,6 +183,7 @@ class AssistantUI:
         self._bubbles      = []
         self._placeholder  = "Type command..."
         self._ph_color     = CYAN_DIM
+        self.mic_level     = LevelMeter()
 
         root.title(title)
         root.configure(bg=BG_MAIN)
@@ -243,7 +249,7 @@ class AssistantUI:
         footer = tk.Frame(self.main_container, bg=BG_MAIN, padx=15, pady=15)
         footer.pack(side="bottom", fill="x")
 
-        self.ekg = EKGWidget(footer, height=44)
+        self.ekg = EKGWidget(footer, height=44, meter=self.mic_level)
         self.ekg.pack(side="top", fill="x", pady=(0, 15))
 
         inp_row = tk.Frame(footer, bg=BG_MAIN)
@@ -309,7 +315,8 @@ class AssistantUI:
         self.root.after(0, _do)
 
     def update_mic_level(self, level):
-        self.root.after(0, lambda: self.ekg.update_level(level))
+        # Any thread; no Tk event — the EKG polls the meter at its frame rate.
+        self.mic_level.push(level)
 
     def set_text_input_locked(self, locked: bool, hint: str = None):
         def _do():
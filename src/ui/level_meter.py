@@ -0,0 +1,31 @@
+# src/ui/level_meter.py
+"""
+Mic level hand-off between audio threads and the UI.
+
+Audio threads call push(level) for every frame; it only stores a number (no
+lock, no Tk call; attribute writes are atomic under the GIL). The EKG widget
+polls at its own frame rate and gets the peak since its last poll, with a
+decaying hold so a quiet frame doesn't make the wave drop instantly.
+A push racing a poll can lose that one frame's value, which is harmless for
+a meter.
+"""
+
+
+class LevelMeter:
+    def __init__(self, decay=0.6):
+        self.decay = decay        # per-poll hold decay (0 = no hold)
+        self._peak = 0.0          # max pushed since the last poll (0..100)
+        self._shown = 0.0
+        self.pushes = 0           # frames received (for metrics)
+
+    def push(self, level):
+        """Called from audio threads; level is 0..100."""
+        self.pushes += 1
+        if level > self._peak:
+            self._peak = level
+
+    def poll(self) -> float:
+        """Called from the UI thread; returns the held level (0..100)."""
+        peak, self._peak = self._peak, 0.0
+        self._shown = max(float(peak), self._shown * self.decay)
+        return self._shown
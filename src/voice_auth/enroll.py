@@ -1,24 +1,21 @@
-import os, pathlib, time, numpy as np, soundfile as sf
+import os, time
 from .recorder import record_seconds
-from .svm_auth import enroll_svm, SR
+from .enrollment import EnrollmentSession
+from .svm_auth import SR
 
 OUT = os.getenv("VOICE_MODEL_PATH", "voice_auth_svm.joblib")
 SAMPLES = int(os.getenv("AUTH_ENROLL_SAMPLES", "5"))
 
 def main():
-    tmpdir = pathlib.Path(".voice_enroll_tmp")
-    tmpdir.mkdir(exist_ok=True)
-    paths = []
+    session = EnrollmentSession(sample_rate=SR)
     print(f"Enrollment: record {SAMPLES} short samples. Speak naturally each time.")
     for i in range(SAMPLES):
         input(f"\n[{i+1}/{SAMPLES}] Press Enter and start speaking…")
-        y = record_seconds(1.6)
-        p = tmpdir / f"enroll_{i+1}.wav"
-        sf.write(p.as_posix(), y, SR)
-        paths.append(p.as_posix())
-        print(f"Saved: {p.name}")
+        y = record_seconds(1.6, sample_rate=SR)
+        session.add(y)
+        print(f"Captured sample {i+1}.")
         time.sleep(0.4)
-    enroll_svm(paths, OUT)
+    session.finish(OUT)
     print(f"\nEnrollment done. Model → {OUT}")
 
 if __name__ == "__main__":
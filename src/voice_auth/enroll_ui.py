@@ -1,14 +1,12 @@
 # src/voice_auth/enroll_ui.py
 import os
 import time
-from pathlib import Path
-from typing import Optional, List
+from typing import Optional
 import tkinter as tk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-import soundfile as sf
 from .recorder import record_seconds
-from .svm_auth import enroll_svm, SR
+from .enrollment import EnrollmentSession
 
 class _EnrollWindow:
     def __init__(self, samples_count=10, sample_seconds=3.0, sample_rate=16000,
@@ -28,8 +26,8 @@ class _EnrollWindow:
             '"Hey Torque, tell me a joke."'
         ]
 
-        self.tmpdir = Path(".voice_enroll_tmp")
-        self.tmpdir.mkdir(exist_ok=True)
+        # features are extracted in the background while the next sample records
+        self._session = EnrollmentSession(sample_rate=self.sample_rate)
 
         self.root = tb.Toplevel(title="AURIS – Voice Match Setup")
         self.root.geometry("640x380")
@@ -70,7 +68,6 @@ class _EnrollWindow:
 
         self._canceled = False
         self._done = False
-        self._wavs: List[str] = []
         self.idx = 1
         
         self.root.protocol("WM_DELETE_WINDOW", self._cancel)
@@ -85,6 +82,7 @@ class _EnrollWindow:
 
     def _cancel(self):
         self._canceled = True
+        self._session.close()
         try: self.root.destroy()
         except Exception: pass
 
@@ -149,10 +147,8 @@ class _EnrollWindow:
         
         self._set_phrase(phrase_to_read)
         self._set_status(f"Recording sample {self.idx}… Speak now.")
-        y = record_seconds(self.sample_seconds, device_index=self.device_index)
-        wav_path = (self.tmpdir / f"enroll_{self.idx}.wav").as_posix()
-        sf.write(wav_path, y, SR)
-        self._wavs.append(wav_path)
+        y = record_seconds(self.sample_seconds, sample_rate=self.sample_rate, device_index=self.device_index)
+        self._session.add(y)
         self.progress["value"] = self.idx
         self._set_status(f"Captured sample {self.idx}.")
         time.sleep(0.3)
@@ -168,7 +164,7 @@ class _EnrollWindow:
         self._set_status("Training Secure Voice Model (Please wait)…")
         self.root.update_idletasks()
         try:
-            enroll_svm(self._wavs, self.model_path)
+            self._session.finish(self.model_path)
             self._set_status("Enrollment complete. Welcome to AURIS.")
             self._say("Enrollment complete.")
             self._done = True
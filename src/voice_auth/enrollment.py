@@ -0,0 +1,153 @@
+# src/voice_auth/enrollment.py
+"""
+In-memory enrollment and incremental model adaptation.
+
+EnrollmentSession replaces "write WAVs to .voice_enroll_tmp, re-read them,
+extract serially, train": each recorded sample is handed over as an array
+and its MFCCs are extracted on a worker pool while the next one is being
+recorded, so finish() only has to train.
+
+SpeakerAdapter keeps an enrolled model current without re-enrolling:
+utterances verified with high confidence (e.g. by PassiveVerifier) are
+added to the model's FeatureReservoir and the model is retrained in the
+background. The reservoir caps the training set, so retraining time stays
+bounded no matter how long the assistant has been in use.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .reservoir import FeatureReservoir, reservoir_path_for
+from .svm_auth import (MODEL_PATH, SR, VOICED_ONLY, extract_mfcc_features, resolve_backend,
+                       train_speaker_model)
+
+
+class EnrollmentSession:
+    def __init__(self, sample_rate=SR, workers=None):
+        self.sample_rate = sample_rate
+        self.voiced_only = VOICED_ONLY
+        self._pool = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                        thread_name_prefix="enroll-mfcc")
+        self._futures = []
+
+    def add(self, y: np.ndarray):
+        """Queue one recorded sample (float audio); returns the feature Future."""
+        fut = self._pool.submit(extract_mfcc_features, np.asarray(y), self.sample_rate, self.voiced_only)
+        self._futures.append(fut)
+        return fut
+
+    def __len__(self):
+        return len(self._futures)
+
+    def finish(self, model_path=MODEL_PATH, backend=None):
+        """Wait for the remaining extractions, train, and save model + reservoir."""
+        backend = resolve_backend(backend)
+        try:
+            t0 = time.perf_counter()
+            clips = [f.result() for f in self._futures]
+            print(f"[MEASURE] Enrollment feature wait: {(time.perf_counter() - t0) * 1000:.1f} ms")
+        finally:
+            self.close()
+        if not clips:
+            raise ValueError("No enrollment samples recorded")
+
+        t0 = time.perf_counter()
+        FeatureReservoir(clips, backend=backend, voiced_only=self.voiced_only).save(model_path)
+        model = train_speaker_model(clips, model_path, backend, self.voiced_only)
+        print(f"[MEASURE] Enrollment training: {(time.perf_counter() - t0) * 1000:.1f} ms")
+        print(f"[Enroll] Speaker model ({backend}) saved -> {model_path}")
+        return model
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class SpeakerAdapter:
+    """
+    Folds verified utterances into an enrolled model.
+
+    offer() extracts features on the caller's thread (a few ms) and returns;
+    every `retrain_every` accepted clips a single background thread retrains
+    on anchors + reservoir and republishes the model (the speaker model cache
+    picks it up by mtime).
+    """
+
+    def __init__(self, model_path=MODEL_PATH, min_confidence=None, max_clips=None,
+                 max_clip_frames=300, retrain_every=3):
+        if min_confidence is None:
+            min_confidence = float(os.getenv("AUTH_ADAPT_MIN_CONFIDENCE", "0.90"))
+        if max_clips is None:
+            max_clips = int(os.getenv("AUTH_ADAPT_MAX_CLIPS", "20"))
+        self.model_path = model_path
+        self.min_confidence = float(min_confidence)
+        self.max_clips = int(max_clips)
+        self.max_clip_frames = int(max_clip_frames)
+        self.retrain_every = max(1, int(retrain_every))
+
+        self.retrain_ms = None
+        self._lock = threading.Lock()
+        self._reservoir = None
+        self._pending = 0
+        self._thread = None
+
+    def _load(self):
+        if self._reservoir is None:
+            if not os.path.exists(reservoir_path_for(self.model_path)):
+                return None  # enrolled before reservoirs existed: re-enroll to adapt
+            self._reservoir = FeatureReservoir.load(self.model_path, self.max_clips)
+        return self._reservoir
+
+    def offer(self, y: np.ndarray, confidence: float, sample_rate=SR) -> bool:
+        """Consider one verified utterance (float audio). Returns True if it was kept."""
+        if confidence < self.min_confidence:
+            return False
+        with self._lock:
+            res = self._load()
+        if res is None:
+            return False
+        feats = extract_mfcc_features(np.asarray(y), sample_rate, res.voiced_only)
+        if len(feats) == 0:
+            return False
+        if len(feats) > self.max_clip_frames:
+            feats = feats[np.linspace(0, len(feats) - 1, self.max_clip_frames).astype(int)]
+
+        with self._lock:
+            if not res.add(feats):
+                return False
+            self._pending += 1
+            if self._pending >= self.retrain_every and not self._training():
+                self._pending = 0
+                self._thread = threading.Thread(target=self._retrain, daemon=True, name="auth-adapt")
+                self._thread.start()
+        return True
+
+    def _training(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _retrain(self):
+        with self._lock:
+            res = self._reservoir
+            clips = res.clips()
+            backend = resolve_backend(res.backend)
+        try:
+            t0 = time.perf_counter()
+            # Reservoir first: if publishing the model fails, the next retrain
+            # still covers these clips, and a published model never has
+            # training data that isn't on disk.
+            with self._lock:
+                res.save(self.model_path)
+            train_speaker_model(clips, self.model_path, backend, res.voiced_only)
+            self.retrain_ms = (time.perf_counter() - t0) * 1000
+            print(f"[MEASURE] Speaker model adaptation: {self.retrain_ms:.1f} ms "
+                  f"({len(res.anchors)} enrolled + {len(res.adapted)} adapted clips)")
+        except Exception as e:
+            print("[Auth] Model adaptation failed:", e)
+
+    def wait(self, timeout=None):
+        """Block until a running retrain finishes (benchmarks / shutdown)."""
+        t = self._thread
+        if t is not None:
+            t.join(timeout)
@@ -0,0 +1,122 @@
+# src/voice_auth/features.py
+"""
+NumPy MFCC front-end for speaker verification.
+
+Produces the same features as python_speech_features.mfcc() with the
+parameters the speaker models were trained on (25 ms / 10 ms rectangular
+frames, pre-emphasis 0.97, 26 mel filters, nfft 512, lifter 22, frame log
+energy in c0), but frames the signal with a strided view instead of fancy
+indexing, and reuses the mel filterbank and a DCT matrix with the lifter
+folded in.
+
+Voiced-frame selection drops silence and low-level tails (the 2.5 s wake
+pre-roll is mostly not speech) before the FFT, so only speech frames are
+transformed and scored.
+"""
+import functools
+
+import numpy as np
+
+EPS = np.finfo(float).eps
+
+
+def _hz2mel(hz):
+    return 2595 * np.log10(1 + hz / 700.)
+
+
+def _mel2hz(mel):
+    return 700 * (10 ** (mel / 2595.0) - 1)
+
+
+def _round_half_up(x: float) -> int:
+    return int(np.floor(x + 0.5))
+
+
+class MfccFrontEnd:
+    def __init__(self, samplerate=16000, winlen=0.025, winstep=0.01, numcep=13, nfilt=26,
+                 nfft=512, preemph=0.97, ceplifter=22, append_energy=True):
+        self.samplerate = samplerate
+        self.frame_len = _round_half_up(winlen * samplerate)
+        self.frame_step = _round_half_up(winstep * samplerate)
+        self.nfft = nfft
+        self.preemph = preemph
+        self.numcep = numcep
+        self.append_energy = append_energy
+        self.fbank_t = self._filterbank(nfilt, nfft, samplerate).T      # (nfft//2+1, nfilt)
+        self.dct_lift = self._dct_lifter(nfilt, numcep, ceplifter)      # (nfilt, numcep)
+
+    @staticmethod
+    def _filterbank(nfilt, nfft, samplerate):
+        mel = np.linspace(_hz2mel(0), _hz2mel(samplerate / 2), nfilt + 2)
+        bins = np.floor((nfft + 1) * _mel2hz(mel) / samplerate)
+        fb = np.zeros((nfilt, nfft // 2 + 1))
+        for j in range(nfilt):
+            lo, mid, hi = bins[j], bins[j + 1], bins[j + 2]
+            up = np.arange(int(lo), int(mid))
+            down = np.arange(int(mid), int(hi))
+            fb[j, up] = (up - lo) / (mid - lo)
+            fb[j, down] = (hi - down) / (hi - mid)
+        return fb
+
+    @staticmethod
+    def _dct_lifter(nfilt, numcep, ceplifter):
+        """Orthonormal DCT-II (first numcep rows) times the sinusoidal lifter, as one matrix."""
+        n = np.arange(nfilt)
+        k = np.arange(numcep)[:, None]
+        dct = np.sqrt(2.0 / nfilt) * np.cos(np.pi * k * (2 * n + 1) / (2 * nfilt))
+        dct[0] /= np.sqrt(2.0)
+        if ceplifter > 0:
+            dct *= (1 + (ceplifter / 2.) * np.sin(np.pi * np.arange(numcep) / ceplifter))[:, None]
+        return np.ascontiguousarray(dct.T)
+
+    def frames(self, y: np.ndarray) -> np.ndarray:
+        """Pre-emphasized, zero-padded frames as a strided (read-only) view."""
+        n = len(y)
+        num = 1 if n <= self.frame_len else 1 + int(np.ceil((n - self.frame_len) / self.frame_step))
+        padded = np.zeros((num - 1) * self.frame_step + self.frame_len)
+        if n:
+            padded[0] = y[0]
+            np.subtract(y[1:], self.preemph * y[:-1], out=padded[1:n])
+        view = np.lib.stride_tricks.sliding_window_view(padded, self.frame_len)
+        return view[::self.frame_step]
+
+    @staticmethod
+    def voiced_mask(frames: np.ndarray, margin=2.3, dynamic_range=6.9, min_frames=25) -> np.ndarray:
+        """
+        Frames whose log energy is `margin` above the noise floor (10th
+        percentile) and within `dynamic_range` of the peak (99th percentile),
+        both in natural-log units (2.3 ~ 10 dB, 6.9 ~ 30 dB). Falls back to the
+        `min_frames` loudest frames when too few pass.
+        """
+        log_e = np.log(np.einsum("ij,ij->i", frames, frames) + EPS)
+        floor, peak = np.percentile(log_e, [10, 99])
+        mask = log_e >= max(floor + margin, peak - dynamic_range)
+        if mask.sum() < min(min_frames, len(log_e)):
+            mask[:] = False
+            mask[np.argsort(log_e)[-min_frames:]] = True
+        return mask
+
+    def mfcc(self, y: np.ndarray, voiced_only=False) -> np.ndarray:
+        """(n_frames, numcep) MFCCs; only voiced frames when voiced_only."""
+        y = np.asarray(y, dtype=np.float64)
+        frames = self.frames(y)
+        if voiced_only:
+            frames = frames[self.voiced_mask(frames)]
+        pspec = np.abs(np.fft.rfft(frames, self.nfft))
+        np.square(pspec, out=pspec)
+        pspec *= 1.0 / self.nfft
+        feat = pspec @ self.fbank_t
+        feat[feat == 0] = EPS
+        np.log(feat, out=feat)
+        out = feat @ self.dct_lift
+        if self.append_energy:
+            energy = pspec.sum(axis=1)
+            energy[energy == 0] = EPS
+            out[:, 0] = np.log(energy)
+        return out
+
+
+@functools.lru_cache(maxsize=4)
+def front_end(samplerate=16000, numcep=13, nfft=512) -> MfccFrontEnd:
+    """Shared front-end per (rate, numcep, nfft): filterbank and DCT built once."""
+    return MfccFrontEnd(samplerate=samplerate, numcep=numcep, nfft=nfft)
@@ -0,0 +1,259 @@
+# src/voice_auth/model_cache.py
+"""
+Speaker-verification model cache and compact on-disk format.
+
+verify_svm() used to joblib.load() the whole OneClassSVM on every wake word.
+Now the model is loaded once (preload() at startup), kept in memory, and
+reloaded only when the file's mtime changes. The trained SVM is also exported
+next to the .joblib as an uncompressed .npz holding just what the decision
+function needs: support vectors, dual coefficients, intercept, gamma and the
+precomputed squared norms of the support vectors. The arrays are read straight
+out of the .npz (no pickle, no sklearn import), and scoring is a pure NumPy
+RBF kernel evaluation.
+
+The arrays are copied into memory rather than memory-mapped: they are small,
+and on Windows a file with a live mapping can't be replaced, which would break
+every in-process re-export (retraining, adaptation) of the same model path.
+
+Enrollment can also produce constant-cost models (see svm_auth.BACKENDS): a
+reduced-set SVM (the full SVM's kernel expansion refitted onto a k-means
+codebook, exported as the support vectors), or a diagonal GMM whose per-frame
+log-likelihood is calibrated so that, like the SVM decision value, 0 is the
+accept/reject boundary. Both are stored in the same .npz layout with a `kind`
+tag.
+
+Every model also records which frames it was trained on (`voiced_only`, see
+features.py), so verification extracts features the same way. Models saved
+without the flag were trained on all frames.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+NPZ_FORMAT = 1
+
+
+def npz_path_for(model_path: str) -> str:
+    return os.path.splitext(model_path)[0] + ".npz"
+
+
+class CompactSVM:
+    """decision_function() of a fitted RBF OneClassSVM from its raw arrays."""
+
+    kind = "ocsvm"
+    voiced_only = False
+
+    def __init__(self, support_vectors, dual_coef, intercept, gamma, sv_sq_norms=None):
+        self.support_vectors = support_vectors           # (n_sv, n_feat)
+        self.dual_coef = np.asarray(dual_coef).reshape(-1)
+        self.intercept = float(intercept)
+        self.gamma = float(gamma)
+        self.sv_sq_norms = (sv_sq_norms if sv_sq_norms is not None
+                            else np.einsum("ij,ij->i", support_vectors, support_vectors))
+
+    @classmethod
+    def from_sklearn(cls, svm):
+        if hasattr(svm, "reduced_set_"):  # svm-reduced backend: k centres replace the SVs
+            centres, weights = svm.reduced_set_
+            return cls(np.ascontiguousarray(centres, dtype=np.float64), weights,
+                       svm.intercept_[0], svm._gamma)
+        sv = np.ascontiguousarray(svm.support_vectors_, dtype=np.float64)
+        return cls(sv, svm.dual_coef_, svm.intercept_[0], svm._gamma)
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        # ||x - sv||^2 = ||x||^2 + ||sv||^2 - 2 x.sv
+        d2 = np.einsum("ij,ij->i", X, X)[:, None] + self.sv_sq_norms[None, :]
+        d2 -= 2.0 * (X @ self.support_vectors.T)
+        np.maximum(d2, 0.0, out=d2)
+        np.multiply(d2, -self.gamma, out=d2)
+        np.exp(d2, out=d2)
+        return d2 @ self.dual_coef + self.intercept
+
+    def arrays(self) -> dict:
+        return {
+            "support_vectors": self.support_vectors,
+            "dual_coef": self.dual_coef,
+            "sv_sq_norms": self.sv_sq_norms,
+            "scalars": np.array([self.intercept, self.gamma]),
+        }
+
+    @classmethod
+    def from_arrays(cls, a: dict):
+        intercept, gamma = (float(v) for v in a["scalars"])
+        return cls(a["support_vectors"], a["dual_coef"], intercept, gamma, a["sv_sq_norms"])
+
+
+class CompactGMM:
+    """
+    Calibrated log-likelihood of a fitted diagonal GaussianMixture.
+
+    decision_function() returns (log p(x) - offset) / scale per frame, where
+    offset/scale come from the enrollment clips (svm_auth._calibrate_gmm), so
+    the mean over an utterance is ~+1 for the enrolled speaker and < 0 once it
+    falls more than one calibration spread below. Cost is O(components x feats)
+    per frame, independent of how much audio was enrolled.
+    """
+
+    kind = "gmm"
+    voiced_only = False
+
+    def __init__(self, means, precisions, log_norm, offset=0.0, scale=1.0):
+        self.means = means                                  # (k, n_feat)
+        self.precisions = precisions                        # (k, n_feat) 1/variance
+        self.log_norm = np.asarray(log_norm).reshape(-1)    # log w_k - 0.5*log|2*pi*Sigma_k|
+        self.offset = float(offset)
+        self.scale = float(scale)
+        # expanded quadratic: sum((x-mu)^2 * p) = x^2.p - 2 x.(mu p) + mu^2.p
+        self._mp = self.means * self.precisions
+        self._const = self.log_norm - 0.5 * np.einsum("ij,ij->i", self._mp, self.means)
+
+    @classmethod
+    def from_sklearn(cls, gmm):
+        if gmm.covariance_type != "diag":
+            raise ValueError("CompactGMM needs covariance_type='diag'")
+        means = np.ascontiguousarray(gmm.means_, dtype=np.float64)
+        prec = np.ascontiguousarray(gmm.precisions_, dtype=np.float64)
+        log_norm = (np.log(gmm.weights_)
+                    - 0.5 * means.shape[1] * np.log(2.0 * np.pi)
+                    + 0.5 * np.log(prec).sum(axis=1))
+        offset, scale = getattr(gmm, "score_calibration_", (0.0, 1.0))
+        return cls(means, prec, log_norm, offset, scale)
+
+    def log_likelihood(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        ll = (X * X) @ self.precisions.T
+        ll *= -0.5
+        ll += X @ self._mp.T
+        ll += self._const[None, :]
+        top = ll.max(axis=1)
+        ll -= top[:, None]
+        np.exp(ll, out=ll)
+        return top + np.log(ll.sum(axis=1))
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        return (self.log_likelihood(X) - self.offset) / self.scale
+
+    def arrays(self) -> dict:
+        return {
+            "means": self.means,
+            "precisions": self.precisions,
+            "log_norm": self.log_norm,
+            "scalars": np.array([self.offset, self.scale]),
+        }
+
+    @classmethod
+    def from_arrays(cls, a: dict):
+        offset, scale = (float(v) for v in a["scalars"])
+        return cls(a["means"], a["precisions"], a["log_norm"], offset, scale)
+
+
+COMPACT_KINDS = {CompactSVM.kind: CompactSVM, CompactGMM.kind: CompactGMM}
+
+
+def compact_from_sklearn(model):
+    """CompactSVM for a OneClassSVM, CompactGMM for a GaussianMixture."""
+    if hasattr(model, "support_vectors_"):
+        compact = CompactSVM.from_sklearn(model)
+    elif hasattr(model, "means_"):
+        compact = CompactGMM.from_sklearn(model)
+    else:
+        raise TypeError(f"Unsupported speaker model: {type(model).__name__}")
+    compact.voiced_only = bool(getattr(model, "voiced_only_", False))  # set by svm_auth
+    return compact
+
+
+# ------------------------------------------------------------
+# .npz I/O
+# ------------------------------------------------------------
+def save_npz(model, path: str):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, kind=np.array(model.kind), format=np.array(NPZ_FORMAT),
+                 voiced_only=np.array(bool(model.voiced_only)), **model.arrays())
+    os.replace(tmp, path)
+
+
+def _read_npz(path: str) -> dict:
+    """All arrays of the .npz, read into memory; the file is closed on return."""
+    with np.load(path) as z:
+        return {k: z[k] for k in z.files}
+
+
+def load_npz(path: str):
+    a = _read_npz(path)
+    kind = str(a["kind"])
+    if kind not in COMPACT_KINDS:
+        raise ValueError(f"{path}: unknown speaker model kind {kind!r}")
+    model = COMPACT_KINDS[kind].from_arrays(a)
+    model.voiced_only = bool(a["voiced_only"]) if "voiced_only" in a else False
+    return model
+
+
+def export_compact(model, model_path: str):
+    """Write the .npz companion of a freshly trained model (called by enrollment)."""
+    save_npz(compact_from_sklearn(model), npz_path_for(model_path))
+
+
+# ------------------------------------------------------------
+# Cache
+# ------------------------------------------------------------
+class SpeakerModelCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # model_path -> (source_path, mtime, model)
+        self.load_ms = None
+
+    def _resolve(self, model_path: str):
+        """Prefer an up-to-date .npz; fall back to the .joblib (and export it)."""
+        npz = npz_path_for(model_path)
+        npz_m = os.path.getmtime(npz) if os.path.exists(npz) else None
+        job_m = os.path.getmtime(model_path) if os.path.exists(model_path) and model_path != npz else None
+        if npz_m is not None and (job_m is None or npz_m >= job_m):
+            return npz, npz_m
+        if job_m is not None:
+            return model_path, job_m
+        raise FileNotFoundError(f"No speaker model found at {model_path}")
+
+    def get(self, model_path: str):
+        src, mtime = self._resolve(model_path)
+        with self._lock:
+            hit = self._entries.get(model_path)
+            if hit and hit[0] == src and hit[1] == mtime:
+                return hit[2]
+
+            t0 = time.perf_counter()
+            if src.endswith(".npz"):
+                model = load_npz(src)
+            else:
+                from joblib import load
+                model = compact_from_sklearn(load(src))
+                try:
+                    save_npz(model, npz_path_for(model_path))
+                    src, mtime = self._resolve(model_path)
+                    model = load_npz(src)
+                except Exception as e:
+                    print("[Auth] Could not write compact model:", e)
+            self.load_ms = (time.perf_counter() - t0) * 1000
+            print(f"[MEASURE] Speaker model load ({os.path.basename(src)}): {self.load_ms:.1f} ms")
+            self._entries[model_path] = (src, mtime, model)
+            return model
+
+    def preload(self, model_path: str):
+        """Load ahead of the first wake word (safe to call from a thread)."""
+        try:
+            return self.get(model_path)
+        except FileNotFoundError:
+            return None
+
+    def invalidate(self, model_path: str = None):
+        with self._lock:
+            if model_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(model_path, None)
+
+
+speaker_models = SpeakerModelCache()
@@ -0,0 +1,120 @@
+# src/voice_auth/passive.py
+"""
+Continuous passive speaker verification.
+
+The wake-time check authenticates a whole voice session. PassiveVerifier
+keeps checking it for free: every utterance LeopardRecognizer has already
+captured for STT is handed over (submit() only copies and enqueues), scored
+with verify_svm() on a worker thread, and folded into a rolling trust score.
+Longer utterances move the score more. When trust falls below the
+revocation threshold, on_revoke(trust) is called once for the session.
+
+Nothing is recorded for this and the voice loop never waits on it. With an
+adapter (enrollment.SpeakerAdapter), confidently verified utterances are
+also offered to it to keep the model current.
+"""
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from .svm_auth import MODEL_PATH, SR, verify_svm
+
+
+class PassiveVerifier:
+    def __init__(self, model_path=MODEL_PATH, on_revoke=None, threshold=None,
+                 tau_s=3.0, min_seconds=0.5, on_score=None, max_pending=4, adapter=None):
+        """
+        threshold: revoke below this trust (AUTH_PASSIVE_THRESHOLD, default 0.45;
+                   kept under the wake-time threshold for hysteresis)
+        tau_s:     an utterance of length d moves trust by 1 - exp(-d / tau_s)
+        on_score:  optional callback(confidence, trust, ms) per scored utterance
+        adapter:   optional SpeakerAdapter fed with utterances of a trusted session
+        """
+        if threshold is None:
+            threshold = float(os.getenv("AUTH_PASSIVE_THRESHOLD", "0.45"))
+        self.model_path = model_path
+        self.on_revoke = on_revoke
+        self.on_score = on_score
+        self.adapter = adapter
+        self.threshold = float(threshold)
+        self.tau_s = float(tau_s)
+        self.min_samples = int(min_seconds * SR)
+
+        self.trust = None
+        self.revoked = False
+        self._session = 0  # results of an earlier session are dropped
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+
+    # ------------------------------------------------------------
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name="auth-passive")
+            self._thread.start()
+        return self
+
+    def begin(self, initial_trust: float):
+        """New authenticated session, seeded with the wake-time confidence."""
+        with self._lock:
+            self._session += 1
+            self.trust = float(initial_trust)
+            self.revoked = False
+
+    def end(self):
+        """Session over: pending and in-flight results are discarded."""
+        with self._lock:
+            self._session += 1
+            self.trust = None
+
+    def submit(self, pcm_int16: np.ndarray):
+        """Queue one captured utterance (int16). Copies; never blocks."""
+        if self.trust is None or self.revoked or len(pcm_int16) < self.min_samples:
+            return
+        item = (self._session, np.array(pcm_int16, dtype=np.int16, copy=True))
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            try: self._queue.get_nowait()  # keep the newest
+            except queue.Empty: pass
+            try: self._queue.put_nowait(item)
+            except queue.Full: pass
+
+    # ------------------------------------------------------------
+    def _run(self):
+        while True:
+            session, pcm = self._queue.get()
+            if session != self._session:
+                continue
+            t0 = time.perf_counter()
+            audio = pcm.astype(np.float32) / 32768.0
+            try:
+                _ok, conf, _thr = verify_svm(audio, self.model_path)
+            except Exception as e:
+                print("[Auth] Passive verification failed:", e)
+                continue
+            ms = (time.perf_counter() - t0) * 1000
+
+            weight = 1.0 - np.exp(-(len(pcm) / SR) / self.tau_s)
+            with self._lock:
+                if session != self._session or self.trust is None:
+                    continue
+                self.trust = float((1.0 - weight) * self.trust + weight * conf)
+                trust = self.trust
+                revoke = not self.revoked and trust < self.threshold
+                if revoke:
+                    self.revoked = True
+
+            print(f"[Auth] passive score={conf:.3f} trust={trust:.3f} ({ms:.1f} ms)")
+            if self.on_score:
+                try: self.on_score(conf, trust, ms)
+                except Exception: pass
+            if revoke and self.on_revoke:
+                try: self.on_revoke(trust)
+                except Exception as e: print("[Auth] on_revoke failed:", e)
+            elif self.adapter is not None and trust >= self.threshold:
+                try: self.adapter.offer(audio, conf)
+                except Exception as e: print("[Auth] Adaptation offer failed:", e)
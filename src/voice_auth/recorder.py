@@ -1,8 +1,17 @@
 import sounddevice as sd
 import numpy as np
 
-def record_seconds(seconds=2.0, sample_rate=16000, device_index=None):
+def record_seconds(seconds=2.0, sample_rate=16000, device_index=None, capture=None):
+    """Record `seconds` of float32 audio. Reads from the shared capture service when one is running."""
     print(f"[Recorder] Recording for {seconds:.1f} seconds...")
+    if capture is not None and capture.running and capture.sample_rate == sample_rate:
+        reader = capture.subscribe("auth")
+        try:
+            data, _ = reader.read(int(seconds * sample_rate), timeout=seconds + 2.0)
+        finally:
+            reader.close()
+        print("[Recorder] Recording complete.")
+        return data[:, 0].astype(np.float32) / 32768.0
     rec = sd.rec(int(seconds * sample_rate), samplerate=sample_rate, channels=1, dtype='float32', device=device_index)
     sd.wait()
     print("[Recorder] Recording complete.")
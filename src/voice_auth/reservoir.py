@@ -0,0 +1,70 @@
+# src/voice_auth/reservoir.py
+"""
+Training-feature reservoir kept next to a speaker model (<model>.reservoir.npz).
+
+Enrollment clips are anchors and are always kept. Clips added later by
+adaptation go into a reservoir of at most `max_clips`, filled by reservoir
+sampling (Algorithm R), so the retained clips stay a uniform sample of
+everything offered and the retraining set has a fixed upper size.
+`voiced_only` is the feature mode every clip was extracted with.
+"""
+import os
+
+import numpy as np
+
+
+def reservoir_path_for(model_path: str) -> str:
+    return os.path.splitext(model_path)[0] + ".reservoir.npz"
+
+
+class FeatureReservoir:
+    def __init__(self, anchors, adapted=None, seen=0, backend="svm", max_clips=20, rng=None,
+                 voiced_only=False):
+        self.anchors = [np.asarray(c, dtype=np.float64) for c in anchors]
+        self.adapted = [np.asarray(c, dtype=np.float64) for c in (adapted or [])]
+        self.seen = int(seen)            # adapted clips offered so far (accepted or not)
+        self.backend = backend
+        self.voiced_only = bool(voiced_only)
+        self.max_clips = int(max_clips)
+        del self.adapted[self.max_clips:]
+        self._rng = rng or np.random.default_rng()
+
+    def add(self, clip: np.ndarray) -> bool:
+        """Offer one adapted clip; returns True if it was kept."""
+        self.seen += 1
+        if len(self.adapted) < self.max_clips:
+            self.adapted.append(clip)
+            return True
+        j = int(self._rng.integers(0, self.seen))
+        if j < self.max_clips:
+            self.adapted[j] = clip
+            return True
+        return False
+
+    def clips(self):
+        return self.anchors + self.adapted
+
+    def n_frames(self) -> int:
+        return int(sum(len(c) for c in self.clips()))
+
+    # ------------------------------------------------------------
+    def save(self, model_path: str):
+        path = reservoir_path_for(model_path)
+        clips = self.clips()
+        lengths = np.array([len(c) for c in clips], dtype=np.int64)
+        frames = np.vstack(clips) if clips else np.zeros((0, 0))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, frames=frames, lengths=lengths, n_anchors=np.array(len(self.anchors)),
+                     seen=np.array(self.seen), backend=np.array(self.backend),
+                     voiced_only=np.array(self.voiced_only))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, model_path: str, max_clips=20):
+        with np.load(reservoir_path_for(model_path)) as a:
+            clips = np.split(a["frames"], np.cumsum(a["lengths"])[:-1]) if len(a["lengths"]) else []
+            n = int(a["n_anchors"])
+            voiced_only = bool(a["voiced_only"]) if "voiced_only" in a.files else False
+            return cls(clips[:n], clips[n:], int(a["seen"]), str(a["backend"]), max_clips,
+                       voiced_only=voiced_only)
@@ -2,25 +2,34 @@
 import os
 import numpy as np
 import soundfile as sf
-from joblib import dump, load
-from python_speech_features import mfcc
+from joblib import dump
 from sklearn.svm import OneClassSVM
 
+from .features import front_end
+from .model_cache import export_compact, speaker_models
+from .reservoir import FeatureReservoir
+
 SR = 16000
 N_MFCC = 20
 MODEL_PATH = "voice_auth_svm.joblib"
+# Train new models on speech frames only (see features.py). The choice is stored
+# in the model and verification follows it, so existing models are unaffected.
+VOICED_ONLY = os.getenv("AUTH_VOICED_FRAMES", "1").strip().lower() not in ("0", "false", "no", "off")
 
 # ---------------- FEATURE EXTRACTION ----------------
-def extract_mfcc_features(y: np.ndarray, sr: int = SR) -> np.ndarray:
+def extract_mfcc_features(y: np.ndarray, sr: int = SR, voiced_only=None) -> np.ndarray:
     """
     Extract MFCC features, keeping the temporal dimension.
+    Same values as python_speech_features.mfcc(y, sr, numcep=N_MFCC, nfft=512),
+    restricted to voiced frames if voiced_only (default: VOICED_ONLY, the
+    setting for new enrollments; scoring a model uses the model's own flag).
     Returns shape: (n_frames, N_MFCC)
     """
     if y.ndim > 1:
         y = np.mean(y, axis=1)
     
     # Extract MFCCs
-    feats = mfcc(y, sr, numcep=N_MFCC, nfft=512)
+    feats = front_end(sr, N_MFCC, 512).mfcc(y, voiced_only=VOICED_ONLY if voiced_only is None else voiced_only)
     return feats
 
 def get_speaker_features(wav_paths):
@@ -37,37 +46,154 @@ def get_speaker_features(wav_paths):
     return stacked_frames
 
 # ---------------- ENROLLMENT ----------------
-def enroll_svm(wav_paths, model_path=MODEL_PATH):
-    """
-    Enroll the speaker by training a One-Class Support Vector Machine 
-    over all MFCC frames collected across the noise conditions.
-    """
-    print(f"Extracting features from {len(wav_paths)} audio samples...")
-    X = get_speaker_features(wav_paths)
+# Speaker model backends, chosen at enrollment (AUTH_MODEL_BACKEND):
+#   svm          OneClassSVM on every frame; verify cost grows with enrolled audio
+#   svm-reduced  the svm model's kernel expansion refitted onto a k-means
+#                codebook of the frames: same boundary and scores, at most
+#                REDUCED_SET_SIZE kernel evaluations per frame
+#   gmm          diagonal GMM, calibrated log-likelihood; cost fixed by GMM_COMPONENTS
+BACKENDS = ("svm", "svm-reduced", "gmm")
+REDUCED_SET_SIZE = int(os.getenv("AUTH_REDUCED_SET_SIZE", "128"))
+GMM_COMPONENTS = int(os.getenv("AUTH_GMM_COMPONENTS", "16"))
 
-    print(f"Training MFCC-SVM (OneClassSVM) on {len(X)} linguistic frames...")
+
+def _fit_svm(X):
     # 'nu' acts as an upper bound on fraction of margin errors (outliers in training set).
     # Since we strictly control training voice, we set this low. But not too low 
     # so we still map a tight boundary.
     svm = OneClassSVM(kernel='rbf', gamma='scale', nu=0.05)
     svm.fit(X)
-    
-    dump(svm, model_path)
-    print(f"[Enroll] MFCC-SVM model saved -> {model_path}")
     return svm
 
+
+def _fit_svm_reduced(X):
+    """
+    _fit_svm's model with its kernel expansion approximated by REDUCED_SET_SIZE
+    RBF centres (a reduced-set SVM): the centres are a k-means codebook of the
+    frames and their weights are the least-squares fit of the full expansion
+    sum(a_i K(x, sv_i)) over the training frames. The intercept and gamma are
+    the full model's, so the boundary and the score scale (and with them
+    verify_svm()'s threshold) stay those of the full SVM, while verification
+    costs k kernel evaluations however much audio was enrolled. Stored as
+    `reduced_set_` = (centres, weights); model_cache exports that instead of
+    the support vectors.
+    """
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.metrics.pairwise import rbf_kernel
+
+    svm = _fit_svm(X)
+    k = min(REDUCED_SET_SIZE, len(X))
+    if len(svm.support_vectors_) <= k:
+        return svm  # already small enough
+    centres = MiniBatchKMeans(n_clusters=k, n_init=3, random_state=0).fit(X).cluster_centers_
+    K = rbf_kernel(X, centres, gamma=svm._gamma)
+    target = svm.score_samples(X)  # the expansion without the intercept
+    ridge = 1e-6 * np.trace(K.T @ K) / k
+    weights = np.linalg.solve(K.T @ K + ridge * np.eye(k), K.T @ target)
+    svm.reduced_set_ = (centres, weights)
+    return svm
+
+
+def _new_gmm(n_frames):
+    from sklearn.mixture import GaussianMixture
+
+    return GaussianMixture(n_components=min(GMM_COMPONENTS, n_frames), covariance_type="diag",
+                           reg_covar=1e-3, max_iter=200, random_state=0)
+
+
+def _fit_gmm(X, clips):
+    gmm = _new_gmm(len(X)).fit(X)
+    gmm.score_calibration_ = _calibrate_gmm(clips)
+    return gmm
+
+
+def _calibrate_gmm(clips):
+    """
+    (offset, scale) mapping mean frame log-likelihood to an SVM-like score.
+    A GMM scores its own training audio far too well, so each clip is scored
+    by a GMM fitted on the others: held-out clips land around +1 and 0 sits
+    one spread below their mean. The spread is the larger of the clip-to-clip
+    std and the std expected from frame noise alone for a clip of typical length.
+    """
+    clips = [c for c in clips if len(c)]
+    if len(clips) < 2:
+        raise ValueError("GMM enrollment needs at least two non-empty samples")
+    held_out, frame_std = [], []
+    for i, clip in enumerate(clips):
+        rest = np.vstack(clips[:i] + clips[i + 1:])
+        ll = _new_gmm(len(rest)).fit(rest).score_samples(clip)
+        held_out.append(ll.mean())
+        frame_std.append(ll.std())
+    n = float(np.mean([len(c) for c in clips]))
+    spread = max(float(np.std(held_out)), float(np.mean(frame_std)) / np.sqrt(n), 1e-3)
+    return float(np.mean(held_out)) - spread, spread
+
+
+def resolve_backend(backend=None) -> str:
+    backend = (backend or os.getenv("AUTH_MODEL_BACKEND", "svm")).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown speaker model backend {backend!r} (expected one of {BACKENDS})")
+    return backend
+
+
+def train_speaker_model(clips, model_path=MODEL_PATH, backend=None, voiced_only=None):
+    """
+    Fit the speaker model on per-clip MFCC frames and publish it: the .joblib
+    (written atomically, the cache may be reading), its .npz companion, and a
+    cache invalidation. voiced_only records how the clips were extracted
+    (default VOICED_ONLY) so verification matches.
+    """
+    backend = resolve_backend(backend)
+    voiced_only = VOICED_ONLY if voiced_only is None else bool(voiced_only)
+    X = np.vstack(clips)
+
+    print(f"Training speaker model ({backend}) on {len(X)} linguistic frames...")
+    if backend == "gmm":
+        model = _fit_gmm(X, clips)
+    elif backend == "svm-reduced":
+        model = _fit_svm_reduced(X)
+    else:
+        model = _fit_svm(X)
+    model.voiced_only_ = voiced_only
+
+    tmp = model_path + ".tmp"
+    with open(tmp, "wb") as f:
+        dump(model, f)
+    os.replace(tmp, model_path)
+    export_compact(model, model_path)
+    speaker_models.invalidate(model_path)
+    return model
+
+
+def enroll_svm(wav_paths, model_path=MODEL_PATH, backend=None):
+    """
+    Enroll the speaker by training a One-Class Support Vector Machine 
+    over all MFCC frames collected across the noise conditions
+    (or one of the constant-cost BACKENDS).
+    For in-memory enrollment while recording, see enrollment.EnrollmentSession.
+    """
+    backend = resolve_backend(backend)
+    voiced_only = VOICED_ONLY
+
+    print(f"Extracting features from {len(wav_paths)} audio samples...")
+    clips = [extract_mfcc_features(*sf.read(p), voiced_only=voiced_only) for p in wav_paths]
+
+    FeatureReservoir(clips, backend=backend, voiced_only=voiced_only).save(model_path)
+    model = train_speaker_model(clips, model_path, backend, voiced_only)
+    print(f"[Enroll] Speaker model ({backend}) saved -> {model_path}")
+    return model
+
 # ---------------- VERIFICATION ----------------
 def verify_svm(sample_wave: np.ndarray, model_path=MODEL_PATH, threshold=0.60):
     """
     Verify the voice using the trained MFCC-SVM. 
     It evaluates the anomaly score for every frame via decision_function.
+    The model comes from the in-memory cache (see model_cache.py); the
+    constant-cost backends score on the same scale, so the threshold holds.
     Return (ok, confidence, threshold)
     """
-    if not os.path.exists(model_path):
-        raise FileNotFoundError(f"No SVM model found at {model_path}")
-
-    model = load(model_path)
-    feats = extract_mfcc_features(sample_wave, SR)
+    model = speaker_models.get(model_path)
+    feats = extract_mfcc_features(sample_wave, SR, voiced_only=model.voiced_only)
     
     if len(feats) == 0:
         return False, 0.0, threshold
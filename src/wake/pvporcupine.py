@@ -1,27 +1,43 @@
 import warnings
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated.*", category=UserWarning)
 
-import struct
 import threading
-import collections
+import time
 from typing import Callable, Optional
 
 import numpy as np
 # import pyaudio
 import pvporcupine
 
+from ..audio.level import level_from_mean_abs, mean_abs
+from ..audio.ring import Int16Ring
 
-def _amp_level_int(samples_int16: bytes) -> int:
-    """Mean absolute amplitude → int 0..100 (boosted for UI)."""
-    f = np.frombuffer(samples_int16, dtype=np.int16).astype(np.float32) / 32768.0
-    amp = float(np.mean(np.abs(f)))  # 0..~1
-    return int(max(0.0, min(1.0, amp * 3.0)) * 100)
+
+def snapshot_float32(ring: Int16Ring, n: int) -> np.ndarray:
+    """
+    The last n ring samples as normalized float32, in time order. The int16 ->
+    float conversion writes straight into the result and is scaled in place,
+    so this is the only copy even when the range wraps around the ring.
+    """
+    out = np.empty(min(n, ring.write_pos, ring.capacity), dtype=np.float32)
+    off = 0
+    for seg in ring.segments(n):
+        out[off:off + len(seg)] = seg
+        off += len(seg)
+    out *= 1.0 / 32768.0
+    return out
 
 
 class WakeWordListener:
     """
     Porcupine-based wake word listener.
     Triggers on_detect() when the keyword is detected. Optional on_level(level 0..100).
+
+    pause()/resume() suspend detection while keeping the Porcupine engine and
+    the audio stream alive (the stream is stopped, so frames are dropped), so
+    handing the mic back after a voice session costs no engine creation or
+    stream open. on_ready(ms) reports the time from start()/resume() to the
+    first frame processed.
     """
 
     def __init__(
@@ -32,6 +48,10 @@ class WakeWordListener:
         keyword_path: Optional[str] = None,       # custom .ppn (not needed now)
         device_index: Optional[int] = None,
         on_level: Optional[Callable[[int], None]] = None,
+        capture=None,                             # shared AudioCaptureService (optional)
+        on_ready: Optional[Callable[[float], None]] = None,
+        sensitivity: Optional[float] = None,      # Porcupine default (0.5) if None
+        stream=None,                              # pre-opened source, e.g. FileAudioSource for replay
     ):
         if not access_key:
             raise ValueError("PORCUPINE_ACCESS_KEY is required for Porcupine.")
@@ -41,37 +61,103 @@ class WakeWordListener:
         self.keyword_path = keyword_path
         self.device_index = device_index
         self.on_level = on_level
+        self.capture = capture
+        self.detect_pos: Optional[int] = None     # shared-ring position of the last detection
+
+        self.on_ready = on_ready
+        self.sensitivity = sensitivity
+        self.stream = stream
+        self.ready_latency_ms: Optional[float] = None
 
         self._stop = threading.Event()
+        self._paused = threading.Event()
+        self._wakeup = threading.Event()          # interrupts the paused wait
+        self._ready_t0: Optional[float] = None
         self._thread: Optional[threading.Thread] = None
 
     def _create_engine(self):
+        extra = {} if self.sensitivity is None else {"sensitivities": [self.sensitivity]}
         try:
             if self.keyword_path:
                 print(f"[Porcupine] Loading keyword file: {self.keyword_path}")
-                return pvporcupine.create(access_key=self.access_key, keyword_paths=[self.keyword_path])
+                return pvporcupine.create(access_key=self.access_key, keyword_paths=[self.keyword_path], **extra)
         except Exception as e:
             print(f"[Porcupine] Failed to load custom keyword: {e}. Falling back to default 'jarvis'.")
         
         if self.keyword:
             try:
-                return pvporcupine.create(access_key=self.access_key, keywords=[self.keyword])
+                return pvporcupine.create(access_key=self.access_key, keywords=[self.keyword], **extra)
             except: pass
 
-        return pvporcupine.create(access_key=self.access_key, keywords=["porcupine"])
+        return pvporcupine.create(access_key=self.access_key, keywords=["porcupine"], **extra)
 
     def start(self):
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        self._paused.clear()
+        self._ready_t0 = time.perf_counter()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._stop.set()
-        if self._thread:
+        self._wakeup.set()
+        if self._thread and self._thread is not threading.current_thread():
             self._thread.join(timeout=1.0)
 
+    def pause(self):
+        """Stop detecting (safe from on_detect); engine and stream stay open."""
+        self._paused.set()
+
+    def resume(self):
+        if not self._paused.is_set():
+            return
+        self._ready_t0 = time.perf_counter()
+        self._paused.clear()
+        self._wakeup.set()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused.is_set()
+
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+
+    def _open_stream(self, sample_rate: int, blocksize: int):
+        """Caller's stream if given, else a shared-capture reader if running, else a private stream."""
+        if self.stream is not None:
+            return self.stream
+        cap = self.capture
+        if cap is not None and cap.running and cap.sample_rate == sample_rate:
+            return cap.subscribe("wake")
+
+        import sounddevice as sd
+        return sd.InputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype='int16',
+            blocksize=blocksize,
+            device=self.device_index
+        )
+
+    def _wait_while_paused(self, stream):
+        try: stream.stop()
+        except Exception: pass
+        while self._paused.is_set() and not self._stop.is_set():
+            self._wakeup.wait(0.25)
+            self._wakeup.clear()
+        if not self._stop.is_set():
+            stream.start()
+
+    def _report_ready(self):
+        self.ready_latency_ms = (time.perf_counter() - self._ready_t0) * 1000
+        self._ready_t0 = None
+        print(f"[MEASURE] Wake ready latency: {self.ready_latency_ms:.1f} ms")
+        if self.on_ready:
+            try: self.on_ready(self.ready_latency_ms)
+            except Exception: pass
 
     def _run(self):
         try:
@@ -80,61 +166,55 @@ class WakeWordListener:
             print("[WAKE] Failed to create Porcupine:", e)
             return
 
-        import sounddevice as sd
-        
         # Porcupine requires raw PCM (int16)
         blocksize = porcupine.frame_length
-        dtype = 'int16'
         
-        # Maintain a rolling buffer of exactly 2.5 seconds of audio
+        # Rolling 2.5s pre-roll in a preallocated ring (whole frames, as before)
         buffer_seconds = 2.5
         max_blocks = int((buffer_seconds * porcupine.sample_rate) / blocksize)
-        audio_buffer = collections.deque(maxlen=max_blocks)
+        ring = Int16Ring(max_blocks * blocksize)
+        scratch = np.empty(blocksize, dtype=np.float32)  # per-frame energy
         
         try:
-            with sd.InputStream(
-                samplerate=porcupine.sample_rate,
-                channels=1,
-                dtype=dtype,
-                blocksize=blocksize,
-                device=self.device_index
-            ) as stream:
+            with self._open_stream(porcupine.sample_rate, blocksize) as stream:
                 
                 while not self._stop.is_set():
+                    if self._paused.is_set():
+                        self._wait_while_paused(stream)
+                        ring.clear()  # pre-roll must not span the pause
+                        continue
+
                     # Read exactly one frame
                     data, overflowed = stream.read(blocksize)
                     if overflowed:
                         # ignore overflow for now
                         pass
                     
-                    # 'data' is a numpy array of shape (512, 1) usually
-                    # flatten it to 1D
-                    pcm = data.flatten()
+                    # 'data' is a numpy array of shape (512, 1) usually;
+                    # take a 1D view (no copy)
+                    pcm = data[:, 0] if data.ndim > 1 else data
                     
                     # Append strictly to our rolling timeframe window
-                    audio_buffer.append(pcm)
+                    ring.write(pcm)
 
                     # update mic level in UI (optional)
                     if self.on_level:
                         try:
-                            # Convert int16 to float level 0..100
-                            # This mimics _amp_level_int but using existing numpy array
-                            f = pcm.astype(np.float32) / 32768.0
-                            amp = float(np.mean(np.abs(f)))
-                            level = int(max(0.0, min(1.0, amp * 3.0)) * 100)
-                            self.on_level(level)
+                            self.on_level(level_from_mean_abs(mean_abs(pcm, scratch)))
                         except Exception:
                             pass
 
                     try:
                         result = porcupine.process(pcm)
+                        if self._ready_t0 is not None:
+                            self._report_ready()
                         if result >= 0:
-                            import time; print("[MEASURE] Wake word detected at:", time.time())
+                            print("[MEASURE] Wake word detected at:", time.time())
+                            self.detect_pos = getattr(stream, "pos", None)
                             
-                            # Wake word detected: Snapshot the rolling buffer
-                            full_audio_int16 = np.concatenate(audio_buffer)
-                            # Convert to normalized float32 format expected by extractors
-                            full_audio_float32 = full_audio_int16.astype(np.float32) / 32768.0
+                            # Wake word detected: snapshot the rolling buffer straight
+                            # into the normalized float32 format expected by extractors
+                            full_audio_float32 = snapshot_float32(ring, ring.capacity)
                             
                             try:
                                 # First, try passing the audio data to the callback
@@ -149,7 +229,10 @@ class WakeWordListener:
                         continue  # Don't kill the listener on transient errors
                         
         except Exception as e:
-            print(f"[WAKE] Stream error (listener DIED): {e}")
+            if self.stream is not None and "Stream is stopped" in str(e):
+                pass  # replayed source ran out
+            else:
+                print(f"[WAKE] Stream error (listener DIED): {e}")
         finally:
             print("[WAKE] Listener thread exiting — mic will go dark.")
             porcupine.delete()